@@ -1,12 +1,21 @@
 """
 Contains the basic boxman DTO contracts and serialization
 """
+import base64
+import binascii
+import os
+import struct
+import sys
 import traceback
+from collections import deque, OrderedDict
+from types import MappingProxyType
 from typing import List
 
 import bpy
+import numpy as np
 from enum import Enum
 import json
+import mmap
 from json import JSONEncoder
 import zlib
 import inspect
@@ -43,25 +52,41 @@ class IStaticDictionaryListable(ABC):
     Useful for static classes that hold constant values
     """
 
-    @classmethod
-    def list_attribute_names(cls) -> list:
+    def __init_subclass__(cls, **kwargs):
         """
-        Lists the names of the fields
+        Caches the listable fields once, the constants of these classes never change after creation
         """
+        super().__init_subclass__(**kwargs)
         attributes = inspect.getmembers(cls,
                                         lambda a: (not (inspect.ismethod(a)) and not (inspect.isroutine(a))))
-        elements = [a[0] for a in attributes if not a[0].startswith("_")]
-        return elements
+        cls._attribute_names = tuple(a[0] for a in attributes if not a[0].startswith("_"))
+        cls._attribute_values = tuple(a[1] for a in attributes if not a[0].startswith("_"))
+        values_by_key = {}
+        for a in cls._attribute_values:
+            if isinstance(a, ValueDescription):
+                values_by_key.setdefault(a.value, a)
+        cls._values_by_key = MappingProxyType(values_by_key)
 
     @classmethod
-    def list_attribute_values(cls) -> list:
+    def list_attribute_names(cls) -> tuple:
+        """
+        Lists the names of the fields
+        """
+        return cls._attribute_names
+
+    @classmethod
+    def list_attribute_values(cls) -> tuple:
         """
         Lists the values of the fields
         """
-        attributes = inspect.getmembers(cls,
-                                        lambda a: (not (inspect.ismethod(a)) and not (inspect.isroutine(a))))
-        elements = [a[1] for a in attributes if not a[0].startswith("_")]
-        return elements
+        return cls._attribute_values
+
+    @classmethod
+    def value_index(cls) -> MappingProxyType:
+        """
+        Gets a read only mapping of the ValueDescription fields by their value property
+        """
+        return cls._values_by_key
 
     @classmethod
     def first_or_default(cls, property_value: str, default: ValueDescription) -> ValueDescription:
@@ -76,23 +101,12 @@ class IStaticDictionaryListable(ABC):
         A ValueDescription item that matches the value argument if its found in the fields of the class or the
         default values otherwise.
         """
-        attributes = cls.list_attribute_values()
-        return next((a for a in attributes if a.value == property_value), default)
+        return cls._values_by_key.get(property_value, default)
 
 
 # endregion
 
 
-# region Encoder
-class BoxmanEncoder(JSONEncoder):
-    """
-    Tells the json serializer how to handle the boxman classes
-    """
-    def default(self, o):
-        return o.__dict__
-
-# endregion
-
 # region Super Basic Exceptions
 # TODO: This region goes in another file
 
@@ -347,6 +361,19 @@ class BoxmanOrientations(IStaticDictionaryListable):
     C: ValueDescription = ValueDescription("C", "Center")
 
 
+# Resolved once at import, the downstream code reads these tuples instead of listing the classes again
+BOXMAN_FILE_TYPES = BoxmanFileTypes.list_attribute_values()
+BOXMAN_PREFIXES = BoxmanPrefixes.list_attribute_values()
+BOXMAN_EXTREMITY_TYPES = BoxmanExtremityTypes.list_attribute_values()
+BOXMAN_JOINT_TYPES = BoxmanJointTypes.list_attribute_values()
+BOXMAN_ORIENTATIONS = BoxmanOrientations.list_attribute_values()
+
+_REVERSED_ORIENTATIONS = {
+    BoxmanOrientations.L.value: BoxmanOrientations.R.value,
+    BoxmanOrientations.R.value: BoxmanOrientations.L.value,
+    BoxmanOrientations.C.value: BoxmanOrientations.C.value
+}
+
 # endregion
 
 
@@ -354,23 +381,60 @@ class BoxmanProperties:
     """
     Properties of a boxman object
     """
-    PROP_IS_BOXMAN: str = "is_boxman"
-    PROP_ORIENTATION: str = "boxman_orientation"
-    PROP_BOXMAN_NAME: str = "boxman_name"
-    PROP_JOINT_TYPE: str = "boxman_jointType"
-    PROP_BOXMAN_DESCRIPTION: str = "boxman_description"
+    PROP_IS_BOXMAN: str = sys.intern("is_boxman")
+    PROP_ORIENTATION: str = sys.intern("boxman_orientation")
+    PROP_BOXMAN_NAME: str = sys.intern("boxman_name")
+    PROP_JOINT_TYPE: str = sys.intern("boxman_jointType")
+    PROP_BOXMAN_DESCRIPTION: str = sys.intern("boxman_description")
+
+    __slots__ = ("_name", "_orientation", "joint_type", "description", "_object_name")
 
     def __init__(self):
-        self.name: str = BoxmanPrefixes.BOXMAN.value
-        self.orientation: str = BoxmanOrientations.C.value
+        self._object_name = None
+        self._name: str = BoxmanPrefixes.BOXMAN.value
+        self._orientation: str = BoxmanOrientations.C.value
         self.joint_type: str = BoxmanJointTypes.DEFAULT.value
         self.description: str = BoxmanPrefixes.BOXMAN.value
 
+    @property
+    def name(self) -> str:
+        """
+        Boxman name of the object
+        """
+        return self._name
+
+    @name.setter
+    def name(self, value: str) -> None:
+        self._name = value
+        self._object_name = None
+
+    @property
+    def orientation(self) -> str:
+        """
+        Orientation of the object, one of the BoxmanOrientations values
+        """
+        return self._orientation
+
+    @orientation.setter
+    def orientation(self, value: str) -> None:
+        self._orientation = value
+        self._object_name = None
+
+    def get_object_name(self) -> str:
+        """
+        Gets the name of the blender object, cached until the name or the orientation change
+        """
+        if self._object_name is None:
+            self._object_name = f"{BoxmanPrefixes.BOXMAN.value}.{self._orientation}.{self._name}"
+        return self._object_name
+
 
 class BoxmanMeshDTO:
     """
     Basic mesh contract form
     """
+    __slots__ = ("location", "scale", "rotations", "vertex_list", "polygon_list", "properties")
+
     def __init__(self):
         self.location = []
         self.scale = []
@@ -389,7 +453,7 @@ class BoxmanMeshDTO:
         """
         Gets the name of the blander object that is linked to the boxman dto instance
         """
-        return f"{BoxmanPrefixes.BOXMAN.value}.{self.properties.orientation}.{self.properties.name}"
+        return self.properties.get_object_name()
 
     @staticmethod
     def get_object_name_from_object(cls, obj):
@@ -409,18 +473,19 @@ class BoxmanMeshDTO:
         The Minify parameter tels if the serialization is indented or not (for readability)
         """
         if not minify:
-            return json.dumps(self, indent=4, cls=BoxmanEncoder)
+            return json.dumps(boxman_to_plain(self), indent=4)
         else:
             return self.__str__()
 
     def __str__(self):
-        return BoxmanEncoder().encode(self)
+        return _COMPACT_ENCODER.encode(boxman_to_plain(self))
 
 
 class BoxmanDTO(BoxmanMeshDTO):
     """
     Main DTO of the addon
     """
+    __slots__ = ("children",)
 
     def __init__(self, mesh_data: BoxmanMeshDTO = None):
         super().__init__()
@@ -444,26 +509,89 @@ class BoxmanDTO(BoxmanMeshDTO):
         """
         Reverses the orientation property of the current instance and all its children
         """
-        # take the target, get the reverse name, check if exist
-        options = {
-            BoxmanOrientations.L.value: BoxmanOrientations.R.value,
-            BoxmanOrientations.R.value: BoxmanOrientations.L.value,
-            BoxmanOrientations.C.value: BoxmanOrientations.C.value
+        pending = deque([self])
+        while pending:
+            current = pending.popleft()
+            current.properties.orientation = _REVERSED_ORIENTATIONS[current.properties.orientation]
+            pending.extend(current.children)
+
+
+def flatten_boxman(boxman: BoxmanMeshDTO) -> tuple:
+    """
+    Flattens a boxman tree in pre order as two parallel lists, the nodes and the index of the parent of each node.
+    The root is the first node and has None as its parent index.
+    """
+    nodes = []
+    parent_indices = []
+    pending = [(boxman, None)]
+    while pending:
+        current, parent_index = pending.pop()
+        index = len(nodes)
+        nodes.append(current)
+        parent_indices.append(parent_index)
+        if isinstance(current, BoxmanDTO):
+            pending.extend((child, index) for child in reversed(current.children))
+    return nodes, parent_indices
+
+
+# region Serialization
+
+# Blender's bundled python does not ship orjson/zstandard, so the C accelerated json and zlib modules are used.
+# A single compact encoder is shared instead of building a new one on every serialization.
+_COMPACT_ENCODER = JSONEncoder(separators=(",", ":"))
+
+
+def boxman_mesh_to_plain(boxman: BoxmanMeshDTO) -> dict:
+    """
+    Gets a single boxman dto as a dictionary of builtin types, without its children
+    """
+    properties = boxman.properties
+    return {
+        "location": boxman.location,
+        "scale": boxman.scale,
+        "rotations": boxman.rotations,
+        "vertex_list": boxman.vertex_list,
+        "polygon_list": boxman.polygon_list,
+        "properties": {
+            "name": properties.name,
+            "orientation": properties.orientation,
+            "joint_type": properties.joint_type,
+            "description": properties.description
         }
+    }
 
-        self.properties.orientation = options[self.properties.orientation]
-        for child in self.children:
-            child.chain_reverse_orientation()
 
+def boxman_to_plain(boxman: BoxmanMeshDTO) -> dict:
+    """
+    Flattens a boxman dto tree into nested builtin dictionaries, which the C json encoder serializes without
+    calling back into python.
+    """
+    ret = boxman_mesh_to_plain(boxman)
+    if not isinstance(boxman, BoxmanDTO):
+        return ret
+
+    pending = [(boxman, ret)]
+    while pending:
+        current, plain = pending.pop()
+        plain_children = plain["children"] = []
+        for child in current.children:
+            plain_child = boxman_mesh_to_plain(child)
+            plain_children.append(plain_child)
+            pending.append((child, plain_child))
+    return ret
+
+# endregion
 
-def load_boxman_mesh_from_object(obj) -> BoxmanMeshDTO:
+
+def load_boxman_mesh_from_object(obj, target: BoxmanMeshDTO = None) -> BoxmanMeshDTO:
     """
     Creates a boxman mesh object from a context object object.
+    If a target dto is given it is filled in place instead of allocating a new mesh dto.
     """
     if obj.get(BoxmanProperties.PROP_IS_BOXMAN) is None:
         raise NotABoxmanException()
 
-    ret = BoxmanMeshDTO()
+    ret = BoxmanMeshDTO() if target is None else target
     ret.properties.name = obj[BoxmanProperties.PROP_BOXMAN_NAME]
     ret.properties.orientation = obj[BoxmanProperties.PROP_ORIENTATION]
     ret.properties.joint_type = obj[BoxmanProperties.PROP_JOINT_TYPE]
@@ -473,21 +601,32 @@ def load_boxman_mesh_from_object(obj) -> BoxmanMeshDTO:
     obj_location = obj.location
     obj_rotation = obj.rotation_euler
     obj_scale = obj.scale
-    obj_data_vertices = obj.data.vertices
-    obj_data_polygons = obj.data.polygons
-
-    ret.location = [obj_location[0], obj_location[1], obj_location[2]]
-    ret.scale = [obj_scale[0], obj_scale[1], obj_scale[2]]
-    ret.rotations = [[obj_rotation.x, obj_rotation.y, obj_rotation.z], obj_rotation.order]
-    ret.vertex_list = []
-    ret.polygon_list = []
-    for vert in obj_data_vertices:
-        ret.vertex_list.append([vert.co[0], vert.co[1], vert.co[2]])
-    for poly in obj_data_polygons:
-        polygon = []
-        for index in poly.vertices:
-            polygon.append(index)
-        ret.polygon_list.append(polygon)
+    obj_data = obj.data
+    obj_data_vertices = obj_data.vertices
+    obj_data_polygons = obj_data.polygons
+    obj_data_loops = obj_data.loops
+
+    ret.location = list(obj_location)
+    ret.scale = list(obj_scale)
+    ret.rotations = [list(obj_rotation), obj_rotation.order]
+
+    # bulk copies of the mesh buffers instead of per element attribute access
+    vertex_count = len(obj_data_vertices)
+    coordinates = np.empty(vertex_count * 3, dtype=np.float32)
+    obj_data_vertices.foreach_get("co", coordinates)
+    ret.vertex_list = coordinates.reshape(vertex_count, 3).tolist()
+
+    polygon_count = len(obj_data_polygons)
+    loop_starts = np.empty(polygon_count, dtype=np.int32)
+    loop_totals = np.empty(polygon_count, dtype=np.int32)
+    obj_data_polygons.foreach_get("loop_start", loop_starts)
+    obj_data_polygons.foreach_get("loop_total", loop_totals)
+    loop_vertices = np.empty(len(obj_data_loops), dtype=np.int32)
+    obj_data_loops.foreach_get("vertex_index", loop_vertices)
+
+    indices = loop_vertices.tolist()
+    ret.polygon_list = [indices[start:start + total]
+                        for start, total in zip(loop_starts.tolist(), loop_totals.tolist())]
 
     return ret
 
@@ -496,17 +635,20 @@ def load_boxman_from_object(obj) -> BoxmanDTO:
     """
     Creates a boxman dto from a context object object.
     """
-    loader = load_boxman_mesh_from_object(obj)
-    ret = BoxmanDTO(loader)
-    if len(obj.children) > 0:
-        for child in obj.children:
-            ret.children.append(load_boxman_from_object(child))
+    ret = load_boxman_mesh_from_object(obj, BoxmanDTO())
+    pending = [(obj, ret)]
+    while pending:
+        current_object, current = pending.pop()
+        for child in current_object.children:
+            child_dto = load_boxman_mesh_from_object(child, BoxmanDTO())
+            current.children.append(child_dto)
+            pending.append((child, child_dto))
     return ret
 
 
-def construct_boxman_from_json(json_object: dict) -> BoxmanDTO:
+def construct_boxman_node_from_json(json_object: dict) -> BoxmanDTO:
     """
-    Creates a boxman dto from a dictionary
+    Creates a single boxman dto from a dictionary, without its children
     """
     ret = BoxmanDTO()
     ret.location = json_object["location"]
@@ -514,18 +656,50 @@ def construct_boxman_from_json(json_object: dict) -> BoxmanDTO:
     ret.rotations = json_object["rotations"]
     ret.vertex_list = json_object["vertex_list"]
     ret.polygon_list = json_object["polygon_list"]
-    ret.properties.name = json_object["properties"]["name"]
-    ret.properties.orientation = json_object["properties"]["orientation"]
-    ret.properties.joint_type = json_object["properties"]["joint_type"]
-    ret.properties.description = json_object["properties"]["description"]
-
-    kids = json_object["children"]
-    ret.children = []
-    for cc in kids:
-        ret.children.append(construct_boxman_from_json(cc))
+    # the parser creates new strings per joint, the repeated ones are interned so they are shared and compared
+    # by identity on the lookups
+    json_properties = json_object["properties"]
+    ret.properties.name = sys.intern(json_properties["name"])
+    ret.properties.orientation = sys.intern(json_properties["orientation"])
+    ret.properties.joint_type = sys.intern(json_properties["joint_type"])
+    ret.properties.description = json_properties["description"]
+    return ret
+
+
+def construct_boxman_from_json(json_object: dict) -> BoxmanDTO:
+    """
+    Creates a boxman dto from a dictionary
+    """
+    ret = construct_boxman_node_from_json(json_object)
+    pending = [(json_object, ret)]
+    while pending:
+        current_json, current = pending.pop()
+        for cc in current_json["children"]:
+            child = construct_boxman_node_from_json(cc)
+            current.children.append(child)
+            pending.append((cc, child))
+    return ret
+
+
+def _boxman_object_hook(json_object: dict):
+    """
+    Turns the boxman dictionaries into dtos while they are parsed. The parser calls it for the innermost
+    dictionaries first, so the children of a node are already dtos when the node is built.
+    """
+    if "vertex_list" not in json_object:
+        return json_object
+    ret = construct_boxman_node_from_json(json_object)
+    ret.children = json_object.get("children", [])
     return ret
 
 
+def loads_boxman(json_text) -> BoxmanDTO:
+    """
+    Creates a boxman dto from its json text or bytes in a single pass, without building the dictionary tree first
+    """
+    return json.loads(json_text, object_hook=_boxman_object_hook)
+
+
 def show_message_box(message="", title="MrBoxman", icon='INFO'):
     """
     Uses the bpy interface to show a popup message
@@ -543,11 +717,26 @@ class StringCompressor:
     """
     This class compresses strings in different formats
     """
+    # Marks the base85 blobs, anything without it is the legacy hex encoding
+    BASE85_PREFIX: str = "b85:"
+    # Interactive saves use the fast level, the size optimized exports the best one
+    FAST_LEVEL: int = 1
+    BEST_LEVEL: int = 9
+    # Whitespace that hand edited legacy hex files can have between the digits
+    _HEX_WHITESPACE: dict = str.maketrans("", "", "\r\n\t ")
+
     @staticmethod
-    def compress(element: str) -> str:
-        """Compresses a string encoding it as UTF-8"""
+    def compress(element: str, level: int = FAST_LEVEL) -> str:
+        """Compresses a string encoding it as UTF-8, the compressed bytes are written as base85 text"""
         a = element.encode("UTF-8")
-        return zlib.compress(a).hex()
+        return StringCompressor.BASE85_PREFIX + base64.b85encode(zlib.compress(a, level)).decode("ascii")
+
+    @staticmethod
+    def decode(element: str) -> bytes:
+        """Gets the compressed bytes from a base85 or a legacy hex text blob"""
+        if element.startswith(StringCompressor.BASE85_PREFIX):
+            return base64.b85decode(element[len(StringCompressor.BASE85_PREFIX):])
+        return binascii.a2b_hex(element.translate(StringCompressor._HEX_WHITESPACE))
 
     @staticmethod
     def decompress(element: bytes) -> str:
@@ -555,45 +744,251 @@ class StringCompressor:
         return zlib.decompress(element).decode("UTF-8")
 
 
+def decode_legacy_template(compressed_template: str) -> dict:
+    """
+    Gets the dictionary of a template stored as its own compressed blob, like the libraries written before the
+    whole library was compressed at once.
+    """
+    return json.loads(StringCompressor.decompress(StringCompressor.decode(compressed_template)))
+
+
 class BoxmanTemplateLibrary:
     """
-    This contains dictionaries of templated names and the compressed string serializations
+    This contains dictionaries of templated names and the template serializations
     """
+    # Header of the libraries written as a single compressed document, older libraries are plain json text
+    FILE_HEADER: bytes = b"BXML\x01"
+    # Header of the libraries written as a sequence of template records, new templates are appended at the end
+    RECORDS_HEADER: bytes = b"BXML\x02"
+    # Amount of decoded templates kept in memory, the least recently inserted ones are dropped first
+    DTO_CACHE_SIZE: int = 16
+
     def __init__(self):
         self.library_name = "template_library"
         self.template_objects: dict = {}
         self.object_descriptions = {}
+        self._dto_cache: OrderedDict = OrderedDict()
+
+    def add_template(self, key: str, template: dict, description: str) -> None:
+        """
+        Adds or replaces a template on the library, dropping any cached dto for its key
+        """
+        self.template_objects[key] = template
+        self.object_descriptions[key] = description
+        self._dto_cache.pop(key, None)
 
     def get_boxman_object(self, key: str) -> BoxmanDTO:
         """
-        Gets a boxman dto from the dictionary
+        Gets a boxman dto from the dictionary. The decoded dto is cached and shared between calls, so it must be
+        treated as read only.
         """
+        cache = self._dto_cache
+        cached = cache.get(key)
+        if cached is not None:
+            cache.move_to_end(key)
+            return cached
+
         if key not in self.template_objects:
             raise NotInLibraryException(key)
 
-        raw_text = self.template_objects[key]
-        json_text = StringCompressor.decompress(bytes.fromhex(raw_text))
-        dd = json.loads(json_text)
-        return construct_boxman_from_json(dd)
+        template = self.template_objects[key]
+        if isinstance(template, bytes):
+            ret = loads_boxman(zlib.decompress(template))
+        elif isinstance(template, str):
+            ret = construct_boxman_from_json(decode_legacy_template(template))
+        else:
+            ret = construct_boxman_from_json(template)
+        cache[key] = ret
+        if len(cache) > self.DTO_CACHE_SIZE:
+            cache.popitem(last=False)
+        return ret
+
+    def get_template(self, key: str) -> dict:
+        """
+        Gets the dictionary of a template, decoding it if it is still compressed
+        """
+        template = self.template_objects[key]
+        if isinstance(template, bytes):
+            return json.loads(zlib.decompress(template))
+        if isinstance(template, str):
+            return decode_legacy_template(template)
+        return template
+
+    def upgrade_legacy_templates(self) -> None:
+        """
+        Replaces the templates that are still legacy compressed blobs with their dictionaries.
+        The compressed bodies read from record libraries are already in their saved form and are kept as they are.
+        """
+        for key, template in self.template_objects.items():
+            if isinstance(template, str):
+                self.template_objects[key] = decode_legacy_template(template)
 
     def serialize(self, minify: bool = True):
         """
         Gets a string representation if the dictionary
         """
         if not minify:
-            return json.dumps(self, indent=4, cls=BoxmanEncoder)
+            return json.dumps(self.to_plain(), indent=4)
         else:
             return self.__str__()
 
+    def to_plain(self) -> dict:
+        """
+        Gets the library as a dictionary of builtin types
+        """
+        return {
+            "library_name": self.library_name,
+            "template_objects": {key: self.get_template(key) for key in self.template_objects},
+            "object_descriptions": self.object_descriptions
+        }
+
     def __str__(self):
-        return BoxmanEncoder().encode(self)
+        return _COMPACT_ENCODER.encode(self.to_plain())
+
+
+# Windows needs the flag to skip the newline translation of the raw descriptors, posix does not have it
+_O_BINARY = getattr(os, "O_BINARY", 0)
+# Size from which the libraries are mapped in memory instead of read whole
+_MMAP_THRESHOLD = 256 * 1024
+
+
+def read_file_bytes(filepath: str) -> bytes:
+    """
+    Reads a whole file straight from its descriptor, without the python file object buffering and decoding layers
+    """
+    fd = os.open(filepath, os.O_RDONLY | _O_BINARY)
+    try:
+        size = os.fstat(fd).st_size
+        chunks = []
+        while True:
+            chunk = os.read(fd, max(size, 65536))
+            if not chunk:
+                break
+            chunks.append(chunk)
+        return b"".join(chunks)
+    finally:
+        os.close(fd)
+
+
+def _write_all(fd: int, data: bytes) -> None:
+    """
+    Writes the whole buffer to a descriptor, os.write is allowed to write only a part of it
+    """
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view):]
+
+
+def write_file_bytes(filepath: str, data: bytes) -> None:
+    """
+    Replaces the content of a file writing straight to its descriptor
+    """
+    fd = os.open(filepath, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | _O_BINARY, 0o644)
+    try:
+        _write_all(fd, data)
+    finally:
+        os.close(fd)
+
+
+# Header of the binary boxman object files, older files are compressed blobs written as text
+OBJECT_FILE_HEADER: bytes = b"BXMO\x01"
+
+
+def save_boxman_object(boxman: BoxmanMeshDTO, filepath: str, level: int = StringCompressor.FAST_LEVEL) -> None:
+    """
+    Writes a boxman object as its compressed json bytes after the binary header
+    """
+    compressed = zlib.compress(boxman.serialize().encode("UTF-8"), level)
+    write_file_bytes(filepath, OBJECT_FILE_HEADER + compressed)
+
+
+def load_boxman_object(filepath: str) -> BoxmanDTO:
+    """
+    Reads a boxman object file, binary or legacy text
+    """
+    data = read_file_bytes(filepath)
+    if data.startswith(OBJECT_FILE_HEADER):
+        json_bytes = zlib.decompress(data[len(OBJECT_FILE_HEADER):])
+    else:
+        json_bytes = zlib.decompress(StringCompressor.decode(data.decode("ascii")))
+    return loads_boxman(json_bytes)
+
+
+# region Library records
+# A record library is the RECORDS_HEADER, the length prefixed library name and then one record per template:
+# the key, description and body lengths followed by the utf-8 key, the utf-8 description and the compressed json body.
+# A template is replaced by appending a new record with its key, the last one is the one that is read.
+
+_NAME_HEAD = struct.Struct("<I")
+_RECORD_HEAD = struct.Struct("<III")
+
+
+def pack_library_record(key: str, template: dict, description: str,
+                        level: int = StringCompressor.FAST_LEVEL) -> bytes:
+    """
+    Gets the bytes of a single template record, a template that is already a compressed body is written as is
+    """
+    key_bytes = key.encode("UTF-8")
+    description_bytes = description.encode("UTF-8")
+    if isinstance(template, bytes):
+        body = template
+    else:
+        body = zlib.compress(_COMPACT_ENCODER.encode(template).encode("UTF-8"), level)
+    return b"".join((_RECORD_HEAD.pack(len(key_bytes), len(description_bytes), len(body)),
+                     key_bytes, description_bytes, body))
+
+
+def iter_library_records(data, offset: int):
+    """
+    Iterates the (key, description, compressed body) records of a library buffer starting at the offset.
+    The bodies are copied out, the view of the buffer is released when the iteration ends or fails so a mapped
+    file can always be closed. A record cut short by an interrupted append ends the iteration, the appends cut
+    such a record off before writing so it can only be the last one.
+    """
+    with memoryview(data) as view:
+        end = len(view)
+        head_size = _RECORD_HEAD.size
+        while offset + head_size <= end:
+            key_len, description_len, body_len = _RECORD_HEAD.unpack_from(view, offset)
+            key_start = offset + head_size
+            description_start = key_start + key_len
+            body_start = description_start + description_len
+            offset = body_start + body_len
+            if offset > end:
+                return
+            yield (str(view[key_start:description_start], "UTF-8"),
+                   str(view[description_start:body_start], "UTF-8"),
+                   view[body_start:offset].tobytes())
+
+
+def _deserialize_record_library(serialized) -> BoxmanTemplateLibrary:
+    """
+    Gets an instance of the library from a record library. Only the index is decoded, the template bodies are
+    kept compressed until they are inserted.
+    """
+    offset = len(BoxmanTemplateLibrary.RECORDS_HEADER)
+    (name_len,) = _NAME_HEAD.unpack_from(serialized, offset)
+    offset += _NAME_HEAD.size
+    ret = BoxmanTemplateLibrary()
+    ret.library_name = str(serialized[offset:offset + name_len], "UTF-8")
+    for key, description, body in iter_library_records(serialized, offset + name_len):
+        ret.template_objects[key] = body
+        ret.object_descriptions[key] = description
+    return ret
+# endregion
 
 
-def deserialize_library(serialized: str) -> BoxmanTemplateLibrary:
+def deserialize_library(serialized) -> BoxmanTemplateLibrary:
     """
-    Gets an instance of the library from a serialized dictionary
+    Gets an instance of the library from a record library, a compressed library or from a legacy json library.
+    The serialized library can be any bytes like buffer, like a mapped file.
     """
-    json_object = json.loads(serialized)
+    header = serialized[:len(BoxmanTemplateLibrary.FILE_HEADER)]
+    if header == BoxmanTemplateLibrary.RECORDS_HEADER:
+        return _deserialize_record_library(serialized)
+    if header == BoxmanTemplateLibrary.FILE_HEADER:
+        serialized = zlib.decompress(memoryview(serialized)[len(BoxmanTemplateLibrary.FILE_HEADER):])
+    json_object = json.loads(bytes(serialized))
     ret = BoxmanTemplateLibrary()
     ret.library_name = json_object["library_name"]
     ret.template_objects = json_object["template_objects"]
@@ -601,12 +996,90 @@ def deserialize_library(serialized: str) -> BoxmanTemplateLibrary:
     return ret
 
 
+def save_library(library: BoxmanTemplateLibrary, filepath: str,
+                 level: int = StringCompressor.FAST_LEVEL) -> None:
+    """
+    Writes the whole library as a record library, one record per template. Replaced templates that were
+    appended to the file are dropped, so this also compacts it.
+    """
+    library.upgrade_legacy_templates()
+    descriptions = library.object_descriptions
+    name = library.library_name.encode("UTF-8")
+    with open(filepath, "wb") as file:
+        file.write(BoxmanTemplateLibrary.RECORDS_HEADER + _NAME_HEAD.pack(len(name)) + name)
+        for key, template in library.template_objects.items():
+            file.write(pack_library_record(key, template, descriptions[key], level))
+
+
+def _find_records_end(fd: int, size: int) -> int:
+    """
+    Gets the end of the last complete record of a record library, only the record heads are read.
+    Returns -1 when the library name itself is cut short.
+    """
+    offset = len(BoxmanTemplateLibrary.RECORDS_HEADER)
+    os.lseek(fd, offset, os.SEEK_SET)
+    name_head = os.read(fd, _NAME_HEAD.size)
+    if len(name_head) < _NAME_HEAD.size:
+        return -1
+    offset += _NAME_HEAD.size + _NAME_HEAD.unpack(name_head)[0]
+    if offset > size:
+        return -1
+
+    head_size = _RECORD_HEAD.size
+    while offset + head_size <= size:
+        os.lseek(fd, offset, os.SEEK_SET)
+        record_end = offset + head_size + sum(_RECORD_HEAD.unpack(os.read(fd, head_size)))
+        if record_end > size:
+            break
+        offset = record_end
+    return offset
+
+
+def append_library_template(filepath: str, key: str, template: dict, description: str,
+                            level: int = StringCompressor.FAST_LEVEL) -> bool:
+    """
+    Adds or replaces a template by appending a single record at the end of a record library, without reading
+    the rest of it. A record cut short by an interrupted append is cut off first, otherwise the new record would
+    be read as its remains.
+    Returns False when the file is an older or broken library, those have to be rewritten whole.
+    """
+    header = BoxmanTemplateLibrary.RECORDS_HEADER
+    fd = os.open(filepath, os.O_RDWR | os.O_APPEND | _O_BINARY)
+    try:
+        if os.read(fd, len(header)) != header:
+            return False
+        size = os.fstat(fd).st_size
+        records_end = _find_records_end(fd, size)
+        if records_end < 0:
+            return False
+        if records_end < size:
+            os.ftruncate(fd, records_end)
+        _write_all(fd, pack_library_record(key, template, description, level))
+        return True
+    finally:
+        os.close(fd)
+
+
+def load_library(filepath: str) -> BoxmanTemplateLibrary:
+    """
+    Reads a library file, a record library, a compressed library or a legacy json one.
+    The big files are mapped instead of read, the records only copy the template bodies out of the mapping.
+    """
+    if os.path.getsize(filepath) <= _MMAP_THRESHOLD:
+        return deserialize_library(read_file_bytes(filepath))
+    with open(filepath, "rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        return deserialize_library(mapped)
+
+
 def standard_except_operation(ex: Exception):
     """
     Used to show the error message on cached exceptions.
+    The traceback is only formatted when blender runs in debug mode, the exception is raised again anyway.
     """
-    print("Execution failed!")
-    traceback.print_exc()
-    print(ex)
-    show_message_box(ex.__str__(), "Cached exception", "ERROR")
+    message = str(ex)
+    if bpy.app.debug:
+        sys.stderr.write(f"Execution failed!\n{traceback.format_exc()}")
+    else:
+        sys.stderr.write(f"Execution failed! {message}\n")
+    show_message_box(message, "Cached exception", "ERROR")
     raise ex
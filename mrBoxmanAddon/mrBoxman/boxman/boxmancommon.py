@@ -1,33 +1,75 @@
 """
 These are the methods an utilities that appear in the whole addon
 """
+import logging
 import bpy
 import os
+from itertools import chain
+import numpy as np
 from bpy_extras.object_utils import AddObjectHelper, object_data_add
-from mathutils import Euler
 
-from .boxmanclasses import BoxmanProperties, BoxmanMeshDTO, BoxmanDTO, NotABoxmanException
+from .boxmanclasses import BoxmanProperties, BoxmanMeshDTO, BoxmanDTO, NotABoxmanException, flatten_boxman, \
+    load_boxman_mesh_from_object
 
 # import sys
 # sys.modules["boxmanclasses"] = bpy.data.texts["boxmanclasses.py"].as_module()
 # from boxmanclasses import *
 
+logger = logging.getLogger(__name__)
+
+_PROP_IS_BOXMAN = BoxmanProperties.PROP_IS_BOXMAN
+_PROP_ORIENTATION = BoxmanProperties.PROP_ORIENTATION
+_PROP_BOXMAN_NAME = BoxmanProperties.PROP_BOXMAN_NAME
+_PROP_JOINT_TYPE = BoxmanProperties.PROP_JOINT_TYPE
+_PROP_BOXMAN_DESCRIPTION = BoxmanProperties.PROP_BOXMAN_DESCRIPTION
+
 
 # region mesh functions
+def fill_mesh(mesh, vertices, faces=None, edges=None) -> None:
+    """
+    Fills an empty mesh with bulk buffer copies. It is the same as mesh.from_pydata, but the data is handed to
+    blender as contiguous numpy buffers instead of being marshaled one python element at a time.
+    The vertices and the fixed size faces can also be numpy arrays.
+    """
+    vertex_buffer = np.asarray(vertices, dtype=np.float32).reshape(-1)
+    mesh.vertices.add(len(vertex_buffer) // 3)
+    mesh.vertices.foreach_set("co", vertex_buffer)
+
+    has_edges = edges is not None and len(edges) > 0
+    if has_edges:
+        edge_buffer = np.asarray(edges, dtype=np.int32).reshape(-1)
+        mesh.edges.add(len(edge_buffer) // 2)
+        mesh.edges.foreach_set("vertices", edge_buffer)
+
+    has_faces = faces is not None and len(faces) > 0
+    if has_faces:
+        if isinstance(faces, np.ndarray):
+            loop_vertices = faces.astype(np.int32, copy=False).reshape(-1)
+            loop_totals = np.full(len(faces), faces.shape[1], dtype=np.int32)
+        else:
+            loop_totals = np.fromiter(map(len, faces), dtype=np.int32, count=len(faces))
+            loop_vertices = np.fromiter(chain.from_iterable(faces), dtype=np.int32, count=int(loop_totals.sum()))
+        loop_starts = np.zeros(len(loop_totals), dtype=np.int32)
+        np.cumsum(loop_totals[:-1], out=loop_starts[1:])
+
+        mesh.loops.add(len(loop_vertices))
+        mesh.polygons.add(len(loop_totals))
+        mesh.loops.foreach_set("vertex_index", loop_vertices)
+        mesh.polygons.foreach_set("loop_start", loop_starts)
+        # newer blender versions derive the totals from the starts
+        if not bpy.types.MeshPolygon.bl_rna.properties["loop_total"].is_readonly:
+            mesh.polygons.foreach_set("loop_total", loop_totals)
+
+    if has_edges or has_faces:
+        mesh.update(calc_edges=has_faces, calc_edges_loose=has_edges)
+
+
 def add_mesh(context, name: str, vertices, faces=None, edges=None):
     """
     Adds a mesh to the context using the vertex and polygon information available in a BoxmanMeshDTO.
     """
-    target_faces = faces
-    target_edges = edges
-    if faces is None:
-        target_faces = []
-
-    if edges is None:
-        target_edges = []
-
     mesh = bpy.data.meshes.new(name)
-    mesh.from_pydata(vertices, target_edges, target_faces)
+    fill_mesh(mesh, vertices, faces, edges)
     return object_data_add(context, mesh)
 
 
@@ -35,54 +77,79 @@ def add_property_to_object(target_object, properties: BoxmanProperties) -> None:
     """
     Adds the boxman markers to a mesh object.
     """
-    target_object[BoxmanProperties.PROP_IS_BOXMAN] = True
-    target_object[BoxmanProperties.PROP_ORIENTATION] = properties.orientation
-    target_object[BoxmanProperties.PROP_BOXMAN_NAME] = properties.name
-    target_object[BoxmanProperties.PROP_JOINT_TYPE] = properties.joint_type
-    target_object[BoxmanProperties.PROP_BOXMAN_DESCRIPTION] = properties.description
+    target_object[_PROP_IS_BOXMAN] = True
+    target_object[_PROP_ORIENTATION] = properties.orientation
+    target_object[_PROP_BOXMAN_NAME] = properties.name
+    target_object[_PROP_JOINT_TYPE] = properties.joint_type
+    target_object[_PROP_BOXMAN_DESCRIPTION] = properties.description
 
 
 def replace_boxman(target_object, boxman: BoxmanMeshDTO):
     """
     replaces a mesh with the data ob a boxman mesh.
     """
-    if target_object.get(BoxmanProperties.PROP_IS_BOXMAN) is None:
+    if target_object.get(_PROP_IS_BOXMAN) is None:
         raise NotABoxmanException()
 
-    if boxman.properties.orientation != target_object.get(BoxmanProperties.PROP_ORIENTATION):
+    if boxman.properties.orientation != target_object.get(_PROP_ORIENTATION):
         raise OrientationNotMatchException()
 
     mesh = bpy.data.meshes.new(boxman.get_object_name())
-    mesh.from_pydata(boxman.vertex_list, [], boxman.polygon_list)
+    fill_mesh(mesh, boxman.vertex_list, boxman.polygon_list)
     target_object.data = mesh
     return target_object
 
 
+def select_only(context, objects) -> None:
+    """
+    Leaves selected only the given objects. The objects have no bulk select property to write with a foreach_set,
+    so the current selection is diffed and only the objects whose state changes are touched.
+    """
+    targets = set(objects)
+    selected = set(context.selected_objects)
+    for obj in selected - targets:
+        obj.select_set(False)
+    for obj in targets - selected:
+        obj.select_set(True)
+
+
 def apply_parenting_array(context, parenting_array: list):
     """
     Applies an object parenting to an array of parent/child object pointers.
+    The relation is assigned directly, the same as the parent_set operator without keeping the transforms does.
     """
-    for element in parenting_array:
-        parent_object = element[0]
-        child_object = element[1]
-        bpy.ops.object.select_all(action='DESELECT')
-        context.view_layer.objects.active = None
-        context.view_layer.objects.active = parent_object
-        child_object.select_set(True)
-        parent_object.select_set(True)
-        bpy.ops.object.parent_set(type='OBJECT')
-        context.view_layer.objects.active = None
-        child_object.select_set(False)
-        parent_object.select_set(False)
+    view_layer = context.view_layer
+    # the world matrices of the freshly inserted or modified objects must be evaluated before using them
+    view_layer.update()
+    for parent_object, child_object in parenting_array:
+        child_object.parent = parent_object
+        child_object.matrix_parent_inverse = parent_object.matrix_world.inverted()
+    view_layer.update()
 
 
-def force_parent_reset(context, selected_object) -> None:
+def force_parent_reset(context, selected_object) -> list:
     """
     Takes an abject, clears the parent transformations to apply them and then reapplies parenting relations.
+    Returns the parent/child pairs of the chain, in pre order.
     """
     parenting_array = []  # this holds the parent/child pairs that I will need
     clear_parenting(context, selected_object, parenting_array)
     apply_parenting_array(context, parenting_array)
+    return parenting_array
+
+
+def load_boxman_with_reset(context, selected_object) -> BoxmanDTO:
+    """
+    Resets the parenting transformations of a chain and loads it as a boxman. The tree is taken from the pairs
+    collected by the reset walk, so the object children are not walked a second time.
+    """
+    parenting_array = force_parent_reset(context, selected_object)
+    ret = load_boxman_mesh_from_object(selected_object, BoxmanDTO())
+    loaded = {selected_object: ret}
+    for parent_object, child_object in parenting_array:
+        child = loaded[child_object] = load_boxman_mesh_from_object(child_object, BoxmanDTO())
+        loaded[parent_object].children.append(child)
+    return ret
 
 
 def clear_parenting(context, target_object, parenting_array) -> None:
@@ -90,44 +157,59 @@ def clear_parenting(context, target_object, parenting_array) -> None:
     Clears the parent relation of an object chain and applies the keep transform.
     The resulting objects are kept in a parenting array.
     """
-    if target_object.parent is not None:
-        # If its not a root I need to de-parent and keep.
-        bpy.ops.object.select_all(action='DESELECT')
-        target_object.select_set(True)
-        context.view_layer.objects.active = target_object
-        bpy.ops.object.transform_apply(location=False, rotation=False, scale=True)
-        bpy.ops.object.parent_clear(type='CLEAR_KEEP_TRANSFORM')
-        target_object.select_set(False)
-        context.view_layer.objects.active = None
-
-    for child in target_object.children:
-        clear_parenting(context, child, parenting_array)
-        parenting_array.append([target_object, child])
+    to_clear = []  # If its not a root I need to de-parent and keep.
+    pending = [target_object]
+    while pending:
+        current = pending.pop()
+        if current.parent is not None:
+            to_clear.append(current)
+
+        children = current.children
+        parenting_array.extend((current, child) for child in children)
+        pending.extend(reversed(children))
+
+    if not to_clear:
+        return
+
+    transform_apply = bpy.ops.object.transform_apply
+    parent_clear = bpy.ops.object.parent_clear
+    if hasattr(context, "temp_override"):
+        # blender 3.2+, the operators get the objects without touching the scene selection
+        with context.temp_override(active_object=to_clear[0], object=to_clear[0], selected_objects=to_clear,
+                                   selected_editable_objects=to_clear):
+            transform_apply(location=False, rotation=False, scale=True)
+            parent_clear(type='CLEAR_KEEP_TRANSFORM')
+    else:
+        view_layer_objects = context.view_layer.objects
+        select_only(context, to_clear)
+        view_layer_objects.active = to_clear[0]
+        transform_apply(location=False, rotation=False, scale=True)
+        parent_clear(type='CLEAR_KEEP_TRANSFORM')
+        select_only(context, ())
+        view_layer_objects.active = None
 
 
 def insert_boxman(context, parenting_array, boxman: BoxmanMeshDTO):
     """
     Insert a selected boxman object.
     """
-    print(f"Inserting {boxman.properties.name}")
-    ret = add_mesh(context, boxman.get_object_name(), vertices=boxman.vertex_list, faces=boxman.polygon_list)
-    add_property_to_object(ret, boxman.properties)
+    logger.debug("Inserting %s", boxman.properties.name)
+    nodes, parent_indices = flatten_boxman(boxman)
+    created = [None] * len(nodes)
+    for index, current in enumerate(nodes):
+        inserted = add_mesh(context, current.get_object_name(), vertices=current.vertex_list,
+                            faces=current.polygon_list)
+        add_property_to_object(inserted, current.properties)
 
-    ret.location.x = boxman.location[0]
-    ret.location.y = boxman.location[1]
-    ret.location.z = boxman.location[2]
+        inserted.location = current.location
+        inserted.rotation_euler = current.rotations[0]
+        inserted.scale = current.scale
 
-    if isinstance(boxman, BoxmanDTO):
-        for child in boxman.children:
-            child_object = insert_boxman(context, parenting_array, child)
-            parenting_array.append([ret, child_object])
+        created[index] = inserted
 
-    ret.rotation_euler = Euler((boxman.rotations[0][0],
-                                boxman.rotations[0][1],
-                                boxman.rotations[0][2]),
-                               boxman.rotations[1])
-    ret.scale = boxman.scale
-    return ret
+    # every node but the root is paired with its parent, in the same pre order
+    parenting_array.extend(zip(map(created.__getitem__, parent_indices[1:]), created[1:]))
+    return created[0]
 # endregion
 
 # region Exceptions
@@ -223,12 +305,20 @@ def check_file_name_extension(file_path: str, desired: str) -> str:
     Checks if the file extension matches a desired form and returns the flat filename.
     """
     head, tail = os.path.split(file_path)
-    if tail.split(".")[-1] != desired:
+    if os.path.splitext(tail)[1][1:].lower() != desired.lower():
         raise WrongFileNameException()
 
     return tail
 
 
+def check_file_extension(file_path: str, desired: str) -> None:
+    """
+    Checks if the file extension matches a desired form, for the callers that do not need the filename.
+    """
+    if not file_path.lower().endswith("." + desired.lower()):
+        raise WrongFileNameException()
+
+
 def check_for_object_mode(context) -> None:
     """
     If an object is selected, it checks that the operation mode is object mode.
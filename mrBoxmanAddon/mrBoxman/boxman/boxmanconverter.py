@@ -1,17 +1,19 @@
 """
 add custom properties to selected
 """
+import logging
 import bpy
+import bmesh
 import numpy as np
 import math
 from bpy.types import Operator
 from bpy.types import Panel
-from mathutils import Euler
 
 from .boxmanclasses import BoxmanPrefixes, BoxmanProperties, BoxmanOrientations, BoxmanDTO, BoxmanJointTypes, \
-     NotABoxmanException, standard_except_operation, load_boxman_from_object, show_message_box
+     NotABoxmanException, standard_except_operation, show_message_box, flatten_boxman
 from .boxmancommon import BoxmanNamingException, add_mesh, add_property_to_object, apply_parenting_array, \
-     check_for_object_mode, check_selected_object, force_parent_reset, ObjectIsNotRootException
+     check_for_object_mode, check_selected_object, force_parent_reset, ObjectIsNotRootException, select_only, \
+     load_boxman_with_reset
 
 # import sys
 # sys.modules["boxmanclasses"] = bpy.data.texts["boxmanclasses.py"].as_module()
@@ -19,15 +21,40 @@ from .boxmancommon import BoxmanNamingException, add_mesh, add_property_to_objec
 # from boxmanclasses import *
 # from boxmancommon import *
 
+logger = logging.getLogger(__name__)
 
-def find_root_mesh(context, target_object):
+_PROP_ORIENTATION = BoxmanProperties.PROP_ORIENTATION
+_PROP_JOINT_TYPE = BoxmanProperties.PROP_JOINT_TYPE
+_PROP_BOXMAN_DESCRIPTION = BoxmanProperties.PROP_BOXMAN_DESCRIPTION
+_ORIENT_NAMES = frozenset(BoxmanOrientations.list_attribute_names())
+
+
+def mirror_mesh_data(vertex_list, polygon_list):
     """
-    Checks the parenting chain and returns the absolute root of the target object
+    Gets the mirrored vertices and the polygons with their winding reversed, so the normals of the mirrored
+    mesh keep pointing outwards.
     """
-    if target_object.parent is None:
-        return target_object
+    # the conversion already copies the data, so the Y axis is negated in place on that buffer
+    vertices = np.array(vertex_list, dtype=np.float32).reshape(-1, 3)
+    vertices[:, 1] *= -1.0
+    if len({len(polygon) for polygon in polygon_list}) == 1:
+        # fixed size polygons, reversed as a single strided view
+        polygons = np.asarray(polygon_list, dtype=np.int32)[:, ::-1]
     else:
-        return find_root_mesh(context, target_object.parent)
+        polygons = [polygon[::-1] for polygon in polygon_list]
+    return vertices, polygons
+
+
+def find_root_mesh(context, target_object):
+    """
+    Checks the parenting chain and returns the absolute root of the target object.
+    Not cached, the parents can be changed by hand or by an undo at any moment.
+    """
+    parent = target_object.parent
+    while parent is not None:
+        target_object = parent
+        parent = target_object.parent
+    return target_object
 
 
 def mirror_from_center(context, target_object):
@@ -35,52 +62,43 @@ def mirror_from_center(context, target_object):
     Mirrors the selected mesh, Center oriented not extends to the children, unless the children are also
     center oriented.
     """
-    obj_parent = target_object
-    obj_parent.select_set(True)
-    context.view_layer.objects.active = obj_parent
-    bpy.ops.object.mode_set(mode="EDIT")
-    bpy.ops.mesh.select_all(action='SELECT')
-    bpy.ops.mesh.symmetrize(direction="POSITIVE_Y")
-    bpy.ops.object.mode_set(mode="OBJECT")
-    obj_parent.select_set(False)
-    context.view_layer.objects.active = None
-
-    # Mirrors the centered chains
-    if len(obj_parent.children) > 0:
-        for child in obj_parent.children:
-            if child[BoxmanProperties.PROP_ORIENTATION] == BoxmanOrientations.C:
-                mirror_from_center(context, child)
+    pending = [target_object]
+    while pending:
+        obj_parent = pending.pop()
+        # symmetrized straight on the mesh data, without going through edit mode
+        mesh = obj_parent.data
+        bm = bmesh.new()
+        bm.from_mesh(mesh)
+        bmesh.ops.symmetrize(bm, input=bm.verts[:] + bm.edges[:] + bm.faces[:], direction='Y', dist=1e-4)
+        bm.to_mesh(mesh)
+        bm.free()
+        mesh.update()
+
+        # Mirrors the centered chains
+        pending.extend(child for child in reversed(obj_parent.children)
+                       if child[_PROP_ORIENTATION] == BoxmanOrientations.C)
 
 
 def mirror_on_axis(context, parenting_chain, target: BoxmanDTO):
     """
-    Mirrors a boxman chain by recursive duplication.
+    Mirrors a boxman chain by duplication.
     """
-    mirror_vertex = []
-    for vert in target.vertex_list:
-        mirror_vertex.append((vert[0], -vert[1], vert[2]))
-    for polygon in target.polygon_list:
-        polygon.reverse()  # This is needed for the polygon orientations
-
-    ret = add_mesh(context, target.get_object_name(), mirror_vertex, target.polygon_list)
-    ret.location.x = target.location[0]
-    ret.location.y = -target.location[1]
-    ret.location.z = target.location[2]
-
-    for child in target.children:
-        cc = mirror_on_axis(context, parenting_chain, child)
-        parenting_chain.append([ret, cc])
-
-    ret.rotation_euler = Euler((target.rotations[0][0],
-                                target.rotations[0][1],
-                                target.rotations[0][2]),
-                               target.rotations[1])
-    ret.scale = target.scale
-    ret.rotation_euler.x = -ret.rotation_euler.x
-    ret.rotation_euler.z = -ret.rotation_euler.z
-
-    add_property_to_object(ret, target.properties)
-    return ret
+    nodes, parent_indices = flatten_boxman(target)
+    created = [None] * len(nodes)
+    for index, current in enumerate(nodes):
+        mirror_vertex, mirror_polygons = mirror_mesh_data(current.vertex_list, current.polygon_list)
+        mirrored = add_mesh(context, current.get_object_name(), mirror_vertex, mirror_polygons)
+        location = current.location
+        rotation = current.rotations[0]
+        mirrored.location = (location[0], -location[1], location[2])
+        mirrored.rotation_euler = (-rotation[0], rotation[1], -rotation[2])
+        mirrored.scale = current.scale
+        add_property_to_object(mirrored, current.properties)
+
+        created[index] = mirrored
+
+    parenting_chain.extend(zip(map(created.__getitem__, parent_indices[1:]), created[1:]))
+    return created[0]
 
 
 def mirror_boxman(context, selected_object, target: BoxmanDTO):
@@ -105,20 +123,22 @@ def object_name_to_property(target_object) -> BoxmanProperties:
     if naming[0] != BoxmanPrefixes.BOXMAN.value:
         raise BoxmanNamingException(target_object.name)
 
-    if naming[1] not in BoxmanOrientations.list_attribute_names():
+    if naming[1] not in _ORIENT_NAMES:
         raise BoxmanNamingException(target_object.name)
 
     ret = BoxmanProperties()
     ret.name = ".".join(naming[2:])
     ret.orientation = naming[1]
 
-    if BoxmanProperties.PROP_BOXMAN_DESCRIPTION in target_object.keys():
-        ret.description = target_object[BoxmanProperties.PROP_BOXMAN_DESCRIPTION]
+    description = target_object.get(_PROP_BOXMAN_DESCRIPTION)
+    if description is not None:
+        ret.description = description
     else:
         ret.description = ret.name
 
-    if BoxmanProperties.PROP_JOINT_TYPE in target_object.keys(): # If it has a type, it leaves it
-        ret.joint_type = target_object[BoxmanProperties.PROP_JOINT_TYPE]
+    joint_type = target_object.get(_PROP_JOINT_TYPE)
+    if joint_type is not None:  # If it has a type, it leaves it
+        ret.joint_type = joint_type
 
     return ret
 
@@ -127,25 +147,30 @@ def convert_object_to_boxman(context, target_object, is_joint_root=True) -> None
     """
     Adds boxman compatible properties to an object.
     """
-    if target_object.type == "MESH":
-        props = object_name_to_property(target_object)
-        if is_joint_root: # overrides the joint type for the root
+    pending = [(target_object, is_joint_root)]
+    while pending:
+        current, is_current_root = pending.pop()
+        if current.type != "MESH":
+            raise NotABoxmanException()
+
+        props = object_name_to_property(current)
+        if is_current_root:  # overrides the joint type for the root
             props.joint_type = BoxmanJointTypes.OBJECT_ROOT.value
 
-        add_property_to_object(target_object, props)
-        for child in target_object.children:
-            convert_object_to_boxman(context, child, False)
-    else:
-        raise NotABoxmanException()
+        add_property_to_object(current, props)
+        pending.extend((child, False) for child in reversed(current.children))
 
 
 def fill_children_array(selected_object, children_array):
     """
     Used to flatten the tree of objects
     """
-    for child in selected_object.children:
-        fill_children_array(child, children_array)
-        children_array.append(child)
+    append = children_array.append
+    pending = list(selected_object.children)
+    while pending:
+        child = pending.pop()
+        append(child)
+        pending.extend(child.children)
 
 
 def select_all_for(context) -> None:
@@ -153,25 +178,18 @@ def select_all_for(context) -> None:
     Selects all the linked elements to a boxman mesh.
     """
     try:
-        print("Selecting all connected...")
+        logger.debug("Selecting all connected...")
 
         check_for_object_mode(context)
         selected_object = check_selected_object(context)
         ret = find_root_mesh(context, selected_object)
-        bpy.ops.object.select_all(action='DESELECT')
-        ret.select_set(True)
+        children_array = [ret]
+        fill_children_array(ret, children_array)
+        select_only(context, children_array)
         context.view_layer.objects.active = ret
 
-        # now, the root is selected!
-        selected_root = check_selected_object(context)
-        children_array = [selected_root]
-        fill_children_array(selected_root, children_array)
-        bpy.ops.object.select_all(action='DESELECT')
-        for child in children_array:
-            child.select_set(True)
-
         show_message_box("All selected!!")
-        print("Selected!")
+        logger.debug("Selected!")
     except Exception as ex:
         standard_except_operation(ex)
 
@@ -181,16 +199,15 @@ def select_root_for(context) -> None:
     Selects the root boxman mesh.
     """
     try:
-        print("Selecting root connected...")
+        logger.debug("Selecting root connected...")
 
         check_for_object_mode(context)
         selected_object = check_selected_object(context)
         ret = find_root_mesh(context, selected_object)
-        bpy.ops.object.select_all(action='DESELECT')
-        ret.select_set(True)
+        select_only(context, [ret])
         context.view_layer.objects.active = ret
         show_message_box("Root selected!!")
-        print("Selected!")
+        logger.debug("Selected!")
     except Exception as ex:
         standard_except_operation(ex)
 
@@ -200,18 +217,17 @@ def chain_delete_selected(context) -> None:
     Resets the parenting transformations, loads a boxman, mirrors it, and then inserts it.
     """
     try:
-        print("Deleting chain...")
+        logger.debug("Deleting chain...")
         check_for_object_mode(context)
         selected_object = check_selected_object(context)
         children_array = [selected_object]
         fill_children_array(selected_object, children_array)
-        bpy.ops.object.select_all(action='DESELECT')
-        for child in children_array:
-            child.select_set(True)
+        # removed through the data api, leaves first, without going through the selection and the delete operator
+        remove = bpy.data.objects.remove
+        for child in reversed(children_array):
+            remove(child, do_unlink=True)
 
-        bpy.ops.object.delete(use_global=False, confirm=True)
-
-        print("Chain deleted!")
+        logger.debug("Chain deleted!")
     except Exception as ex:
         standard_except_operation(ex)
 
@@ -221,14 +237,13 @@ def mirror_boxman_operation(context) -> None:
     Resets the parenting transformations, loads a boxman, mirrors it, and then inserts it.
     """
     try:
-        print("Resetting transformations...")
+        logger.debug("Resetting transformations...")
         check_for_object_mode(context)
         selected_object = check_selected_object(context)
-        print("Operating over: " + selected_object.name)
-        force_parent_reset(context, selected_object)
-        print("Loading boxman...")
-        to_mirror = load_boxman_from_object(selected_object)
-        print("Mirroring boxman...")
+        logger.debug("Operating over: %s", selected_object.name)
+        logger.debug("Loading boxman...")
+        to_mirror = load_boxman_with_reset(context, selected_object)
+        logger.debug("Mirroring boxman...")
         mirror_boxman(context, selected_object, to_mirror)
 
         show_message_box("Mirrored boxman!")
@@ -241,13 +256,13 @@ def force_reset_transforms(context) -> None:
     Converts the selected mesh chain to have the boxman properties it needs to operate
     """
     try:
-        print("Resetting transformations...")
+        logger.debug("Resetting transformations...")
         check_for_object_mode(context)
         selected_object = check_selected_object(context)
-        print("Operating over: " + selected_object.name)
+        logger.debug("Operating over: %s", selected_object.name)
         force_parent_reset(context, selected_object)
         show_message_box("Transformations resetted!")
-        print("Converted!")
+        logger.debug("Converted!")
     except Exception as ex:
         standard_except_operation(ex)
 
@@ -257,13 +272,13 @@ def convert_selected_to_boxman(context) -> None:
     Converts the selected mesh chain to have the boxman properties it needs to operate
     """
     try:
-        print("Converting to boxman...")
+        logger.debug("Converting to boxman...")
         check_for_object_mode(context)
         selected_object = check_selected_object(context)
-        print("Operating over: " + selected_object.name)
+        logger.debug("Operating over: %s", selected_object.name)
         convert_object_to_boxman(context, selected_object)
         show_message_box("Converted to boxman object!")
-        print("Converted!")
+        logger.debug("Converted!")
     except Exception as ex:
         standard_except_operation(ex)
 
@@ -399,16 +414,7 @@ classes = [MRBOXMAN_OT_ChainDeleteOperator,
            ]
 
 
-# noinspection PyMissingOrEmptyDocstring
-def register():
-    for cls in classes:
-        bpy.utils.register_class(cls)
-
-
-# noinspection PyMissingOrEmptyDocstring
-def unregister():
-    for cls in classes:
-        bpy.utils.unregister_class(cls)
+register, unregister = bpy.utils.register_classes_factory(classes)
 
 
 if __name__ == "__main__":
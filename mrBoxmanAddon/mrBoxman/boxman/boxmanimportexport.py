@@ -1,20 +1,19 @@
 """
 This exports a boxman object
 """
-import json
-
 import bpy
 from bpy.types import Operator
 from bpy.types import Panel
 from bpy_extras.io_utils import ExportHelper, ImportHelper
-from bpy.props import StringProperty
+from bpy.props import StringProperty, BoolProperty
 import os
 
-from .boxmanclasses import BoxmanFileTypes, load_boxman_from_object, StringCompressor, BoxmanTemplateLibrary, \
-    deserialize_library, show_message_box, standard_except_operation, load_boxman_mesh_from_object, BoxmanPrefixes, \
-    IStaticDictionaryListable, construct_boxman_from_json
-from .boxmancommon import check_for_object_mode, check_selected_object, force_parent_reset, ObjectIsNotRootException, \
-    check_file_name_extension, NameCantBeEmptyException, insert_boxman, apply_parenting_array
+from .boxmanclasses import BoxmanFileTypes, StringCompressor, BoxmanTemplateLibrary, show_message_box, \
+    standard_except_operation, load_boxman_mesh_from_object, BoxmanPrefixes, IStaticDictionaryListable, \
+    boxman_to_plain, save_library, load_library, save_boxman_object, load_boxman_object, append_library_template
+from .boxmancommon import check_for_object_mode, check_selected_object, ObjectIsNotRootException, \
+    check_file_name_extension, check_file_extension, NameCantBeEmptyException, insert_boxman, apply_parenting_array, \
+    select_only, load_boxman_with_reset
 
 
 # import sys
@@ -43,9 +42,11 @@ def initialize_description_input() -> None:
     return
 
 
-def export_selected_boxman(context, filepath: str, export_to_library: bool = False) -> None:
+def export_selected_boxman(context, filepath: str, export_to_library: bool = False,
+                           compression_level: int = StringCompressor.FAST_LEVEL, compact: bool = False) -> None:
     """
     Exports the selected boxman object as a template.
+    Templates are appended to existing libraries unless a compact rewrite of the whole library is requested.
     """
     try:
         print("Exporting...")
@@ -53,8 +54,7 @@ def export_selected_boxman(context, filepath: str, export_to_library: bool = Fal
         selected_object = check_selected_object(context)
         print("Operating over : " + selected_object.name)
         print("Forcing parent reset...")
-        force_parent_reset(context, selected_object)
-        to_export = load_boxman_from_object(selected_object)
+        to_export = load_boxman_with_reset(context, selected_object)
         export_name = context.scene[BoxmanExportPanelVariables.BOXMAN_EXPORT_NAME]
         if not bool(export_name.strip()):
             NameCantBeEmptyException(BoxmanExportPanelVariables.BOXMAN_EXPORT_NAME)
@@ -62,38 +62,31 @@ def export_selected_boxman(context, filepath: str, export_to_library: bool = Fal
         to_export.properties.description = export_name
 
         # the export roots are all at 0 location
-        bpy.ops.object.select_all(action='DESELECT')
+        select_only(context, ())
         context.view_layer.objects.active = None
 
         if not export_to_library:
             print("Exporting to file!")
-            tail = check_file_name_extension(filepath, BoxmanFileTypes.BOXMAN_OBJECT_TYPE.value)
-            file = open(filepath, 'w', encoding='utf-8')
-            to_compress = to_export.serialize()
-            comp = StringCompressor.compress(to_compress)
-            file.write(comp)
-            file.close()
+            check_file_extension(filepath, BoxmanFileTypes.BOXMAN_OBJECT_TYPE.value)
+            save_boxman_object(to_export, filepath, compression_level)
         else:
-            library = BoxmanTemplateLibrary()
             print("Exporting to library!")
             tail = check_file_name_extension(filepath, BoxmanFileTypes.BOXMAN_LIBRARY_TYPE.value)
-            if os.path.isfile(filepath):
-                file = open(filepath, 'r', encoding='utf-8')
-                serial_to_add = file.read()
-                file.close()
-                library = deserialize_library(serial_to_add)
-            else:
-                print("Creating new library!")
-                library = BoxmanTemplateLibrary()
-                library.library_name = tail
-
-            to_compress = to_export.serialize()
-            comp = StringCompressor.compress(to_compress)
-            library.template_objects[to_export.properties.name] = comp
-            library.object_descriptions[to_export.properties.name] = export_name
-            file = open(filepath, "w", encoding='utf-8')
-            file.write(library.serialize(False))
-            file.close()
+            template = boxman_to_plain(to_export)
+            library_exists = os.path.isfile(filepath)
+            appended = not compact and library_exists and \
+                append_library_template(filepath, to_export.properties.name, template, export_name,
+                                        compression_level)
+            if not appended:
+                if library_exists:
+                    library = load_library(filepath)
+                else:
+                    print("Creating new library!")
+                    library = BoxmanTemplateLibrary()
+                    library.library_name = tail
+
+                library.add_template(to_export.properties.name, template, export_name)
+                save_library(library, filepath, compression_level)
 
         show_message_box("Object exported!!")
         print("Object exported!!")
@@ -101,6 +94,13 @@ def export_selected_boxman(context, filepath: str, export_to_library: bool = Fal
         standard_except_operation(ex)
 
 
+def get_compression_level(optimize_size: bool) -> int:
+    """
+    Gets the compression level of an export, fast for the interactive saves and best for the distributed files
+    """
+    return StringCompressor.BEST_LEVEL if optimize_size else StringCompressor.FAST_LEVEL
+
+
 def import_boxman_from_file(context, filepath: str) -> None:
     """
     Imports the selected boxman object as a template.
@@ -108,15 +108,10 @@ def import_boxman_from_file(context, filepath: str) -> None:
     try:
         print("Importing...")
         check_for_object_mode(context)
-        check_file_name_extension(filepath, BoxmanFileTypes.BOXMAN_OBJECT_TYPE.value)
+        check_file_extension(filepath, BoxmanFileTypes.BOXMAN_OBJECT_TYPE.value)
 
         cursor_location = context.scene.cursor.location
-        file = open(filepath, 'r')
-        raw_text = file.read()
-        file.close()
-        json_text = StringCompressor.decompress(bytes.fromhex(raw_text))
-        dd = json.loads(json_text)
-        boxman_to_generate = construct_boxman_from_json(dd)
+        boxman_to_generate = load_boxman_object(filepath)
 
         parenting_chain = []
         ret = insert_boxman(context, parenting_chain, boxman_to_generate)
@@ -144,9 +139,21 @@ class MRBOXMAN_OT_ExportBoxmanToLibraryOperator(Operator, ExportHelper):
         options={'HIDDEN'}
     )
 
+    optimize_size: BoolProperty(
+        name="Optimize file size",
+        description="Uses the slowest and smallest compression, meant for libraries that are going to be shared",
+        default=False
+    )
+
+    compact: BoolProperty(
+        name="Compact library",
+        description="Rewrites the whole library dropping the replaced templates, instead of appending the new one",
+        default=False
+    )
+
     def execute(self, context):
         filepath = self.filepath
-        export_selected_boxman(context, filepath, True)
+        export_selected_boxman(context, filepath, True, get_compression_level(self.optimize_size), self.compact)
         return {'FINISHED'}
 
 
@@ -164,9 +171,15 @@ class MRBOXMAN_OT_ExportBoxmanObjectOperator(Operator, ExportHelper):
         options={'HIDDEN'}
     )
 
+    optimize_size: BoolProperty(
+        name="Optimize file size",
+        description="Uses the slowest and smallest compression, meant for objects that are going to be shared",
+        default=False
+    )
+
     def execute(self, context):
         filepath = self.filepath
-        export_selected_boxman(context, filepath)
+        export_selected_boxman(context, filepath, False, get_compression_level(self.optimize_size))
         return {'FINISHED'}
 
 
@@ -219,20 +232,19 @@ classes = [MRBOXMAN_OT_ExportBoxmanToLibraryOperator,
            MRBOXMAN_OT_TemplateImportOperator,
            MRBOXMAN_PT_ExportPanel
            ]
+register_classes, unregister_classes = bpy.utils.register_classes_factory(classes)
 
 
 # noinspection PyMissingOrEmptyDocstring
 def register():
     print("Registering...")
     initialize_description_input()
-    for cls in classes:
-        bpy.utils.register_class(cls)
+    register_classes()
 
 
 # noinspection PyMissingOrEmptyDocstring
 def unregister():
-    for cls in classes:
-        bpy.utils.unregister_class(cls)
+    unregister_classes()
 
     del bpy.types.Scene.BOXMAN_export_name
 
@@ -7,11 +7,14 @@ from bpy.props import StringProperty
 from bpy.props import EnumProperty
 from bpy.props import BoolProperty
 import os
+import sys
+from collections import OrderedDict
+import numpy as np
 
 
-from .boxmancommon import check_for_object_mode, check_file_name_extension, insert_boxman, apply_parenting_array, \
+from .boxmancommon import check_for_object_mode, check_file_extension, insert_boxman, apply_parenting_array, \
     check_selected_object, replace_boxman, add_mesh
-from .boxmanclasses import BoxmanFileTypes, deserialize_library, show_message_box, standard_except_operation, \
+from .boxmanclasses import BoxmanFileTypes, load_library, show_message_box, standard_except_operation, \
     BoxmanTemplateLibrary, IStaticDictionaryListable, ValueDescription
 
 
@@ -22,28 +25,109 @@ from .boxmanclasses import BoxmanFileTypes, deserialize_library, show_message_bo
 # from boxmancommon import *
 
 
+# The gizmo mesh data is built once, it is copied to each new gizmo mesh as is
+_GIZMO_VERTICES = np.array([
+    (-0.03996354341506958, -0.03996354341506958, -0.03996354341506958),
+    (-0.03996354341506958, -0.03996354341506958, 0.03996354341506958),
+    (-0.03996354341506958, 0.03996354341506958, -0.03996354341506958),
+    (-0.03996354341506958, 0.03996354341506958, 0.03996354341506958),
+    (0.03996354341506958, -0.03996354341506958, -0.03996354341506958),
+    (0.03996354341506958, -0.03996354341506958, 0.03996354341506958),
+    (0.03996354341506958, 0.03996354341506958, -0.03996354341506958),
+    (0.03996354341506958, 0.03996354341506958, 0.03996354341506958),
+    (-0.03996354341506958, 0.4261080026626587, -0.03996354341506958),
+    (-0.03996354341506958, 0.4261080026626587, 0.03996354341506958),
+    (0.03996354341506958, 0.4261080026626587, 0.03996354341506958),
+    (0.03996354341506958, 0.4261080026626587, -0.03996354341506958),
+    (0.4261080026626587, 0.03996354341506958, -0.03996354341506958),
+    (0.4261080026626587, 0.03996354341506958, 0.03996354341506958),
+    (0.4261080026626587, -0.03996354341506958, 0.03996354341506958),
+    (0.4261080026626587, -0.03996354341506958, -0.03996354341506958),
+    (0.03996354341506958, 0.03996354341506958, 0.4261080026626587),
+    (-0.03996354341506958, 0.03996354341506958, 0.4261080026626587),
+    (-0.03996354341506958, -0.03996354341506958, 0.4261080026626587),
+    (0.03996354341506958, -0.03996354341506958, 0.4261080026626587),
+    (0.0, 0.499206006526947, 0.0),
+    (0.499206006526947, 0.0, 0.0),
+    (0.0, 0.0, 0.499206006526947)
+], dtype=np.float32)
+_GIZMO_FACES = (
+    (0, 1, 3, 2), (10, 20, 9), (9, 20, 8), (4, 5, 1, 0), (2, 6, 4, 0), (3, 9, 8, 2),
+    (7, 10, 9, 3), (6, 11, 10, 7), (2, 8, 11, 6), (7, 13, 12, 6), (5, 14, 13, 7), (4, 15, 14, 5),
+    (6, 12, 15, 4), (3, 17, 16, 7), (1, 18, 17, 3), (5, 19, 18, 1), (7, 16, 19, 5), (11, 20, 10),
+    (8, 20, 11), (13, 21, 12), (14, 21, 13), (15, 21, 14), (12, 21, 15), (17, 22, 16),
+    (18, 22, 17), (19, 22, 18), (16, 22, 19)
+)
+
+
 class BoxmanLibraryPanelVariables(IStaticDictionaryListable):
     """
     Module variables
     """
     BOXMAN_TEMPLATE_OBJECTS: ValueDescription = ValueDescription("BOXMAN_template_objects", "BOXMAN_template_objects")
     BOXMAN_LIBRARY_NAME: ValueDescription = ValueDescription("BOXMAN_library_name", "BOXMAN_library_name")
+    BOXMAN_LIBRARY_PATH: ValueDescription = ValueDescription("BOXMAN_library_path", "BOXMAN_library_path")
+
+
+# Loaded libraries by file path, the least recently used ones are dropped and read again if they are needed
+_LIBRARY_CACHE: OrderedDict = OrderedDict()
+_LIBRARY_CACHE_SIZE = 4
+
+
+def cache_library(filepath: str, library: BoxmanTemplateLibrary) -> None:
+    """
+    Keeps a loaded library as the most recently used one
+    """
+    _LIBRARY_CACHE[filepath] = library
+    _LIBRARY_CACHE.move_to_end(filepath)
+    if len(_LIBRARY_CACHE) > _LIBRARY_CACHE_SIZE:
+        _LIBRARY_CACHE.popitem(last=False)
+
+
+def get_library(filepath: str):
+    """
+    Gets a loaded library, reading it again if it was dropped from the cache.
+    Returns None without a path or when the file is gone.
+    """
+    library = _LIBRARY_CACHE.get(filepath)
+    if library is None:
+        if not filepath or not os.path.isfile(filepath):
+            return None
+        library = load_library(filepath)
+    cache_library(filepath, library)
+    return library
+
+
+# Items of the template selector. The list is filled in place on every library load, so the strings that
+# blender references from the dynamic enum stay alive as long as the library is loaded.
+_NO_TEMPLATE_ITEMS = (("NONE", "NONE", "NONE"),)
+_TEMPLATE_LABEL_PREFIX = "Adds template object with description '"
+_TEMPLATE_LABEL_SUFFIX = "'"
+_TEMPLATE_ENUM_ITEMS = list(_NO_TEMPLATE_ITEMS)
+
+
+def template_objects_items(self, context):
+    """
+    Gets the items of the template selector
+    """
+    return _TEMPLATE_ENUM_ITEMS
 
 
 def initialize_combo_boxes(templates=None, library_name=None):
     """
     Initializes the combo box that shows the available meshes and templates.
+    Without templates it registers the selector, otherwise it replaces the items it shows.
     """
-    template_objects = templates
     if templates is None:
-        template_objects = [("NONE", "NONE", "NONE")]
-
-    bpy.types.Scene.BOXMAN_template_objects = bpy.props.EnumProperty(
-        items=template_objects,
-        name="Template Objects",
-        description="Boxman template meshes",
-        default=None,
-    )
+        _TEMPLATE_ENUM_ITEMS[:] = _NO_TEMPLATE_ITEMS
+        bpy.types.Scene.BOXMAN_template_objects = bpy.props.EnumProperty(
+            items=template_objects_items,
+            name="Template Objects",
+            description="Boxman template meshes",
+            default=None,
+        )
+    else:
+        _TEMPLATE_ENUM_ITEMS[:] = templates
 
     if library_name is None:
         bpy.types.Scene.BOXMAN_library_name = bpy.props.StringProperty(
@@ -51,6 +135,12 @@ def initialize_combo_boxes(templates=None, library_name=None):
             description="MrBoxman library name",
             default="NONE",
         )
+        bpy.types.Scene.BOXMAN_library_path = bpy.props.StringProperty(
+            name="Loaded library path",
+            description="MrBoxman library file",
+            default="",
+            subtype="FILE_PATH",
+        )
     else:
         bpy.context.scene[BoxmanLibraryPanelVariables.BOXMAN_LIBRARY_NAME.value] = library_name
 
@@ -60,61 +150,32 @@ def load_boxman_gizmo(context) -> None:
     Loads the boxman gizmo
     """
     try:
-        # I know that i can make a cleaner implementation, but it works for now
         print("Inserting gizmo...")
-        vertex_list = [[-0.03996354341506958, -0.03996354341506958, -0.03996354341506958],
-                       [-0.03996354341506958, -0.03996354341506958, 0.03996354341506958],
-                       [-0.03996354341506958, 0.03996354341506958, -0.03996354341506958],
-                       [-0.03996354341506958, 0.03996354341506958, 0.03996354341506958],
-                       [0.03996354341506958, -0.03996354341506958, -0.03996354341506958],
-                       [0.03996354341506958, -0.03996354341506958, 0.03996354341506958],
-                       [0.03996354341506958, 0.03996354341506958, -0.03996354341506958],
-                       [0.03996354341506958, 0.03996354341506958, 0.03996354341506958],
-                       [-0.03996354341506958, 0.4261080026626587, -0.03996354341506958],
-                       [-0.03996354341506958, 0.4261080026626587, 0.03996354341506958],
-                       [0.03996354341506958, 0.4261080026626587, 0.03996354341506958],
-                       [0.03996354341506958, 0.4261080026626587, -0.03996354341506958],
-                       [0.4261080026626587, 0.03996354341506958, -0.03996354341506958],
-                       [0.4261080026626587, 0.03996354341506958, 0.03996354341506958],
-                       [0.4261080026626587, -0.03996354341506958, 0.03996354341506958],
-                       [0.4261080026626587, -0.03996354341506958, -0.03996354341506958],
-                       [0.03996354341506958, 0.03996354341506958, 0.4261080026626587],
-                       [-0.03996354341506958, 0.03996354341506958, 0.4261080026626587],
-                       [-0.03996354341506958, -0.03996354341506958, 0.4261080026626587],
-                       [0.03996354341506958, -0.03996354341506958, 0.4261080026626587],
-                       [0.0, 0.499206006526947, 0.0], [0.499206006526947, 0.0, 0.0],
-                       [0.0, 0.0, 0.499206006526947]]
-        face_list = [[0, 1, 3, 2], [10, 20, 9], [9, 20, 8], [4, 5, 1, 0], [2, 6, 4, 0], [3, 9, 8, 2],
-                     [7, 10, 9, 3], [6, 11, 10, 7], [2, 8, 11, 6], [7, 13, 12, 6], [5, 14, 13, 7],
-                     [4, 15, 14, 5], [6, 12, 15, 4], [3, 17, 16, 7], [1, 18, 17, 3], [5, 19, 18, 1],
-                     [7, 16, 19, 5], [11, 20, 10], [8, 20, 11], [13, 21, 12], [14, 21, 13], [15, 21, 14],
-                     [12, 21, 15], [17, 22, 16], [18, 22, 17], [19, 22, 18], [16, 22, 19]]
-        add_mesh(context, "Gizmo", vertex_list, face_list)
+        add_mesh(context, "Gizmo", _GIZMO_VERTICES, _GIZMO_FACES)
         show_message_box("Gizmo inserted!!")
         print("Inserted!")
     except Exception as ex:
         standard_except_operation(ex)
 
 
-def import_boxman_library(self, context, filepath: str) -> None:
+def import_boxman_library(context, filepath: str) -> None:
     """
     Imports the selected boxman object as a template.
     """
     try:
         print("Importing library...")
         check_for_object_mode(context)
-        check_file_name_extension(filepath, BoxmanFileTypes.BOXMAN_LIBRARY_TYPE.value)
+        check_file_extension(filepath, BoxmanFileTypes.BOXMAN_LIBRARY_TYPE.value)
 
-        file = open(filepath, 'r')
-        raw_text = file.read()
-        file.close()
-        lib = deserialize_library(raw_text)
-        self.__class__.boxman_library = lib
+        lib = load_library(filepath)
+        cache_library(filepath, lib)
+        context.scene[BoxmanLibraryPanelVariables.BOXMAN_LIBRARY_PATH.value] = filepath
 
-        template_objects = []
-        for key in lib.template_objects.keys():
-            template_objects.append((key, key, f"Adds template object"
-                                               f" with description '{lib.object_descriptions[key]}'"))
+        descriptions = lib.object_descriptions
+        # the templates of a library often share their description, each label is built once and shared
+        labels = {description: _TEMPLATE_LABEL_PREFIX + description + _TEMPLATE_LABEL_SUFFIX
+                  for description in set(descriptions.values())}
+        template_objects = [(key, key, labels[descriptions[key]]) for key in map(sys.intern, lib.template_objects)]
 
         initialize_combo_boxes(template_objects, lib.library_name)
         show_message_box("Library imported!!")
@@ -169,11 +230,10 @@ class MRBOXMAN_OT_LoadTemplateLibraryOperator(Operator, ImportHelper):
         default='*.bxml',
         options={'HIDDEN'}
     )
-    boxman_library = None
 
     def execute(self, context):
         filepath = self.filepath
-        import_boxman_library(self, context, filepath)
+        import_boxman_library(context, filepath)
         return {'FINISHED'}
 
 
@@ -196,7 +256,7 @@ class MRBOXMAN_OT_LibraryInsertOperator(Operator):
 
     def execute(self, context):
         scn = context.scene
-        lib = MRBOXMAN_OT_LoadTemplateLibraryOperator.boxman_library
+        lib = get_library(scn.BOXMAN_library_path)
         if lib is None:
             show_message_box("Library is not loaded!", "Cached exception", "ERROR")
             return {'FINISHED'}
@@ -234,23 +294,24 @@ classes = [MRBOXMAN_OT_LibraryInsertOperator,
            MRBOXMAN_OT_LoadTemplateLibraryOperator,
            MRBOXMAN_PT_TemplateLibraryPanel
            ]
+register_classes, unregister_classes = bpy.utils.register_classes_factory(classes)
 
 
 # noinspection PyMissingOrEmptyDocstring
 def register():
     print("Registering...")
     initialize_combo_boxes()
-    for cls in classes:
-        bpy.utils.register_class(cls)
+    register_classes()
 
 
 # noinspection PyMissingOrEmptyDocstring
 def unregister():
-    for cls in classes:
-        bpy.utils.unregister_class(cls)
+    unregister_classes()
 
     del bpy.types.Scene.BOXMAN_template_objects
     del bpy.types.Scene.BOXMAN_library_name
+    del bpy.types.Scene.BOXMAN_library_path
+    _LIBRARY_CACHE.clear()
 
 
 if __name__ == "__main__":
@@ -15,10 +15,10 @@ from bpy.types import PropertyGroup, Panel
 from mrBoxman.boxman.boxmanriglogic import auto_rig
 from .boxmancommon import check_for_object_mode, check_file_name_extension, insert_boxman, apply_parenting_array, \
     check_selected_object, replace_boxman, add_mesh, check_selected_objects_array, add_property_to_object, \
-    force_parent_reset, ObjectIsNotRootException
+    ObjectIsNotRootException, load_boxman_with_reset
 from .boxmanclasses import BoxmanFileTypes, deserialize_library, show_message_box, standard_except_operation, \
     BoxmanTemplateLibrary, IStaticDictionaryListable, ValueDescription, BoxmanJointTypes, BoxmanExtremityTypes, \
-    load_boxman_mesh_from_object, load_boxman_from_object
+    load_boxman_mesh_from_object, BOXMAN_JOINT_TYPES, BOXMAN_EXTREMITY_TYPES
 
 
 #
@@ -30,6 +30,27 @@ from .boxmanclasses import BoxmanFileTypes, deserialize_library, show_message_bo
 # from boxmancommon import *
 # from boxmanriglogic import *
 
+_JOINT_TYPE_NAMES = frozenset(BoxmanJointTypes.list_attribute_names())
+
+# The enum items are built once, blender queries the joint types callback on every redraw of the selector
+_JOINT_GROUP_ITEMS = [(group_type.value, group_type.value, group_type.description)
+                      for group_type in BOXMAN_EXTREMITY_TYPES]
+_NO_JOINT_ITEMS = []
+
+
+def _group_joint_items() -> dict:
+    """
+    Gets the joint type enum items of every joint group, the ANY group has all of them
+    """
+    all_items = [(joint_type.value, joint_type.value, joint_type.description) for joint_type in BOXMAN_JOINT_TYPES]
+    ret = {BoxmanExtremityTypes.ANY.value: all_items}
+    for joint_type, item in zip(BOXMAN_JOINT_TYPES, all_items):
+        ret.setdefault(joint_type.sub_class, []).append(item)
+    return ret
+
+
+_JOINT_ITEMS_BY_GROUP = _group_joint_items()
+
 
 class BoxmanRigPanelVariables(IStaticDictionaryListable):
     """
@@ -46,17 +67,7 @@ def joint_types_assign(self, context):
     """
     Sets the value of the selector based on the sub types
     """
-    value = self.BOXMAN_joint_groups
-    total_joints = BoxmanJointTypes.list_attribute_values()  # type: list[JointType]
-
-    any_list = [("NONE", "NONE", "NONE")]
-    if value == BoxmanExtremityTypes.ANY.value:
-        any_list = [(joint_type.value, joint_type.value, joint_type.description)
-                    for joint_type in total_joints]
-    else:
-        any_list = [(joint_type.value, joint_type.value, joint_type.description)
-                    for joint_type in total_joints if joint_type.sub_class == value]
-    return any_list
+    return _JOINT_ITEMS_BY_GROUP.get(self.BOXMAN_joint_groups, _NO_JOINT_ITEMS)
 
 
 class BoxmanRigPanelVariablesSettings(PropertyGroup):
@@ -71,8 +82,7 @@ class BoxmanRigPanelVariablesSettings(PropertyGroup):
     )
 
     BOXMAN_joint_groups: bpy.props.EnumProperty(
-        items=[(group_type.value, group_type.value, group_type.description) for group_type in
-               BoxmanExtremityTypes.list_attribute_values()],
+        items=_JOINT_GROUP_ITEMS,
         name="Joint group",
         description="MrBoxman joint type group",
         default=None,
@@ -87,14 +97,14 @@ def set_joint_type_value(context, selected_type: str) -> None:
         print("Setting joint type...")
         check_for_object_mode(context)
         selected_objects = check_selected_objects_array(context)
+        if not selected_type or selected_type not in _JOINT_TYPE_NAMES:
+            raise ValueError()
+
         for selected_object in selected_objects:
             print("Operating over: " + selected_object.name)
             to_modify = load_boxman_mesh_from_object(selected_object)
             props = to_modify.properties
-            if selected_type and selected_type in BoxmanJointTypes.list_attribute_names():
-                props.joint_type = selected_type
-            else:
-                raise ValueError()
+            props.joint_type = selected_type
             add_property_to_object(selected_object, props)
 
         show_message_box("Joint type changed!")
@@ -113,9 +123,7 @@ def autorig_boxman(context) -> None:
         check_for_object_mode(context)
         selected_object = check_selected_object(context)
         print("Operating over: " + selected_object.name)
-        force_parent_reset(context, selected_object)
-
-        to_rig = load_boxman_from_object(selected_object)
+        to_rig = load_boxman_with_reset(context, selected_object)
         if not to_rig.q_is_root():
             raise ObjectIsNotRootException()
 
@@ -191,20 +199,19 @@ classes = [MRBOXMAN_OT_AutoRigOperator,
            MRBOXMAN_PT_RigPanelPanel,
            BoxmanRigPanelVariablesSettings
            ]
+register_classes, unregister_classes = bpy.utils.register_classes_factory(classes)
 
 
 # noinspection PyMissingOrEmptyDocstring
 def register():
-    for cls in classes:
-        bpy.utils.register_class(cls)
+    register_classes()
     # noinspection SpellCheckingInspection
     bpy.types.Scene.rigpanelsettings = PointerProperty(type=BoxmanRigPanelVariablesSettings)
 
 
 # noinspection PyMissingOrEmptyDocstring
 def unregister():
-    for cls in classes:
-        bpy.utils.unregister_class(cls)
+    unregister_classes()
     del bpy.types.Scene.rigpanelsettings
 
 
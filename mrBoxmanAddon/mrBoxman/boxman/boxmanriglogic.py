@@ -1,13 +1,14 @@
+import logging
+from functools import lru_cache
 import bpy
 import numpy as np
 import sys
 from typing import Callable
 from typing import List
 from typing import TypedDict
-import pprint
 import inspect
-from mathutils import Euler, Vector
-from math import sqrt, atan2, asin, acos, radians
+from mathutils import Euler
+from math import sqrt, atan2, asin, acos, radians, pi
 from bpy.types import Operator
 from bpy.types import Panel
 
@@ -21,12 +22,45 @@ from .mrBoxman.boxman.boxmancommon import add_mesh, ValueCantBeZeroException
 # from boxmanclasses import *
 # from boxmancommon import *
 
-prettyPrinter = pprint.PrettyPrinter(indent=4)
+logger = logging.getLogger(__name__)
+
+# the extremity types name the bone groups every rigger queues its bones to
+_EXTREMITY_DEFAULT = BoxmanExtremityTypes.DEFAULT.value
+_EXTREMITY_SPINE = BoxmanExtremityTypes.SPINE.value
+_EXTREMITY_HEAD = BoxmanExtremityTypes.HEAD.value
+_EXTREMITY_HAND = BoxmanExtremityTypes.HAND.value
+_EXTREMITY_ARM = BoxmanExtremityTypes.ARM.value
+_EXTREMITY_LEG = BoxmanExtremityTypes.LEG.value
+_EXTREMITY_FEET = BoxmanExtremityTypes.FEET.value
+_EXTREMITY_CHAIN = BoxmanExtremityTypes.CHAIN.value
+
+# canonical pole target angles by (offset sign, orientation), the center bones use the default of the sign
+_POLE_ANGLE_TABLE = {
+    (1, BoxmanOrientations.L.value): 0.0,
+    (1, BoxmanOrientations.R.value): -105.0,
+    (-1, BoxmanOrientations.L.value): 180.0,
+    (-1, BoxmanOrientations.R.value): 75.0,
+}
 
 
 # region Generated Controls
 # TODO: This goes in another file
 
+def scale_to_bounds(vectors: np.ndarray, min_box: np.ndarray, range_box: np.ndarray,
+                    min_data: np.ndarray, range_data: np.ndarray) -> None:
+    """
+    Remaps in place every axis of an (N, 3) array from the box bounds to the data bounds.
+    It is kept as a plain array kernel, apart from the controls, to be swapped by a compiled one if needed.
+    The flat axes of the box are collapsed on the data minimum instead of dividing by zero.
+    """
+    flat = range_box == 0
+    scale = range_data / np.where(flat, 1.0, range_box)
+    scale[flat] = 0.0
+    vectors -= min_box
+    vectors *= scale
+    vectors += min_data
+
+
 class BoxmanRigControl:
     """
     Contract for the rig controls and bound boxes that will be used to create meta-rig meshes.
@@ -42,8 +76,8 @@ class BoxmanRigControl:
     # endregion
 
     def __init__(self):
-        self.vertex_list = []
-        self.edges_list = []
+        self.vertex_list = np.empty((0, 3), dtype=np.float64)
+        self.edges_list = np.empty((0, 2), dtype=np.int32)
         self.name = "BoxmanRigControl"
 
     def add_as_mesh(self, context):
@@ -57,42 +91,13 @@ class BoxmanRigControl:
     def scale_to_boxman(self, boxman_vertex_list: List[List[float]]) -> None:
         """
         Creates a bounding box with the shape of the proportions of the boxman argument.
-        It need the argument to be in 3D, not 2d like a ring or it will explode.
+        It needs the control to be in 3D, the flat axes of a 2d control like a ring stay flat.
         """
-        box_vectors = np.array(self.vertex_list)
-        print(box_vectors.size)
-
-        x_box = box_vectors[:, 0]
-        y_box = box_vectors[:, 1]
-        z_box = box_vectors[:, 2]
-
-        x_min_box = np.amin(x_box)
-        x_max_box = np.amax(x_box)
-        y_min_box = np.amin(y_box)
-        y_max_box = np.amax(y_box)
-        z_min_box = np.amin(z_box)
-        z_max_box = np.amax(z_box)
-
-        data_vectors = np.array(boxman_vertex_list)
-        x_data = data_vectors[:, 0]
-        y_data = data_vectors[:, 1]
-        z_data = data_vectors[:, 2]
-
-        x_min = np.amin(x_data)
-        x_max = np.amax(x_data)
-        y_min = np.amin(y_data)
-        y_max = np.amax(y_data)
-        z_min = np.amin(z_data)
-        z_max = np.amax(z_data)
-
-        new_vector = []
-        for i in range(0, box_vectors.shape[0]):
-            x_box_scaled = x_min + (x_box[i] - x_min_box) * (x_max - x_min) / (x_max_box - x_min_box)
-            y_box_scaled = y_min + (y_box[i] - y_min_box) * (y_max - y_min) / (y_max_box - y_min_box)
-            z_box_scaled = z_min + (z_box[i] - z_min_box) * (z_max - z_min) / (z_max_box - z_min_box)
-            new_vector.append([x_box_scaled, y_box_scaled, z_box_scaled])
-
-        self.vertex_list = new_vector
+        box_vectors = self.vertex_list
+        data_vectors = np.asarray(boxman_vertex_list, dtype=np.float64)
+        # the control owns its array
+        scale_to_bounds(box_vectors, box_vectors.min(axis=0), np.ptp(box_vectors, axis=0),
+                        data_vectors.min(axis=0), np.ptp(data_vectors, axis=0))
 
 
 class BoxmanRigControlFactory:
@@ -100,30 +105,39 @@ class BoxmanRigControlFactory:
     Static class that brings boxman controls.
     """
 
+    # region Geometry caches
+    # The controls get copies of the stored geometry, so the same template can be scaled per bone.
+    # The polygons are stored as read only arrays
+    UNIT_CUBE_VERTICES = ((0.0, 0.0, 0.0), (0.0, 0.0, 1.0), (0.0, 1.0, 0.0), (0.0, 1.0, 1.0),
+                          (1.0, 0.0, 0.0), (1.0, 0.0, 1.0), (1.0, 1.0, 0.0), (1.0, 1.0, 1.0))
+    UNIT_CUBE_EDGES = ((0, 2), (0, 1), (1, 3), (2, 3), (2, 6), (3, 7),
+                       (6, 7), (4, 6), (5, 7), (4, 5), (0, 4), (1, 5))
+    _polygon_cache = {}  # (sides, radius) -> (vertices, edges)
+    _cross_polygon_cache = {}  # (sides, radius) -> (vertices, edges)
+    # endregion
+
     def __init__(self):
         pass
 
     @staticmethod
-    def get_unit_cube(name: str) -> BoxmanRigControl:
+    def create_control(name: str, vertices, edges) -> BoxmanRigControl:
         """
-        Get a unit cube ready to be scaled to a bounding box.
+        Creates a control with its own copy of a stored geometry.
         """
         control = BoxmanRigControl()
-        control.vertex_list = [
-            [0.0, 0.0, 0.0],
-            [0.0, 0.0, 1.0],
-            [0.0, 1.0, 0.0],
-            [0.0, 1.0, 1.0],
-            [1.0, 0.0, 0.0],
-            [1.0, 0.0, 1.0],
-            [1.0, 1.0, 0.0],
-            [1.0, 1.0, 1.0]
-        ]
-        control.edges_list = [[0, 2], [0, 1], [1, 3], [2, 3], [2, 6], [3, 7],
-                              [6, 7], [4, 6], [5, 7], [4, 5], [0, 4], [1, 5]]
+        control.vertex_list = np.array(vertices, dtype=np.float64)
+        control.edges_list = np.array(edges, dtype=np.int32)
         control.name = name
         return control
 
+    @staticmethod
+    def get_unit_cube(name: str) -> BoxmanRigControl:
+        """
+        Get a unit cube ready to be scaled to a bounding box.
+        """
+        return BoxmanRigControlFactory.create_control(name, BoxmanRigControlFactory.UNIT_CUBE_VERTICES,
+                                                      BoxmanRigControlFactory.UNIT_CUBE_EDGES)
+
     @staticmethod
     def get_unit_cross_regular_polygon(name: str, sides: int = 6, radius: float = 1.0) -> BoxmanRigControl:
         """
@@ -131,30 +145,44 @@ class BoxmanRigControlFactory:
         """
         if sides <= 0:
             raise ValueCantBeZeroException()
+        key = (sides, radius)
+        geometry = BoxmanRigControlFactory._cross_polygon_cache.get(key)
+        if geometry is None:
+            geometry = BoxmanRigControlFactory._cross_polygon_cache[key] = \
+                BoxmanRigControlFactory.build_cross_regular_polygon(sides, radius)
+        return BoxmanRigControlFactory.create_control(name, *geometry)
+
+    @staticmethod
+    def build_cross_regular_polygon(sides: int, radius: float) -> tuple:
+        """
+        Builds the vertices and edges of a cross with two regular polygons
+        """
         n = sides
-        fraction = 2 * np.pi / n
-        control = BoxmanRigControl()
-        for i in range(0, n+1):
-            element = [radius * np.cos(fraction * i),
-                       radius * np.sin(fraction * i),
-                       0.0]
-            control.vertex_list.append(element)
-            control.edges_list.append([i, i + 1])
-            
-        control.edges_list[-1][1] = 0
-
-        # then create the perpendicular ring
-        for i in range(0, n+1):
-            element = [0,
-                       radius * np.cos(fraction * i),
-                       radius * np.sin(fraction * i)]
-            control.vertex_list.append(element)
-            control.edges_list.append([i+n+1, i + n + 2])
-            
-        control.edges_list[-1][1]= n+1
-        # on the last, it connects to the first
-        control.name = name
-        return control
+        angles = np.arange(n) * (2 * pi / n)
+        ring = np.empty((n, 2))
+        np.cos(angles, out=ring[:, 0])
+        np.sin(angles, out=ring[:, 1])
+        ring *= radius
+        # the ring in Z and then the perpendicular ring, written in place of the zeros
+        vertices = np.zeros((2 * n, 3))
+        vertices[:n, :2] = ring
+        vertices[n:, 1:] = ring
+        edges = np.empty((2 * n, 2), dtype=np.int32)
+        edges[:n] = BoxmanRigControlFactory.build_ring_edges(n)
+        np.add(edges[:n], n, out=edges[n:])
+        vertices.flags.writeable = edges.flags.writeable = False
+        return vertices, edges
+
+    @staticmethod
+    def build_ring_edges(count: int) -> np.ndarray:
+        """
+        Builds the edges of a closed ring of vertices, on the last, it connects to the first
+        """
+        edges = np.empty((count, 2), dtype=np.int32)
+        edges[:, 0] = np.arange(count, dtype=np.int32)
+        edges[:-1, 1] = edges[1:, 0]
+        edges[-1, 1] = 0
+        return edges
 
     @staticmethod
     def get_unit_regular_polygon(name: str, sides: int = 6, radius: float = 1.0) -> BoxmanRigControl:
@@ -163,20 +191,27 @@ class BoxmanRigControlFactory:
         """
         if sides <= 0:
             raise ValueCantBeZeroException()
+        key = (sides, radius)
+        geometry = BoxmanRigControlFactory._polygon_cache.get(key)
+        if geometry is None:
+            geometry = BoxmanRigControlFactory._polygon_cache[key] = \
+                BoxmanRigControlFactory.build_regular_polygon(sides, radius)
+        return BoxmanRigControlFactory.create_control(name, *geometry)
+
+    @staticmethod
+    def build_regular_polygon(sides: int, radius: float) -> tuple:
+        """
+        Builds the vertices and edges of a regular polygon oriented in Z
+        """
         n = sides
-        fraction = 2 * np.pi / n
-        control = BoxmanRigControl()
-        for i in range(0, n + 1):
-            element = [radius * np.cos(fraction * i),
-                       radius * np.sin(fraction * i),
-                       0.0]
-            control.vertex_list.append(element)
-            control.edges_list.append([i, i + 1])
-
-        control.edges_list[-1][1] = 0
-        # on the last, it connects to the first
-        control.name = name
-        return control
+        angles = np.arange(n) * (2 * pi / n)
+        vertices = np.zeros((n, 3))
+        np.cos(angles, out=vertices[:, 0])
+        np.sin(angles, out=vertices[:, 1])
+        vertices[:, :2] *= radius
+        edges = BoxmanRigControlFactory.build_ring_edges(n)
+        vertices.flags.writeable = edges.flags.writeable = False
+        return vertices, edges
 
 # endregion
 
@@ -210,6 +245,7 @@ class RiggerBase:
     HEAD_LAYER_INDEX = 9 # For the Head
     CHAIN_LAYER_INDEX = 10 # For Chains
     GLOBAL_LAYER_INDEX = 31 # ALL
+    LAYER_COUNT = 32 # the indexes are the bits of the layer masks
     # endregion
 
     # region Collection constants
@@ -219,50 +255,45 @@ class RiggerBase:
     COLLECTION_MESH_SUFFIX = "MESH"
     # endregion
 
+    # region Fixture names
+    # stored_parenting_fixture -> calls precalculated before going to object mode
+    # stored_mesh_creation_fixture -> calls precalculated before going to pose mode
+    # stored_control_creation_fixture -> constraints and bone replacements going back to object mode
+    # stored_collection_assignments -> collection links going back to object mode
+    # The fixtures are composed of (static method, arguments) tuples precalculated, all the riggers of a
+    # tree share the lists of the root. They are executed in order with execute_fixture, and as they do not
+    # reference the riggers, they do not keep them alive
+    FIXTURE_NAMES = ("stored_parenting_fixture", "stored_mesh_creation_fixture",
+                     "stored_control_creation_fixture", "stored_collection_assignments")
+    # endregion
+
+    # A rig builds one rigger per boxman mesh, so the riggers declare their attributes as slots instead of
+    # keeping a dictionary per instance. Every subclass has to declare its own slots, even if empty, to keep it so.
+    __slots__ = ("linked_object", "parent_rigger", "armature_object_name", "rigger_factory", "current_edit_bone",
+                 "control_bone", "_rotation_matrix", "_typical_size", "absolute_root_rigger",
+                 "local_control_root") + FIXTURE_NAMES
+
     def __init__(self, linked_object: BoxmanDTO, parent_rigger=None):
         self.linked_object: BoxmanDTO = linked_object
         self.parent_rigger = parent_rigger
-        self.armature_object_name = ""
         self.rigger_factory = None
         self.current_edit_bone = None  # This is the reference to the editable entity, not the bone in the data context
         self.control_bone = None # this is going to be used sometimes
+        self._rotation_matrix = None  # cached rotation of the linked object, see get_rotation_matrix
+        self._typical_size = None  # cached size of the linked object, see get_typical_size
 
-        # this is the absolute root of all riggers, used to parent all the IK controls
-        self.absolute_root_rigger = None
-
-        # this is used to parent locally without loosing sight of the absolute, used fo hands and such
-        self.local_control_root = None
-
-        self.stored_parenting_fixture = []  # type: List[Callable]
-        self.stored_mesh_creation_fixture = []  # type: List[Callable]
-        self.stored_control_creation_fixture = []  # type: List[Callable]
-        self.stored_collection_assignments= [] # type: List[Callable]
+        for name in self.FIXTURE_NAMES:
+            setattr(self, name, [] if parent_rigger is None else getattr(parent_rigger, name))
 
         if parent_rigger is not None:
             # name of the armature
             self.armature_object_name = parent_rigger.armature_object_name
 
-            # find the absolute
+            # this is the absolute root of all riggers, used to parent all the IK controls
             self.absolute_root_rigger = parent_rigger.absolute_root_rigger
 
-            # find the absolute
+            # this is used to parent locally without loosing sight of the absolute, used fo hands and such
             self.local_control_root = parent_rigger.local_control_root
-
-            # The fixture is composed of calls to static methods with arguments precalculated before
-            # going to object mode
-            self.stored_parenting_fixture = parent_rigger.stored_parenting_fixture
-
-            # The fixture is composed of calls to static methods with arguments precalculated before
-            # going to pose mode
-            self.stored_mesh_creation_fixture = parent_rigger.stored_mesh_creation_fixture
-
-            # The fixture is composed of calls to static methods with arguments precalculated before
-            # going back to object mode, this are the constraints and bone replacements
-            self.stored_control_creation_fixture = parent_rigger.stored_control_creation_fixture
-
-            # The fixture is composed of calls to static methods with arguments precalculated before
-            # going back to object mode, this are the constraints and bone replacements
-            self.stored_collection_assignments = parent_rigger.stored_collection_assignments
         else:
             # set the armature name
             self.armature_object_name = "Armature_"+linked_object.properties.name
@@ -284,37 +315,51 @@ class RiggerBase:
 
     def get_typical_size(self) -> float:
         """
-        Gets a pseudo norm as typical size of the object
+        Gets a pseudo norm as typical size of the object, it is calculated once per rigger.
+        The children riggers ask for it again to place their controls.
         """
-        vertex_list = np.array(self.linked_object.vertex_list)
-        vertex_list = np.abs(vertex_list)  # gets absolute value
-        norm_x = np.amax(vertex_list[:, 0])
-        norm_y = np.amax(vertex_list[:, 1])
-        norm_z = np.amax(vertex_list[:, 2])
-        return np.linalg.norm(np.array([norm_x, norm_y, norm_z]))
+        if self._typical_size is None:
+            vertex_list = np.abs(np.array(self.linked_object.vertex_list))  # gets absolute value
+            norm_x, norm_y, norm_z = vertex_list.max(axis=0).tolist()  # the three axis in a single pass
+            self._typical_size = sqrt(norm_x * norm_x + norm_y * norm_y + norm_z * norm_z)
+        return self._typical_size
 
     def get_mesh_mean_point(self) -> List:
         """
         Gets the mean point of the currently linked boxman object.
         as the tail of a bone.
         """
-        print(f"Calculating mean point of mesh {self.linked_object.properties.name}...")
+        logger.debug("Calculating mean point of mesh %s...", self.linked_object.properties.name)
         # need to add these 2
-        vertex_list = np.array(self.linked_object.vertex_list)
-        mean = np.mean(vertex_list, axis=0)
+        mean = np.array(self.linked_object.vertex_list).mean(axis=0)
 
         # this needs to apply euler rotations with the vector
-        mean_vector = Vector((mean[0], mean[1], mean[2]))
-        euler = Euler((self.linked_object.rotations[0][0],
-                       self.linked_object.rotations[0][1],
-                       self.linked_object.rotations[0][2]),
-                      self.linked_object.rotations[1]
-                      )
-        mean_vector.rotate(euler)
-        return [mean_vector[0] + self.linked_object.location[0],
-                mean_vector[1] + self.linked_object.location[1],
-                mean_vector[2] + self.linked_object.location[2]
-                ]
+        return (self.get_rotation_matrix() @ mean + np.asarray(self.linked_object.location)).tolist()
+
+    def get_rotation_matrix(self) -> np.ndarray:
+        """
+        Gets the 3x3 rotation matrix of the linked boxman object, it is calculated once per rigger.
+        """
+        if self._rotation_matrix is None:
+            rotation, order = self.linked_object.rotations[0], self.linked_object.rotations[1]
+            self._rotation_matrix = np.array(Euler(rotation[:3], order).to_matrix())
+        return self._rotation_matrix
+
+    # endregion
+
+    # region Bone functions
+
+    @staticmethod
+    def add_edit_bone(name: str = "Bone"):
+        """
+        Adds a bone to the armature in edit mode, placed as bone_primitive_add does, at the cursor and pointing up.
+        The bone is created on the edit bones directly, so no operator runs per bone.
+        """
+        edit_bone = bpy.context.object.data.edit_bones.new(name)
+        cursor = bpy.context.scene.cursor.location
+        edit_bone.head = cursor
+        edit_bone.tail = (cursor.x, cursor.y, cursor.z + 1.0)
+        return edit_bone
 
     # endregion
 
@@ -351,7 +396,7 @@ class RiggerBase:
         linked_object_name = self.linked_object.get_object_name()
         armature_name = self.armature_object_name
         self.stored_parenting_fixture.append(
-            lambda context: self.parent_object_to_rig(context, current_bone_name, linked_object_name, armature_name)
+            (self.parent_object_to_rig, (current_bone_name, linked_object_name, armature_name))
         )
 
     @staticmethod
@@ -360,14 +405,16 @@ class RiggerBase:
         Parents a mesh to a bone of the rig
         """
         obj = check_selected_object(context, "ARMATURE")
-        if current_bone_name not in obj.pose.bones.keys():
+        pose_bone = obj.pose.bones.get(current_bone_name)
+        if pose_bone is None:
             raise NameError()
 
-        bpy.data.objects[linked_object_name].parent = bpy.data.objects[armature_name]
-        bpy.data.objects[linked_object_name].parent_bone = current_bone_name
-        bpy.data.objects[linked_object_name].parent_type = 'BONE'
-        context.object.data.bones[current_bone_name].use_relative_parent = True
-        print(f"Linking {linked_object_name}...")
+        linked_object = bpy.data.objects[linked_object_name]
+        linked_object.parent = get_armature_object(armature_name)
+        linked_object.parent_bone = current_bone_name
+        linked_object.parent_type = 'BONE'
+        pose_bone.bone.use_relative_parent = True
+        logger.debug("Linking %s...", linked_object_name)
 
     def queue_link_mesh_to_collection(self, collection_name=None, mesh_name=None) -> None:
         """
@@ -382,7 +429,7 @@ class RiggerBase:
             mesh_object_name = mesh_name
 
         self.stored_collection_assignments.append(
-            lambda context: self.link_mesh_to_collection(context, collection_name, mesh_object_name)
+            (self.link_mesh_to_collection, (collection_name, mesh_object_name))
         )
 
     @staticmethod
@@ -393,15 +440,15 @@ class RiggerBase:
         mesh_object = bpy.data.objects[mesh_object_name]
         collection = None
         if collection_name is None:
-            collection = bpy.context.scene.collection
+            collection = context.scene.collection
         else:
             collection = bpy.data.collections[collection_name]
 
-        print(f"Linking {mesh_object_name} to collection {collection_name}...")
-        if not any([x for x in collection.keys() if x == mesh_object_name]):
+        logger.debug("Linking %s to collection %s...", mesh_object_name, collection_name)
+        if mesh_object_name not in collection.objects:
             collection.objects.link(mesh_object)
         else:
-            print(f"Object {mesh_object_name} already linked to collection {collection_name}...")
+            logger.debug("Object %s already linked to collection %s...", mesh_object_name, collection_name)
 
     def queue_unlink_mesh_from_collection(self, collection_name=None, mesh_name=None) -> None:
         """
@@ -416,7 +463,7 @@ class RiggerBase:
             mesh_object_name = mesh_name
 
         self.stored_collection_assignments.append(
-            lambda context: self.unlink_mesh_to_collection(context, collection_name, mesh_object_name)
+            (self.unlink_mesh_to_collection, (collection_name, mesh_object_name))
         )
 
     @staticmethod
@@ -427,11 +474,33 @@ class RiggerBase:
         mesh_object = bpy.data.objects[mesh_object_name]
         collection = None
         if collection_name is None:
-            collection = bpy.context.scene.collection
+            collection = context.scene.collection
         else:
             collection = bpy.data.collections[collection_name]
         collection.objects.unlink(mesh_object)
-        print(f"Unlinking {mesh_object_name} to collection {collection_name}...")
+        logger.debug("Unlinking %s to collection %s...", mesh_object_name, collection_name)
+
+    def queue_move_mesh_to_collection(self, collection_name, mesh_name=None) -> None:
+        """
+        Queues the move of a mesh from the scene collection to another collection, as a single call
+        If mesh_name is None it operates over the current linked object
+        """
+        mesh_object_name = self.linked_object.get_object_name() if mesh_name is None else mesh_name
+        self.stored_collection_assignments.append(
+            (self.move_mesh_to_collection, (collection_name, mesh_object_name))
+        )
+
+    @staticmethod
+    def move_mesh_to_collection(context, collection_name, mesh_object_name) -> None:
+        """
+        Links a mesh to a collection and removes it from the scene collection
+        """
+        logger.debug("Moving %s to collection %s...", mesh_object_name, collection_name)
+        mesh_object = bpy.data.objects[mesh_object_name]
+        collection_objects = bpy.data.collections[collection_name].objects
+        if mesh_object_name not in collection_objects:
+            collection_objects.link(mesh_object)
+        context.scene.collection.objects.unlink(mesh_object)
 
     # endregion
 
@@ -443,7 +512,7 @@ class RiggerBase:
         """
         armature_name = self.armature_object_name
         self.stored_control_creation_fixture.append(
-            lambda context: self.add_bone_to_group(context, group_name, bone_name, armature_name)
+            (self.add_bone_to_group, (group_name, bone_name, armature_name))
         )
 
     @staticmethod
@@ -451,34 +520,38 @@ class RiggerBase:
         """
         Creates bone groups to color the controls
         """
-        print(f"Adding {bone_name} to group {group_name}...")
-        target_bone = bpy.data.objects[armature_name].pose.bones[bone_name]
-        bone_group = bpy.data.objects[armature_name].pose.bone_groups[group_name]
+        logger.debug("Adding %s to group %s...", bone_name, group_name)
+        pose = get_armature_object(armature_name).pose
+        target_bone = pose.bones[bone_name]
+        bone_group = pose.bone_groups[group_name]
         if bone_group is None:
             raise ValueError(f"Value of bone_group can not be None!")
         target_bone.bone_group = bone_group
 
     def queue_add_bone_to_layers(self, layer_index: List[int], bone_name) -> None:
         """
-        Queues the addition of a bone to a layer
+        Queues the addition of a bone to a layer, the indexes are folded into a single layer bit mask
         """
+        if max(layer_index, default=-1) >= RiggerBase.LAYER_COUNT:
+            raise ValueError("Layer index is over the limit!")
+
+        layer_mask = 0
+        for index in layer_index:
+            layer_mask |= 1 << index
+
         armature_name = self.armature_object_name
         self.stored_control_creation_fixture.append(
-            lambda context: self.add_bone_to_layers(context, layer_index, bone_name, armature_name)
+            (self.add_bone_to_layers, (layer_mask, bone_name, armature_name))
         )
 
     @staticmethod
-    def add_bone_to_layers(context, layer_index: List[int], bone_name, armature_name) -> None:
+    def add_bone_to_layers(context, layer_mask: int, bone_name, armature_name) -> None:
         """
-        Adds a bone to the layers of an array
+        Adds a bone to the layers of a bit mask, the layers are read and written back in a single slice
         """
-        if any(index > 31 for index in layer_index):
-            raise ValueError("Layer index is over the limit!")
-
-        for index in layer_index:
-            print(f"Adding {bone_name} to layer {str(index)}...")
-            target_bone = bpy.data.objects[armature_name].pose.bones[bone_name]
-            target_bone.bone.layers[index] = True
+        logger.debug("Adding %s to layers %s...", bone_name, bin(layer_mask))
+        layers = get_pose_bones(armature_name)[bone_name].bone.layers
+        layers[:] = [visible or bool(layer_mask >> index & 1) for index, visible in enumerate(layers[:])]
 
     # endregion
 
@@ -510,6 +583,7 @@ class RootRigger(RiggerBase):
     Only works for root objects.
     It creates a ring control of size 1, and parents all the bones in the boxman.
     """
+    __slots__ = ()
 
     def __init__(self, linked_object: BoxmanDTO, parent_rigger=None):
         super().__init__(linked_object, parent_rigger)
@@ -522,25 +596,22 @@ class RootRigger(RiggerBase):
         rest of the rig.
         Created control meshes are hidden after the creation.
         """
-        print(f"Generating Root rig for {self.linked_object.properties.name}.")
+        logger.debug("Generating Root rig for %s.", self.linked_object.properties.name)
         # creates the armature
         self.queue_add_control_mesh_templates()
         bpy.ops.object.armature_add(enter_editmode=True, align='WORLD',
                                     location=(0, 0, 0),
                                     scale=(1, 1, 1))
-        # sets the current bone as the root and sets its tail to the location of the gizmo
-        bpy.ops.armature.select_linked()
-        self.current_edit_bone = bpy.context.selected_bones[0]
+        # sets the current bone as the root and sets its tail to the location of the gizmo, a new armature
+        # has a single bone so it is taken directly instead of selecting it
+        self.current_edit_bone = bpy.context.object.data.edit_bones[0]
         self.current_edit_bone.name = self.linked_object.get_object_name()
 
         # Oriented forward
-        self.current_edit_bone.head.x = self.linked_object.location[0]
-        self.current_edit_bone.head.y = self.linked_object.location[1]
-        self.current_edit_bone.head.z = self.linked_object.location[2]
+        self.current_edit_bone.head = self.linked_object.location
 
-        self.current_edit_bone.tail.x = self.current_edit_bone.head.x + 1.0
-        self.current_edit_bone.tail.y = self.current_edit_bone.head.y
-        self.current_edit_bone.tail.z = self.current_edit_bone.head.z
+        head = self.current_edit_bone.head
+        self.current_edit_bone.tail = (head.x + 1.0, head.y, head.z)
 
         # this needs to be done before creating anything
         self.queue_create_bone_groups()
@@ -558,23 +629,22 @@ class RootRigger(RiggerBase):
         self.queue_parent_object_to_rig()
         self.queue_attach_root_shape()
         self.queue_hide_template_meshes()
-        self.queue_add_bone_to_group(BoxmanExtremityTypes.DEFAULT.value, self.current_edit_bone.name)
+        self.queue_add_bone_to_group(_EXTREMITY_DEFAULT, self.current_edit_bone.name)
 
         self.queue_add_bone_to_layers([RiggerBase.MAYORS_LAYER_INDEX,
                                        RiggerBase.CONTROL_LAYER_INDEX,
                                        RiggerBase.GLOBAL_LAYER_INDEX],
                                       self.current_edit_bone.name)
 
-        self.queue_unlink_mesh_from_collection()
-        self.queue_link_mesh_to_collection(self.get_control_mesh_collection_name())
+        self.queue_move_mesh_to_collection(self.get_control_mesh_collection_name())
+        self.queue_move_controls_to_collection()
 
-        self.queue_link_controls_to_collection()
-        self.queue_unlink_control_meshes_to_collection()
-
-        print(f"Generated Root rig for {self.linked_object.properties.name}!")
+        logger.debug("Generated Root rig for %s!", self.linked_object.properties.name)
 
     # region Naming functions
+    # the names are requested by every bone callback of the same few armatures, they are built once per armature
     @staticmethod
+    @lru_cache(maxsize=64)
     def get_root_control_name(armature_name):
         """
         Gets the name of the root controller mesh
@@ -582,6 +652,7 @@ class RootRigger(RiggerBase):
         return f"{armature_name}_{BoxmanRigControl.ROOT_CONTROL_SUFFIX}_{BoxmanRigControl.DEFAULT_CONTROL_SUFFIX}"
 
     @staticmethod
+    @lru_cache(maxsize=64)
     def get_default_control_name(armature_name):
         """
         Gets the name os the default control mesh
@@ -589,6 +660,7 @@ class RootRigger(RiggerBase):
         return f"{armature_name}_{BoxmanRigControl.DEFAULT_CONTROL_NAME}_{BoxmanRigControl.DEFAULT_CONTROL_SUFFIX}"
 
     @staticmethod
+    @lru_cache(maxsize=64)
     def get_pole_target_control_name(armature_name):
         """
         Gets the name of the pole target control mesh
@@ -596,6 +668,7 @@ class RootRigger(RiggerBase):
         return f"{armature_name}_{BoxmanRigControl.POLE_TARGET_SUFFIX}_{BoxmanRigControl.DEFAULT_CONTROL_SUFFIX}"
 
     @staticmethod
+    @lru_cache(maxsize=64)
     def get_default_ik_control_name(armature_name):
         """
         Gets the name of the default ik control mesh
@@ -614,7 +687,7 @@ class RootRigger(RiggerBase):
         armature_name = self.armature_object_name
 
         self.stored_mesh_creation_fixture.append(
-            lambda context: self.add_control_mesh_templates(context, location, armature_name)
+            (self.add_control_mesh_templates, (location, armature_name))
         )
 
     @staticmethod
@@ -622,41 +695,20 @@ class RootRigger(RiggerBase):
         """
         Adds a control for each type of required render.
         """
-        # adds the root ring
-        print(f"Adding {BoxmanRigControl.ROOT_CONTROL_SUFFIX} control shape...")
-        name = RootRigger.get_root_control_name(armature_name)
-        ring_data = BoxmanRigControlFactory.get_unit_regular_polygon(name, 8)
-        ring_object = ring_data.add_as_mesh(context)
-        ring_object.location.x = location[0]
-        ring_object.location.y = location[1]
-        ring_object.location.z = location[2]
-
-        # adds the default ring
-        print(f"Adding {BoxmanRigControl.DEFAULT_CONTROL_NAME} control shape...")
-        name = RootRigger.get_default_control_name(armature_name)
-        ring_data = BoxmanRigControlFactory.get_unit_cross_regular_polygon(name, 8)
-        ring_object = ring_data.add_as_mesh(context)
-        ring_object.location.x = location[0] + 1.0 # offset by 1.0
-        ring_object.location.y = location[1]
-        ring_object.location.z = location[2]
-
-        # adds the default pole target
-        print(f"Adding {BoxmanRigControl.POLE_TARGET_SUFFIX} control shape...")
-        name = RootRigger.get_pole_target_control_name(armature_name)
-        ring_data = BoxmanRigControlFactory.get_unit_cross_regular_polygon(name, 4)
-        ring_object = ring_data.add_as_mesh(context)
-        ring_object.location.x = location[0] + 2.0 # offset by 1.0
-        ring_object.location.y = location[1]
-        ring_object.location.z = location[2]
-
-        # adds the default ik control
-        print(f"Adding {BoxmanRigControl.IK_CONTROL_SUFFIX} control shape...")
-        name = RootRigger.get_default_ik_control_name(armature_name)
-        ring_data = BoxmanRigControlFactory.get_unit_cross_regular_polygon(name, 3)
-        ring_object = ring_data.add_as_mesh(context)
-        ring_object.location.x = location[0] + 3.0 # offset by 1.0
-        ring_object.location.y = location[1]
-        ring_object.location.z = location[2]
+        polygon = BoxmanRigControlFactory.get_unit_regular_polygon
+        cross = BoxmanRigControlFactory.get_unit_cross_regular_polygon
+        # (label, naming function, shape, sides, offset in x), each template is offset by 1.0 from the previous
+        templates = (
+            (BoxmanRigControl.ROOT_CONTROL_SUFFIX, RootRigger.get_root_control_name, polygon, 8, 0.0),
+            (BoxmanRigControl.DEFAULT_CONTROL_NAME, RootRigger.get_default_control_name, cross, 8, 1.0),
+            (BoxmanRigControl.POLE_TARGET_SUFFIX, RootRigger.get_pole_target_control_name, cross, 4, 2.0),
+            (BoxmanRigControl.IK_CONTROL_SUFFIX, RootRigger.get_default_ik_control_name, cross, 3, 3.0),
+        )
+        x, y, z = location[0], location[1], location[2]
+        for label, get_name, shape, sides, offset in templates:
+            logger.debug("Adding %s control shape...", label)
+            ring_object = shape(get_name(armature_name), sides).add_as_mesh(context)
+            ring_object.location = (x + offset, y, z)
 
     def queue_hide_template_meshes(self) -> None:
         """
@@ -664,7 +716,7 @@ class RootRigger(RiggerBase):
         """
         armature_name = self.armature_object_name
         self.stored_mesh_creation_fixture.append(
-            lambda context: self.hide_template_meshes(context, armature_name)
+            (self.hide_template_meshes, (armature_name,))
         )
 
     @staticmethod
@@ -672,25 +724,29 @@ class RootRigger(RiggerBase):
         """
         Hides all created control meshes
         """
-        print(f"Hiding {BoxmanRigControl.ROOT_CONTROL_SUFFIX} control shape...")
+        logger.debug("Hiding %s control shape...", BoxmanRigControl.ROOT_CONTROL_SUFFIX)
         root_name = RootRigger.get_root_control_name(armature_name)
-        bpy.data.objects[root_name].hide_viewport = True
-        bpy.data.objects[root_name].hide_render = True
+        shape_object = bpy.data.objects[root_name]
+        shape_object.hide_viewport = True
+        shape_object.hide_render = True
 
-        print(f"Hiding {BoxmanRigControl.DEFAULT_CONTROL_NAME} control shape...")
+        logger.debug("Hiding %s control shape...", BoxmanRigControl.DEFAULT_CONTROL_NAME)
         ring_name = RootRigger.get_default_control_name(armature_name)
-        bpy.data.objects[ring_name].hide_viewport = True
-        bpy.data.objects[ring_name].hide_render = True
+        shape_object = bpy.data.objects[ring_name]
+        shape_object.hide_viewport = True
+        shape_object.hide_render = True
 
-        print(f"Hiding {BoxmanRigControl.POLE_TARGET_SUFFIX} control shape...")
+        logger.debug("Hiding %s control shape...", BoxmanRigControl.POLE_TARGET_SUFFIX)
         pole_name = RootRigger.get_pole_target_control_name(armature_name)
-        bpy.data.objects[pole_name].hide_viewport = True
-        bpy.data.objects[pole_name].hide_render = True
+        shape_object = bpy.data.objects[pole_name]
+        shape_object.hide_viewport = True
+        shape_object.hide_render = True
 
-        print(f"Hiding {BoxmanRigControl.IK_CONTROL_SUFFIX} control shape...")
+        logger.debug("Hiding %s control shape...", BoxmanRigControl.IK_CONTROL_SUFFIX)
         ik_name = RootRigger.get_default_ik_control_name(armature_name)
-        bpy.data.objects[ik_name].hide_viewport = True
-        bpy.data.objects[ik_name].hide_render = True
+        shape_object = bpy.data.objects[ik_name]
+        shape_object.hide_viewport = True
+        shape_object.hide_render = True
 
     def queue_create_collections(self) -> None:
         """
@@ -700,9 +756,7 @@ class RootRigger(RiggerBase):
         control_collection_name = self.get_control_mesh_collection_name()
         mesh_object_collection_name = self.get_mesh_object_collection_name()
         self.stored_control_creation_fixture.append(
-            lambda context: self.create_collections(context, main_collection_name,
-                                                    control_collection_name,
-                                                    mesh_object_collection_name)
+            (self.create_collections, (main_collection_name, control_collection_name, mesh_object_collection_name))
         )
 
     @staticmethod
@@ -712,7 +766,7 @@ class RootRigger(RiggerBase):
         """
         # the main collection is linked to the scene
         main_collection = bpy.data.collections.new(main_collection_name)
-        bpy.context.scene.collection.children.link(main_collection)
+        context.scene.collection.children.link(main_collection)
 
         control_collection = bpy.data.collections.new(control_collection_name)
         main_collection.children.link(control_collection)
@@ -720,34 +774,18 @@ class RootRigger(RiggerBase):
         mesh_collection = bpy.data.collections.new(mesh_object_collection_name)
         main_collection.children.link(mesh_collection)
 
-    def queue_link_controls_to_collection(self) -> None:
+    def queue_move_controls_to_collection(self) -> None:
         """
-        Links the control template meshes to the control collection
+        Moves the control template meshes from the main scene collection to the control collection
         """
         control_collection_name = self.get_control_mesh_collection_name()
         armature_name = self.armature_object_name
-        root_name = RootRigger.get_root_control_name(armature_name)
-        ring_name = RootRigger.get_default_control_name(armature_name)
-        pole_name = RootRigger.get_pole_target_control_name(armature_name)
-        ik_name = RootRigger.get_default_ik_control_name(armature_name)
-        self.queue_link_mesh_to_collection(control_collection_name, root_name)
-        self.queue_link_mesh_to_collection(control_collection_name, ring_name)
-        self.queue_link_mesh_to_collection(control_collection_name, pole_name)
-        self.queue_link_mesh_to_collection(control_collection_name, ik_name)
-
-    def queue_unlink_control_meshes_to_collection(self) -> None:
-        """
-        Unlinks the control meshes from the main scene collection
-        """
-        armature_name = self.armature_object_name
-        root_name = RootRigger.get_root_control_name(armature_name)
-        ring_name = RootRigger.get_default_control_name(armature_name)
-        pole_name = RootRigger.get_pole_target_control_name(armature_name)
-        ik_name = RootRigger.get_default_ik_control_name(armature_name)
-        self.queue_unlink_mesh_from_collection(mesh_name=root_name)
-        self.queue_unlink_mesh_from_collection(mesh_name=ring_name)
-        self.queue_unlink_mesh_from_collection(mesh_name=pole_name)
-        self.queue_unlink_mesh_from_collection(mesh_name=ik_name)
+        self.queue_move_mesh_to_collection(control_collection_name, RootRigger.get_root_control_name(armature_name))
+        self.queue_move_mesh_to_collection(control_collection_name, RootRigger.get_default_control_name(armature_name))
+        self.queue_move_mesh_to_collection(control_collection_name,
+                                           RootRigger.get_pole_target_control_name(armature_name))
+        self.queue_move_mesh_to_collection(control_collection_name,
+                                           RootRigger.get_default_ik_control_name(armature_name))
 
     # endregion
 
@@ -760,7 +798,7 @@ class RootRigger(RiggerBase):
         current_bone_name = self.current_edit_bone.name  # this turns the reference into a constant
         armature_name = self.armature_object_name
         self.stored_control_creation_fixture.append(
-            lambda context: self.attach_root_shape(context, current_bone_name, armature_name)
+            (self.attach_root_shape, (current_bone_name, armature_name))
         )
 
     @staticmethod
@@ -768,10 +806,11 @@ class RootRigger(RiggerBase):
         """
         Creates a roll control of half a typical size
         """
-        print(f"Attaching default ring control to {current_bone_name}...")
+        logger.debug("Attaching default ring control to %s...", current_bone_name)
         name = RootRigger.get_root_control_name(armature_name)
-        bpy.data.objects[armature_name].pose.bones[current_bone_name].custom_shape = bpy.data.objects[name]
-        bpy.data.objects[armature_name].pose.bones[current_bone_name].custom_shape_scale = 0.5
+        shape_bone = get_pose_bones(armature_name)[current_bone_name]
+        shape_bone.custom_shape = bpy.data.objects[name]
+        shape_bone.custom_shape_scale = 0.5
 
     def queue_create_bone_groups(self) -> None:
         """
@@ -779,7 +818,7 @@ class RootRigger(RiggerBase):
         """
         armature_name = self.armature_object_name
         self.stored_control_creation_fixture.append(
-            lambda context: self.create_bone_groups(context, armature_name)
+            (self.create_bone_groups, (armature_name,))
         )
 
     @staticmethod
@@ -787,45 +826,19 @@ class RootRigger(RiggerBase):
         """
         Creates bone groups to color the controls
         """
-        # DEFAULT places ROOT and Defaults
-        group = bpy.data.objects[armature_name].pose.bone_groups.new()
-        group.name = BoxmanExtremityTypes.DEFAULT.value
-        group.color_set = "THEME01"
-
-        # SPINE is for... the spine
-        group = bpy.data.objects[armature_name].pose.bone_groups.new()
-        group.name = BoxmanExtremityTypes.SPINE.value
-        group.color_set = "THEME02"
-
-        # HEAD is for the neck and head controls
-        group = bpy.data.objects[armature_name].pose.bone_groups.new()
-        group.name = BoxmanExtremityTypes.HEAD.value
-        group.color_set = "THEME03"
-
-        # HAND is for the hand and fingers
-        group = bpy.data.objects[armature_name].pose.bone_groups.new()
-        group.name = BoxmanExtremityTypes.HAND.value
-        group.color_set = "THEME04"
-
-        # ARM is for the arm and its controls
-        group = bpy.data.objects[armature_name].pose.bone_groups.new()
-        group.name = BoxmanExtremityTypes.ARM.value
-        group.color_set = "THEME05"
-
-        # LEG is for the Leg and its controls
-        group = bpy.data.objects[armature_name].pose.bone_groups.new()
-        group.name = BoxmanExtremityTypes.LEG.value
-        group.color_set = "THEME06"
-
-        # FEET is for the Foot and its controls
-        group = bpy.data.objects[armature_name].pose.bone_groups.new()
-        group.name = BoxmanExtremityTypes.FEET.value
-        group.color_set = "THEME07"
-
-        # CHAIN is for the chain like controls and its ik controls
-        group = bpy.data.objects[armature_name].pose.bone_groups.new()
-        group.name = BoxmanExtremityTypes.CHAIN.value
-        group.color_set = "THEME08"
+        bone_groups = get_armature_object(armature_name).pose.bone_groups
+        specs = (
+            (_EXTREMITY_DEFAULT, "THEME01"),  # DEFAULT places ROOT and Defaults
+            (_EXTREMITY_SPINE, "THEME02"),  # SPINE is for... the spine
+            (_EXTREMITY_HEAD, "THEME03"),  # HEAD is for the neck and head controls
+            (_EXTREMITY_HAND, "THEME04"),  # HAND is for the hand and fingers
+            (_EXTREMITY_ARM, "THEME05"),  # ARM is for the arm and its controls
+            (_EXTREMITY_LEG, "THEME06"),  # LEG is for the Leg and its controls
+            (_EXTREMITY_FEET, "THEME07"),  # FEET is for the Foot and its controls
+            (_EXTREMITY_CHAIN, "THEME08"),  # CHAIN is for the chain like controls and its iks
+        )
+        for name, theme in specs:
+            bone_groups.new(name=name).color_set = theme
 
     def queue_link_armature_to_main_collection(self) -> None:
         """
@@ -834,7 +847,7 @@ class RootRigger(RiggerBase):
         main_collection_name = self.get_main_collection_name()
         armature_name = self.armature_object_name
         self.stored_control_creation_fixture.append(
-            lambda context: self.link_armature_to_main_collection(context, main_collection_name, armature_name)
+            (self.link_armature_to_main_collection, (main_collection_name, armature_name))
         )
 
     @staticmethod
@@ -843,7 +856,7 @@ class RootRigger(RiggerBase):
         Creates bone groups to color the controls
         """
         # the main collection is linked to the scene
-        armature_object = bpy.data.objects[armature_name]
+        armature_object = get_armature_object(armature_name)
         collection = bpy.data.collections[main_collection_name]
         collection.objects.link(armature_object)
 
@@ -854,21 +867,24 @@ class AccessoryRigger(RiggerBase):
     """
     This rigger is a dead end for all other riggers.
     """
+    __slots__ = ()
 
     def __init__(self, linked_object: BoxmanDTO, parent_rigger=None):
         super().__init__(linked_object, parent_rigger)
 
     def rig(self, context) -> None:
         """
-        It scans for non accessory objects, accessory objects are that, are not rigged
+        It scans for non accessory objects, accessory objects are that, are not rigged.
+        The whole accessory tree is walked with a stack from this rigger, without a rigger per child.
         """
-        print(f"Accessory rigger at {self.linked_object.properties.name}, all children ignored...")
+        logger.debug("Accessory rigger at %s, all children ignored...", self.linked_object.properties.name)
 
-        self.queue_link_mesh_to_collection(self.get_mesh_object_collection_name())
-        self.queue_unlink_mesh_from_collection()
-        for child_object in self.linked_object.children:
-            accessory_rigger = AccessoryRigger(child_object, self)
-            accessory_rigger.rig(context)
+        collection_name = self.get_mesh_object_collection_name()
+        pending = [self.linked_object]
+        while pending:
+            current = pending.pop()
+            self.queue_move_mesh_to_collection(collection_name, current.get_object_name())
+            pending.extend(reversed(current.children))
 
 
 class DefaultRigger(RiggerBase):
@@ -876,6 +892,7 @@ class DefaultRigger(RiggerBase):
     The default rigger is the one that you should choose if you don't know what you are doing,
     This chains the bone creation of any structure and replaces the bones with the default ring track ball.
     """
+    __slots__ = ()
 
     def __init__(self, linked_object: BoxmanDTO, parent_rigger=None):
         super().__init__(linked_object, parent_rigger)
@@ -885,16 +902,11 @@ class DefaultRigger(RiggerBase):
         It creates a bone with the default shape and parents it to the current boxman object.
         In the default class, it handles all types of children, is the most generic of them all.
         """
-        print(f"Generating default rig for {self.linked_object.properties.name}.")
+        logger.debug("Generating default rig for %s.", self.linked_object.properties.name)
 
-        bpy.ops.armature.bone_primitive_add()
-        bpy.ops.armature.select_linked()
-        newly_created = bpy.context.selected_bones
-        self.current_edit_bone = newly_created[0]
+        self.current_edit_bone = self.add_edit_bone()
 
-        self.current_edit_bone.head.x = self.linked_object.location[0]
-        self.current_edit_bone.head.y = self.linked_object.location[1]
-        self.current_edit_bone.head.z = self.linked_object.location[2]
+        self.current_edit_bone.head = self.linked_object.location
         self.current_edit_bone.name = self.linked_object.get_object_name()
 
         # there ere 3 possibilities
@@ -902,9 +914,8 @@ class DefaultRigger(RiggerBase):
         if len(self.linked_object.children) == 0:
             # if its the end of a chain, it places the tail in the mean
             typical_offset = self.get_typical_size()
-            self.current_edit_bone.tail.x = self.current_edit_bone.head.x + typical_offset
-            self.current_edit_bone.tail.y = self.current_edit_bone.head.y
-            self.current_edit_bone.tail.z = self.current_edit_bone.head.z
+            head = self.current_edit_bone.head
+            self.current_edit_bone.tail = (head.x + typical_offset, head.y, head.z)
 
             self.queue()
             return  # its end of a link
@@ -922,14 +933,11 @@ class DefaultRigger(RiggerBase):
             if child_bone is not None:  # there might be boneless riggers
                 child_bone.parent = self.current_edit_bone
                 child_bone.use_connect = True  # this is only valid for the root bone
-                self.current_edit_bone.tail.x = child_object.location[0]
-                self.current_edit_bone.tail.y = child_object.location[1]
-                self.current_edit_bone.tail.z = child_object.location[2]
+                self.current_edit_bone.tail = child_object.location
             else:
                 typical_offset = self.get_typical_size()
-                self.current_edit_bone.tail.x = self.current_edit_bone.head.x + typical_offset
-                self.current_edit_bone.tail.y = self.current_edit_bone.head.y
-                self.current_edit_bone.tail.z = self.current_edit_bone.head.z
+                head = self.current_edit_bone.head
+                self.current_edit_bone.tail = (head.x + typical_offset, head.y, head.z)
 
             self.queue()
             return
@@ -941,23 +949,22 @@ class DefaultRigger(RiggerBase):
         # it parents the results without connecting the bones
 
         typical_offset = self.get_typical_size()
-        self.current_edit_bone.tail.x = self.current_edit_bone.head.x + typical_offset
-        self.current_edit_bone.tail.y = self.current_edit_bone.head.y
-        self.current_edit_bone.tail.z = self.current_edit_bone.head.z
+        head = self.current_edit_bone.head
+        self.current_edit_bone.tail = (head.x + typical_offset, head.y, head.z)
 
+        factory: RiggerFactoryBase = self.rigger_factory
+        current_edit_bone = self.current_edit_bone
         for linked_child in self.linked_object.children:
             child_object: BoxmanDTO = linked_child
-
-            factory: RiggerFactoryBase = self.rigger_factory
             child_rigger: RiggerBase = factory.create_rigger(child_object, self)
             child_rigger.rig(context)
             child_bone = child_rigger.current_edit_bone
             if child_bone is not None:  # there might be boneless riggers
-                child_bone.parent = self.current_edit_bone
+                child_bone.parent = current_edit_bone
                 child_bone.use_connect = False  # this is only valid for the root bone
 
         self.queue()
-        print(f"Generated default rig for {self.linked_object.properties.name}!")
+        logger.debug("Generated default rig for %s!", self.linked_object.properties.name)
 
     def queue(self) -> None:
         """
@@ -965,11 +972,10 @@ class DefaultRigger(RiggerBase):
         """
         self.queue_parent_object_to_rig()
         self.queue_attach_default_shape()
-        self.queue_add_bone_to_group(BoxmanExtremityTypes.DEFAULT.value, self.current_edit_bone.name)
+        self.queue_add_bone_to_group(_EXTREMITY_DEFAULT, self.current_edit_bone.name)
         self.queue_add_bone_to_layers([RiggerBase.GLOBAL_LAYER_INDEX, RiggerBase.MINORS_LAYER_INDEX],
                                       self.current_edit_bone.name)
-        self.queue_link_mesh_to_collection(self.get_mesh_object_collection_name())
-        self.queue_unlink_mesh_from_collection()
+        self.queue_move_mesh_to_collection(self.get_mesh_object_collection_name())
 
     def queue_attach_default_shape(self) -> None:
         """
@@ -978,7 +984,7 @@ class DefaultRigger(RiggerBase):
         current_bone_name = self.current_edit_bone.name  # this turns the reference into a constant
         armature_name = self.armature_object_name
         self.stored_control_creation_fixture.append(
-            lambda context: self.attach_ring_shape(context, current_bone_name, armature_name)
+            (self.attach_ring_shape, (current_bone_name, armature_name))
         )
 
     @staticmethod
@@ -986,10 +992,11 @@ class DefaultRigger(RiggerBase):
         """
         Creates a roll control of half a typical size
         """
-        print(f"Attaching default ring control to {current_bone_name}...")
-        name = f"{armature_name}_{BoxmanRigControl.DEFAULT_CONTROL_NAME}_{BoxmanRigControl.DEFAULT_CONTROL_SUFFIX}"
-        bpy.data.objects[armature_name].pose.bones[current_bone_name].custom_shape = bpy.data.objects[name]
-        bpy.data.objects[armature_name].pose.bones[current_bone_name].custom_shape_scale = 0.5
+        logger.debug("Attaching default ring control to %s...", current_bone_name)
+        name = RootRigger.get_default_control_name(armature_name)
+        shape_bone = get_pose_bones(armature_name)[current_bone_name]
+        shape_bone.custom_shape = bpy.data.objects[name]
+        shape_bone.custom_shape_scale = 0.5
 
     def queue_hide_current_bone(self) -> None:
         """
@@ -999,7 +1006,7 @@ class DefaultRigger(RiggerBase):
         armature_name = self.armature_object_name
 
         self.stored_control_creation_fixture.append(
-            lambda context: self.hide_current_bone(context, current_bone_name, armature_name)
+            (self.hide_current_bone, (current_bone_name, armature_name))
         )
 
     @staticmethod
@@ -1007,11 +1014,11 @@ class DefaultRigger(RiggerBase):
         """
         Hides the current bone
         """
-        print(f"Hiding bone {current_bone_name}...")
+        logger.debug("Hiding bone %s...", current_bone_name)
 
-        target_bone = bpy.data.objects[armature_name].pose.bones[current_bone_name]
-        target_bone.bone.layers[RiggerBase.GLOBAL_LAYER_INDEX] = True
-        target_bone.bone.layers[RiggerBase.DEFAULT_LAYER_INDEX] = False
+        layers = get_pose_bones(armature_name)[current_bone_name].bone.layers
+        layers[RiggerBase.GLOBAL_LAYER_INDEX] = True
+        layers[RiggerBase.DEFAULT_LAYER_INDEX] = False
 
 
 class PoleTargetRigger(DefaultRigger):
@@ -1019,6 +1026,8 @@ class PoleTargetRigger(DefaultRigger):
     The pole target rigger is a base implementation, abstract.
     It can generate pole target controls and attach their shapes.
     """
+    __slots__ = ("offset_sign",)
+
     def __init__(self, linked_object: BoxmanDTO, parent_rigger=None):
         super().__init__(linked_object, parent_rigger)
         self.offset_sign = 1
@@ -1034,23 +1043,17 @@ class PoleTargetRigger(DefaultRigger):
         Creates a control bone placed with an offset relative to the typical size of the boxman object.
         The control is parented to the absolute Root.
         """
-        print(f"Generating pole target control bone for {self.linked_object.properties.name}...")
-        bpy.ops.armature.bone_primitive_add()
-        bpy.ops.armature.select_linked()
-        newly_created = bpy.context.selected_bones
-        self.control_bone = newly_created[0]
+        logger.debug("Generating pole target control bone for %s...", self.linked_object.properties.name)
+        self.control_bone = self.add_edit_bone()
 
         x_offset = self.get_typical_size()
         x_size_offset = self.parent_rigger.get_typical_size() # places the control distanced with the parent
-        self.control_bone.head.x = self.current_edit_bone.head.x + x_size_offset * self.offset_sign
-        self.control_bone.head.y = self.current_edit_bone.head.y
-        self.control_bone.head.z = self.current_edit_bone.head.z
+        head = self.current_edit_bone.head
+        self.control_bone.head = (head.x + x_size_offset * self.offset_sign, head.y, head.z)
         self.control_bone.name = f"{self.current_edit_bone.name}_" \
                                  f"{BoxmanRigControl.POLE_TARGET_SUFFIX}_{BoxmanRigControl.DEFAULT_CONTROL_SUFFIX}"
 
-        self.control_bone.tail.x = self.current_edit_bone.head.x + (x_size_offset + x_offset) * self.offset_sign
-        self.control_bone.tail.y = self.current_edit_bone.head.y
-        self.control_bone.tail.z = self.current_edit_bone.head.z
+        self.control_bone.tail = (head.x + (x_size_offset + x_offset) * self.offset_sign, head.y, head.z)
 
     def queue_attach_default_shape(self) -> None:
         """
@@ -1059,7 +1062,7 @@ class PoleTargetRigger(DefaultRigger):
         control_bone_name = self.control_bone.name
         armature_name = self.armature_object_name
         self.stored_control_creation_fixture.append(
-            lambda context: self.attach_pole_target_shape(context, control_bone_name, armature_name)
+            (self.attach_pole_target_shape, (control_bone_name, armature_name))
         )
 
     @staticmethod
@@ -1067,16 +1070,18 @@ class PoleTargetRigger(DefaultRigger):
         """
         Attaches the pole target mesh to the control bone
         """
-        print(f"Attaching pole control shape to {control_bone_name}...")
+        logger.debug("Attaching pole control shape to %s...", control_bone_name)
         name = RootRigger.get_pole_target_control_name(armature_name)
-        bpy.data.objects[armature_name].pose.bones[control_bone_name].custom_shape = bpy.data.objects[name]
-        bpy.data.objects[armature_name].pose.bones[control_bone_name].custom_shape_scale = 2.0
+        shape_bone = get_pose_bones(armature_name)[control_bone_name]
+        shape_bone.custom_shape = bpy.data.objects[name]
+        shape_bone.custom_shape_scale = 2.0
 
 
 class IkControlRigger(DefaultRigger):
     """
     This rigger is super important, it can handle the creation of IK controls.
     """
+    __slots__ = ("pole_target_bone", "pole_target_offset", "place_on_head", "affect_parent", "angle_orient")
 
     def __init__(self, linked_object: BoxmanDTO, parent_rigger=None):
         super().__init__(linked_object, parent_rigger)
@@ -1098,27 +1103,18 @@ class IkControlRigger(DefaultRigger):
         It creates a control bone placed with an x offset relative to the typical size.
         The control is parented to the absolute Root if the absolute argument is true
         """
-        print(f"Generating IK control bone for {self.linked_object.properties.name}...")
-        bpy.ops.armature.bone_primitive_add()
-        bpy.ops.armature.select_linked()
-        newly_created = bpy.context.selected_bones
-        self.control_bone = newly_created[0]
+        logger.debug("Generating IK control bone for %s...", self.linked_object.properties.name)
+        self.control_bone = self.add_edit_bone()
 
         x_offset = self.get_typical_size()
         if self.place_on_head:
-            self.control_bone.head.x = self.current_edit_bone.head.x
-            self.control_bone.head.y = self.current_edit_bone.head.y
-            self.control_bone.head.z = self.current_edit_bone.head.z
-            self.control_bone.tail.x = self.current_edit_bone.head.x + x_offset
-            self.control_bone.tail.y = self.current_edit_bone.head.y
-            self.control_bone.tail.z = self.current_edit_bone.head.z
+            self.control_bone.head = self.current_edit_bone.head
+            head = self.current_edit_bone.head
+            self.control_bone.tail = (head.x + x_offset, head.y, head.z)
         else:
-            self.control_bone.head.x = self.current_edit_bone.tail.x
-            self.control_bone.head.y = self.current_edit_bone.tail.y
-            self.control_bone.head.z = self.current_edit_bone.tail.z
-            self.control_bone.tail.x = self.current_edit_bone.tail.x + x_offset
-            self.control_bone.tail.y = self.current_edit_bone.tail.y
-            self.control_bone.tail.z = self.current_edit_bone.tail.z
+            self.control_bone.head = self.current_edit_bone.tail
+            tail = self.current_edit_bone.tail
+            self.control_bone.tail = (tail.x + x_offset, tail.y, tail.z)
 
         self.control_bone.name = f"{self.current_edit_bone.name}_" \
                                  f"{BoxmanRigControl.IK_CONTROL_SUFFIX}_{BoxmanRigControl.DEFAULT_CONTROL_SUFFIX}"
@@ -1152,9 +1148,8 @@ class IkControlRigger(DefaultRigger):
             pole_target_bone = self.pole_target_bone.name
 
         self.stored_control_creation_fixture.append(
-            lambda context: self.create_ik_constraint(context, ik_affected_bone_name,
-                                                      current_bone_control_name, armature_name, pole_target_bone,
-                                                      pole_target_angle, chain_length)
+            (self.create_ik_constraint, (ik_affected_bone_name, current_bone_control_name, armature_name,
+                                         pole_target_bone, pole_target_angle, chain_length))
         )
 
     def get_angle_orient(self) -> float:
@@ -1164,28 +1159,12 @@ class IkControlRigger(DefaultRigger):
         :return:
         The angle used for the pole target
         """
-        angle = 0.0
-        if self.pole_target_offset == 1:
-            # if the orientation is negative
-            if self.linked_object.properties.orientation == BoxmanOrientations.L.value:
-                angle = 0.0
-            elif self.linked_object.properties.orientation == BoxmanOrientations.R.value:
-                angle = -105.0
-            else:
-                angle = 0.0
-        elif self.pole_target_offset == -1:
-            print(f"ORIENTATION AT {self.linked_object.properties.orientation}")
-            # if the orientation is negative
-            if self.linked_object.properties.orientation == BoxmanOrientations.L.value:
-                angle = 180.0
-            elif self.linked_object.properties.orientation == BoxmanOrientations.R.value:
-                angle = 75.0
-            else:
-                angle = 180.0
-        else:
+        if self.pole_target_offset not in (1, -1):
             raise ValueError()
 
-        return angle
+        default_angle = 0.0 if self.pole_target_offset == 1 else 180.0
+        return _POLE_ANGLE_TABLE.get((self.pole_target_offset, self.linked_object.properties.orientation),
+                                     default_angle)
 
     @staticmethod
     def create_ik_constraint(context, ik_affected_bone_name, current_bone_control_name,
@@ -1195,22 +1174,23 @@ class IkControlRigger(DefaultRigger):
         if the control is declared before calling the queue.
         The Ik control exists this method with its shape assigned.
         """
-        print(f"Generating IK constraint for {ik_affected_bone_name}...")
-        armature = bpy.data.objects[armature_name]
-        ik_target_bone = bpy.data.objects[armature_name].pose.bones[ik_affected_bone_name]
-        constraint = ik_target_bone.constraints.new("IK")
+        logger.debug("Generating IK constraint for %s...", ik_affected_bone_name)
+        armature = get_armature_object(armature_name)
+        pose_bones = get_pose_bones(armature_name)
+        constraint = pose_bones[ik_affected_bone_name].constraints.new("IK")
         constraint.target = armature
         constraint.subtarget = current_bone_control_name
         constraint.chain_count = chain_length
         if pole_target_bone_name is not None:
-            print("Adding pole target...")
+            logger.debug("Adding pole target...")
             constraint.pole_target = armature
             constraint.pole_subtarget = pole_target_bone_name
             constraint.pole_angle = radians(angle)
 
-        name = f"{armature_name}_{BoxmanRigControl.IK_CONTROL_SUFFIX}_{BoxmanRigControl.DEFAULT_CONTROL_SUFFIX}"
-        bpy.data.objects[armature_name].pose.bones[current_bone_control_name].custom_shape = bpy.data.objects[name]
-        bpy.data.objects[armature_name].pose.bones[current_bone_control_name].custom_shape_scale = 1
+        name = RootRigger.get_default_ik_control_name(armature_name)
+        shape_bone = pose_bones[current_bone_control_name]
+        shape_bone.custom_shape = bpy.data.objects[name]
+        shape_bone.custom_shape_scale = 1
 
 # endregion
 
@@ -1223,6 +1203,8 @@ class ShoulderRigger(DefaultRigger):
     This class creates a rig that places a control outside the mesh at typical distance unit on X
     and applies a same rotation constraint.
     """
+    __slots__ = ("mandatory", "non_mandatory")
+
     def __init__(self, linked_object: BoxmanDTO, parent_rigger=None):
         super().__init__(linked_object, parent_rigger)
         self.mandatory = []
@@ -1250,17 +1232,12 @@ class ShoulderRigger(DefaultRigger):
         This rig creates a hidden bone with a proxy control for rotations.
         The rotation control is parented to the same object as the original bone.
         """
-        print(f"Generating shoulder rig for {self.linked_object.properties.name}...")
+        logger.debug("Generating shoulder rig for %s...", self.linked_object.properties.name)
         self.verify_chain()
 
         # We create the bone as in the default scenario
-        bpy.ops.armature.bone_primitive_add()
-        bpy.ops.armature.select_linked()
-        newly_created = bpy.context.selected_bones
-        self.current_edit_bone = newly_created[0]
-        self.current_edit_bone.head.x = self.linked_object.location[0]
-        self.current_edit_bone.head.y = self.linked_object.location[1]
-        self.current_edit_bone.head.z = self.linked_object.location[2]
+        self.current_edit_bone = self.add_edit_bone()
+        self.current_edit_bone.head = self.linked_object.location
         self.current_edit_bone.name = self.linked_object.get_object_name()
 
         # If the child is only one, the target of the tail is the position of the next member of the chain
@@ -1273,9 +1250,7 @@ class ShoulderRigger(DefaultRigger):
         child_bone.parent = self.current_edit_bone
         child_bone.use_connect = True  # this is only valid for the root bone
 
-        self.current_edit_bone.tail.x = child_object.location[0]
-        self.current_edit_bone.tail.y = child_object.location[1]
-        self.current_edit_bone.tail.z = child_object.location[2]
+        self.current_edit_bone.tail = child_object.location
 
         # then we handle the non mandatory children
         for child in self.non_mandatory:
@@ -1291,26 +1266,21 @@ class ShoulderRigger(DefaultRigger):
         # the coordinate and the order of the displacement can be other parameters of the joint type assign,
         # but it works for now
         x_offset = self.get_typical_size()
-        bpy.ops.armature.bone_primitive_add()
-        bpy.ops.armature.select_linked()
-        newly_created = bpy.context.selected_bones
-        self.control_bone = newly_created[0]
-        self.control_bone.head.x = self.current_edit_bone.head.x + x_offset
-        self.control_bone.head.y = self.current_edit_bone.head.y
-        self.control_bone.head.z = self.current_edit_bone.head.z
+        self.control_bone = self.add_edit_bone()
+        head = self.current_edit_bone.head
+        self.control_bone.head = (head.x + x_offset, head.y, head.z)
         self.control_bone.name = f"{self.current_edit_bone.name}_{BoxmanRigControl.DEFAULT_CONTROL_SUFFIX}"
 
         # If the child is only one, the target of the tail is the position of the next member of the chain
-        self.control_bone.tail.x = self.current_edit_bone.tail.x + x_offset
-        self.control_bone.tail.y = self.current_edit_bone.tail.y
-        self.control_bone.tail.z = self.current_edit_bone.tail.z
+        tail = self.current_edit_bone.tail
+        self.control_bone.tail = (tail.x + x_offset, tail.y, tail.z)
 
         # the control is parented to the parent
         self.control_bone.parent = self.parent_rigger.current_edit_bone
         self.control_bone.use_connect = False
 
         self.queue()
-        print(f"Generated shoulder rig for {self.linked_object.properties.name}!")
+        logger.debug("Generated shoulder rig for %s!", self.linked_object.properties.name)
 
     def queue(self) -> None:
         """
@@ -1319,7 +1289,7 @@ class ShoulderRigger(DefaultRigger):
         self.queue_parent_object_to_rig() # this is the same
         self.queue_create_shoulder_constraint() # this changes
         self.queue_hide_current_bone() # hides the bone overtaken by the control
-        self.queue_add_bone_to_group(BoxmanExtremityTypes.ARM.value, self.control_bone.name)
+        self.queue_add_bone_to_group(_EXTREMITY_ARM, self.control_bone.name)
         self.queue_add_bone_to_layers([RiggerBase.GLOBAL_LAYER_INDEX,
                                        RiggerBase.ARM_LAYER_INDEX],
                                       self.current_edit_bone.name)
@@ -1328,8 +1298,7 @@ class ShoulderRigger(DefaultRigger):
                                        RiggerBase.CONTROL_LAYER_INDEX,
                                        RiggerBase.ARM_LAYER_INDEX],
                                       self.control_bone.name)
-        self.queue_link_mesh_to_collection(self.get_mesh_object_collection_name())
-        self.queue_unlink_mesh_from_collection()
+        self.queue_move_mesh_to_collection(self.get_mesh_object_collection_name())
 
     def queue_create_shoulder_constraint(self) -> None:
         """
@@ -1340,8 +1309,7 @@ class ShoulderRigger(DefaultRigger):
         armature_name = self.armature_object_name
 
         self.stored_control_creation_fixture.append(
-            lambda context: self.create_shoulder_constraint(context, current_bone_name,
-                                                            current_bone_control_name, armature_name)
+            (self.create_shoulder_constraint, (current_bone_name, current_bone_control_name, armature_name))
         )
 
     @staticmethod
@@ -1349,15 +1317,16 @@ class ShoulderRigger(DefaultRigger):
         """
         Creates a constraint of same rotation over the control
         """
-        print(f"Attaching shoulder ring control to {current_bone_name}...")
+        logger.debug("Attaching shoulder ring control to %s...", current_bone_name)
         name = RootRigger.get_default_control_name(armature_name)
-        armature = bpy.data.objects[armature_name]
-        current_bone = bpy.data.objects[armature_name].pose.bones[current_bone_name]
+        armature = get_armature_object(armature_name)
+        current_bone = get_pose_bones(armature_name)[current_bone_name]
         constraint = current_bone.constraints.new("COPY_ROTATION")
         constraint.target = armature
         constraint.subtarget = current_bone_control_name
-        bpy.data.objects[armature_name].pose.bones[current_bone_control_name].custom_shape = bpy.data.objects[name]
-        bpy.data.objects[armature_name].pose.bones[current_bone_control_name].custom_shape_scale = 0.5
+        shape_bone = get_pose_bones(armature_name)[current_bone_control_name]
+        shape_bone.custom_shape = bpy.data.objects[name]
+        shape_bone.custom_shape_scale = 0.5
 
 
 class HumerusRigger(DefaultRigger):
@@ -1367,6 +1336,8 @@ class HumerusRigger(DefaultRigger):
     whatever its in between. Its also used to type check the parent of the radius rigger
     so it can set the Iks controls
     """
+    __slots__ = ("mandatory", "non_mandatory")
+
     def __init__(self, linked_object: BoxmanDTO, parent_rigger=None):
         super().__init__(linked_object, parent_rigger)
         self.mandatory = []
@@ -1394,17 +1365,12 @@ class HumerusRigger(DefaultRigger):
         Similar to the default rig, only difference is that it expects at least one child of radius type.
         The idea is that it guaranties that the radius has at least two bones for the IK.
         """
-        print(f"Generating humerus rig for {self.linked_object.properties.name}...")
+        logger.debug("Generating humerus rig for %s...", self.linked_object.properties.name)
 
         self.verify_chain()
         # We create the bone as in the default scenario
-        bpy.ops.armature.bone_primitive_add()
-        bpy.ops.armature.select_linked()
-        newly_created = bpy.context.selected_bones
-        self.current_edit_bone = newly_created[0]
-        self.current_edit_bone.head.x = self.linked_object.location[0]
-        self.current_edit_bone.head.y = self.linked_object.location[1]
-        self.current_edit_bone.head.z = self.linked_object.location[2]
+        self.current_edit_bone = self.add_edit_bone()
+        self.current_edit_bone.head = self.linked_object.location
         self.current_edit_bone.name = self.linked_object.get_object_name()
 
         child_object: BoxmanDTO = self.mandatory[0]
@@ -1415,9 +1381,7 @@ class HumerusRigger(DefaultRigger):
         child_bone = child_rigger.current_edit_bone
         child_bone.parent = self.current_edit_bone
         child_bone.use_connect = True  # this is only valid for the root bone
-        self.current_edit_bone.tail.x = child_object.location[0]
-        self.current_edit_bone.tail.y = child_object.location[1]
-        self.current_edit_bone.tail.z = child_object.location[2]
+        self.current_edit_bone.tail = child_object.location
 
         # then we handle the non mandatory children
         for child in self.non_mandatory:
@@ -1430,47 +1394,40 @@ class HumerusRigger(DefaultRigger):
                 child_bone.use_connect = False
 
         self.queue_parent_object_to_rig()  # this is the same
-        self.queue_add_bone_to_group(BoxmanExtremityTypes.ARM.value, self.current_edit_bone.name)
+        self.queue_add_bone_to_group(_EXTREMITY_ARM, self.current_edit_bone.name)
         self.queue_add_bone_to_layers([RiggerBase.GLOBAL_LAYER_INDEX,
                                        RiggerBase.MAYORS_LAYER_INDEX,
                                        RiggerBase.ARM_LAYER_INDEX],
                                       self.current_edit_bone.name)
-        self.queue_link_mesh_to_collection(self.get_mesh_object_collection_name())
-        self.queue_unlink_mesh_from_collection()
-        print(f"Generated humerus rig for {self.linked_object.properties.name}!")
+        self.queue_move_mesh_to_collection(self.get_mesh_object_collection_name())
+        logger.debug("Generated humerus rig for %s!", self.linked_object.properties.name)
 
 
 class ElbowRigger(PoleTargetRigger):
     """
     The elbow rigger is a dead end with a hidden bone that places a pole target.
     """
+    __slots__ = ()
 
     def __init__(self, linked_object: BoxmanDTO, parent_rigger=None):
         super().__init__(linked_object, parent_rigger)
         if len(self.linked_object.children) > 0:
-            print("The elbow rigger is a dead end! potential data loss detected!!!!")
+            logger.warning("The elbow rigger is a dead end! potential data loss detected!!!!")
         self.offset_sign = -1
 
     def rig(self, context) -> None:
         """
         Creates a hidden bone and creates a pole target control
         """
-        print(f"Generating elbow rig for {self.linked_object.properties.name}...")
+        logger.debug("Generating elbow rig for %s...", self.linked_object.properties.name)
         # this works as the default rigger of a disconnected parent
-        bpy.ops.armature.bone_primitive_add()
-        bpy.ops.armature.select_linked()
-        newly_created = bpy.context.selected_bones
-        self.current_edit_bone = newly_created[0]
-
-        self.current_edit_bone.head.x = self.linked_object.location[0]
-        self.current_edit_bone.head.y = self.linked_object.location[1]
-        self.current_edit_bone.head.z = self.linked_object.location[2]
+        self.current_edit_bone = self.add_edit_bone()
+
+        self.current_edit_bone.head = self.linked_object.location
         self.current_edit_bone.name = self.linked_object.get_object_name()
 
         mean = self.get_mesh_mean_point()
-        self.current_edit_bone.tail.x = mean[0]
-        self.current_edit_bone.tail.y = mean[1]
-        self.current_edit_bone.tail.z = mean[2]
+        self.current_edit_bone.tail = mean
 
         self.create_control_bone()
         self.control_bone.parent = self.local_control_root.current_edit_bone
@@ -1478,8 +1435,8 @@ class ElbowRigger(PoleTargetRigger):
 
         self.queue_hide_current_bone()
         self.queue_attach_default_shape()
-        self.queue_add_bone_to_group(BoxmanExtremityTypes.ARM.value, self.current_edit_bone.name)
-        self.queue_add_bone_to_group(BoxmanExtremityTypes.ARM.value, self.control_bone.name)
+        self.queue_add_bone_to_group(_EXTREMITY_ARM, self.current_edit_bone.name)
+        self.queue_add_bone_to_group(_EXTREMITY_ARM, self.control_bone.name)
 
         self.queue_add_bone_to_layers([RiggerBase.GLOBAL_LAYER_INDEX,
                                        RiggerBase.ARM_LAYER_INDEX],
@@ -1489,9 +1446,8 @@ class ElbowRigger(PoleTargetRigger):
                                        RiggerBase.MAYORS_LAYER_INDEX,
                                        RiggerBase.ARM_LAYER_INDEX],
                                       self.control_bone.name)
-        self.queue_link_mesh_to_collection(self.get_mesh_object_collection_name())
-        self.queue_unlink_mesh_from_collection()
-        print(f"Generated elbow rig for {self.linked_object.properties.name}!")
+        self.queue_move_mesh_to_collection(self.get_mesh_object_collection_name())
+        logger.debug("Generated elbow rig for %s!", self.linked_object.properties.name)
 
 
 class HandRootRigger(IkControlRigger):
@@ -1499,6 +1455,7 @@ class HandRootRigger(IkControlRigger):
     This rigger creates a rig for the hand, no mandatory bones, but it creates an IK control for the
     two previous bones in the chain.
     """
+    __slots__ = ()
 
     def __init__(self, linked_object: BoxmanDTO, parent_rigger=None):
         super().__init__(linked_object, parent_rigger)
@@ -1520,8 +1477,8 @@ class HandRootRigger(IkControlRigger):
         self.create_control_bone(False)
         self.queue_create_ik_constraint()
         self.queue_add_rotation_constraint()
-        self.queue_add_bone_to_group(BoxmanExtremityTypes.HAND.value, self.current_edit_bone.name)
-        self.queue_add_bone_to_group(BoxmanExtremityTypes.ARM.value, self.control_bone.name)
+        self.queue_add_bone_to_group(_EXTREMITY_HAND, self.current_edit_bone.name)
+        self.queue_add_bone_to_group(_EXTREMITY_ARM, self.control_bone.name)
         self.queue_add_bone_to_layers([RiggerBase.GLOBAL_LAYER_INDEX,
                                        RiggerBase.HAND_LAYER_INDEX,
                                        RiggerBase.ARM_LAYER_INDEX],
@@ -1531,8 +1488,7 @@ class HandRootRigger(IkControlRigger):
                                        RiggerBase.MAYORS_LAYER_INDEX,
                                        RiggerBase.ARM_LAYER_INDEX],
                                       self.control_bone.name)
-        self.queue_link_mesh_to_collection(self.get_mesh_object_collection_name())
-        self.queue_unlink_mesh_from_collection()
+        self.queue_move_mesh_to_collection(self.get_mesh_object_collection_name())
 
     def queue_add_rotation_constraint(self):
         """
@@ -1543,8 +1499,7 @@ class HandRootRigger(IkControlRigger):
         ik_control_bone_name = self.control_bone.name  # this turns the reference into a constant
 
         self.stored_control_creation_fixture.append(
-            lambda context: self.add_rotation_constraint(context, ik_control_bone_name,
-                                                         current_edit_bone_name, armature_name)
+            (self.add_rotation_constraint, (ik_control_bone_name, current_edit_bone_name, armature_name))
         )
 
     @staticmethod
@@ -1552,9 +1507,9 @@ class HandRootRigger(IkControlRigger):
         """
         Creates a copy location constraint to the parent bone
         """
-        print(f"Adding rotation constraints to {current_edit_bone_name}...")
-        armature = bpy.data.objects[armature_name]
-        current_bone = bpy.data.objects[armature_name].pose.bones[current_edit_bone_name]
+        logger.debug("Adding rotation constraints to %s...", current_edit_bone_name)
+        armature = get_armature_object(armature_name)
+        current_bone = get_pose_bones(armature_name)[current_edit_bone_name]
         constraint = current_bone.constraints.new("COPY_ROTATION")
         constraint.target = armature
         constraint.subtarget = ik_control_bone_name
@@ -1568,6 +1523,7 @@ class RadiusRigger(DefaultRigger):
     The radius creates a default rig expecting one hand root child, to use for IK constraints.
     If it has an elbow child, it uses it as pole target.
     """
+    __slots__ = ("mandatory", "non_mandatory")
 
     def __init__(self, linked_object: BoxmanDTO, parent_rigger=None):
         super().__init__(linked_object, parent_rigger)
@@ -1597,16 +1553,11 @@ class RadiusRigger(DefaultRigger):
         The pole target is optional, and the bone is not invisible so that the pole target can be adjusted if needed.
         """
 
-        print(f"Generating radius rig for {self.linked_object.properties.name}...")
+        logger.debug("Generating radius rig for %s...", self.linked_object.properties.name)
         self.verify_chain()
         # We create the bone as in the default scenario
-        bpy.ops.armature.bone_primitive_add()
-        bpy.ops.armature.select_linked()
-        newly_created = bpy.context.selected_bones
-        self.current_edit_bone = newly_created[0]
-        self.current_edit_bone.head.x = self.linked_object.location[0]
-        self.current_edit_bone.head.y = self.linked_object.location[1]
-        self.current_edit_bone.head.z = self.linked_object.location[2]
+        self.current_edit_bone = self.add_edit_bone()
+        self.current_edit_bone.head = self.linked_object.location
         self.current_edit_bone.name = self.linked_object.get_object_name()
 
         # we handle the non mandatory first to have the name of the pole target, if any
@@ -1639,23 +1590,21 @@ class RadiusRigger(DefaultRigger):
         child_bone.parent = self.current_edit_bone
         child_bone.use_connect = True  # this is only valid for the root bone
 
-        self.current_edit_bone.tail.x = child_object.location[0]
-        self.current_edit_bone.tail.y = child_object.location[1]
-        self.current_edit_bone.tail.z = child_object.location[2]
+        self.current_edit_bone.tail = child_object.location
         self.queue_parent_object_to_rig()
-        self.queue_add_bone_to_group(BoxmanExtremityTypes.ARM.value, self.current_edit_bone.name)
+        self.queue_add_bone_to_group(_EXTREMITY_ARM, self.current_edit_bone.name)
         self.queue_add_bone_to_layers([RiggerBase.GLOBAL_LAYER_INDEX,
                                        RiggerBase.ARM_LAYER_INDEX],
                                       self.current_edit_bone.name)
-        self.queue_link_mesh_to_collection(self.get_mesh_object_collection_name())
-        self.queue_unlink_mesh_from_collection()
-        print(f"Generated radius rig for {self.linked_object.properties.name}!")
+        self.queue_move_mesh_to_collection(self.get_mesh_object_collection_name())
+        logger.debug("Generated radius rig for %s!", self.linked_object.properties.name)
 
 
 class FingerRiggerBase(DefaultRigger):
     """
     Base class of the finger riggers
     """
+    __slots__ = ()
 
     def __init__(self, linked_object: BoxmanDTO, parent_rigger=None):
         super().__init__(linked_object, parent_rigger)
@@ -1673,6 +1622,7 @@ class FingerSectionRigger(FingerRiggerBase):
     The finger rigger acts as a default rigger that doesnt hide the bone.
     It can accept and pass a rotation control to children of the same type.
     """
+    __slots__ = ()
 
     def __init__(self, linked_object: BoxmanDTO, parent_rigger=None):
         super().__init__(linked_object, parent_rigger)
@@ -1682,25 +1632,18 @@ class FingerSectionRigger(FingerRiggerBase):
         Handles the creation of children bones the same way a default rigger do,
         except that the bones arent hidden
         """
-        print(f"Generating finger rig for {self.linked_object.properties.name}.")
+        logger.debug("Generating finger rig for %s.", self.linked_object.properties.name)
 
-        bpy.ops.armature.bone_primitive_add()
-        bpy.ops.armature.select_linked()
-        newly_created = bpy.context.selected_bones
-        self.current_edit_bone = newly_created[0]
+        self.current_edit_bone = self.add_edit_bone()
 
-        self.current_edit_bone.head.x = self.linked_object.location[0]
-        self.current_edit_bone.head.y = self.linked_object.location[1]
-        self.current_edit_bone.head.z = self.linked_object.location[2]
+        self.current_edit_bone.head = self.linked_object.location
         self.current_edit_bone.name = self.linked_object.get_object_name()
 
         # there ere 3 possibilities
         mean = self.get_mesh_mean_point()
         # if: it's end of a chain
         if len(self.linked_object.children) == 0:
-            self.current_edit_bone.tail.x = mean[0]
-            self.current_edit_bone.tail.y = mean[1]
-            self.current_edit_bone.tail.z = mean[2]
+            self.current_edit_bone.tail = mean
 
             self.queue()
             return  # its end of a link
@@ -1721,13 +1664,9 @@ class FingerSectionRigger(FingerRiggerBase):
             if child_bone is not None:  # there might be boneless riggers
                 child_bone.parent = self.current_edit_bone
                 child_bone.use_connect = True  # this is only valid for the root bone
-                self.current_edit_bone.tail.x = child_object.location[0]
-                self.current_edit_bone.tail.y = child_object.location[1]
-                self.current_edit_bone.tail.z = child_object.location[2]
+                self.current_edit_bone.tail = child_object.location
             else:
-                self.current_edit_bone.tail.x = mean[0]
-                self.current_edit_bone.tail.y = mean[1]
-                self.current_edit_bone.tail.z = mean[2]
+                self.current_edit_bone.tail = mean
 
             self.queue()
             return
@@ -1735,15 +1674,13 @@ class FingerSectionRigger(FingerRiggerBase):
         # if: has multiple children
         # It creates the tail at the mean point, creates the children rigs and
         # it parents the results without connecting the bones
-        self.current_edit_bone.tail.x = mean[0]
-        self.current_edit_bone.tail.y = mean[1]
-        self.current_edit_bone.tail.z = mean[2]
+        self.current_edit_bone.tail = mean
 
         same_type_children = []
+        factory: RiggerFactoryBase = self.rigger_factory
+        current_edit_bone = self.current_edit_bone
         for linked_child in self.linked_object.children:
             child_object: BoxmanDTO = linked_child
-
-            factory: RiggerFactoryBase = self.rigger_factory
             child_rigger = factory.create_rigger(child_object, self)
             if isinstance(child_rigger, FingerRiggerBase):
                 child_rigger.control_bone = self.control_bone
@@ -1752,19 +1689,17 @@ class FingerSectionRigger(FingerRiggerBase):
             child_rigger.rig(context)
             child_bone = child_rigger.current_edit_bone
             if child_bone is not None:  # there might be boneless riggers
-                child_bone.parent = self.current_edit_bone
+                child_bone.parent = current_edit_bone
                 child_bone.use_connect = False
 
         # If it has only ONE child of type finger, it uses the connect
         if len(same_type_children) == 1:
             child_rigger = same_type_children[0]
             child_rigger.current_edit_bone.use_connect = True
-            self.current_edit_bone.tail.x = child_rigger.linked_object.location[0]
-            self.current_edit_bone.tail.y = child_rigger.linked_object.location[1]
-            self.current_edit_bone.tail.z = child_rigger.linked_object.location[2]
+            self.current_edit_bone.tail = child_rigger.linked_object.location
 
         self.queue()
-        print(f"Generated finger rig for {self.linked_object.properties.name}!")
+        logger.debug("Generated finger rig for %s!", self.linked_object.properties.name)
 
     def queue(self) -> None:
         """
@@ -1772,14 +1707,13 @@ class FingerSectionRigger(FingerRiggerBase):
         """
         self.queue_parent_object_to_rig()
         self.queue_create_rotation_constraint()
-        self.queue_add_bone_to_group(BoxmanExtremityTypes.HAND.value, self.current_edit_bone.name)
+        self.queue_add_bone_to_group(_EXTREMITY_HAND, self.current_edit_bone.name)
         self.queue_add_bone_to_layers([RiggerBase.GLOBAL_LAYER_INDEX,
                                        RiggerBase.ARM_LAYER_INDEX,
                                        RiggerBase.HAND_LAYER_INDEX,
                                        RiggerBase.MINORS_LAYER_INDEX],
                                       self.current_edit_bone.name)
-        self.queue_link_mesh_to_collection(self.get_mesh_object_collection_name())
-        self.queue_unlink_mesh_from_collection()
+        self.queue_move_mesh_to_collection(self.get_mesh_object_collection_name())
 
     def queue_create_rotation_constraint(self) -> None:
         """
@@ -1791,8 +1725,7 @@ class FingerSectionRigger(FingerRiggerBase):
             armature_name = self.armature_object_name
 
             self.stored_control_creation_fixture.append(
-                lambda context: self.create_rotation_constraint(context, current_bone_name,
-                                                                current_bone_control_name, armature_name)
+                (self.create_rotation_constraint, (current_bone_name, current_bone_control_name, armature_name))
             )
 
     @staticmethod
@@ -1800,9 +1733,9 @@ class FingerSectionRigger(FingerRiggerBase):
         """
         Creates a constraint of same rotation over the control and hides the
         """
-        print(f"Attaching chain rotation control to {current_bone_name}...")
-        armature = bpy.data.objects[armature_name]
-        current_bone = bpy.data.objects[armature_name].pose.bones[current_bone_name]
+        logger.debug("Attaching chain rotation control to %s...", current_bone_name)
+        armature = get_armature_object(armature_name)
+        current_bone = get_pose_bones(armature_name)[current_bone_name]
         constraint = current_bone.constraints.new("COPY_ROTATION")
         constraint.target = armature
         constraint.subtarget = current_bone_control_name
@@ -1816,6 +1749,7 @@ class FingerRootRigger(FingerSectionRigger):
     This rigger creates a proxy control that controls the rotations of all the other controls
     of type finger that encounters in his children
     """
+    __slots__ = ()
 
     def __init__(self, linked_object: BoxmanDTO, parent_rigger=None):
         super().__init__(linked_object, parent_rigger)
@@ -1825,26 +1759,16 @@ class FingerRootRigger(FingerSectionRigger):
         Handles the creation of children bones the same way a finger rigger do,
         except that the bones arent hidden and the control is always created.
         """
-        print(f"Generating root finger rig for {self.linked_object.properties.name}.")
+        logger.debug("Generating root finger rig for %s.", self.linked_object.properties.name)
 
-        bpy.ops.armature.bone_primitive_add()
-        bpy.ops.armature.select_linked()
-        newly_created = bpy.context.selected_bones
-        self.current_edit_bone = newly_created[0]
+        self.current_edit_bone = self.add_edit_bone()
 
-        bpy.ops.armature.bone_primitive_add()
-        bpy.ops.armature.select_linked()
-        newly_created = bpy.context.selected_bones
-        self.control_bone = newly_created[0]
+        self.control_bone = self.add_edit_bone()
 
-        self.current_edit_bone.head.x = self.linked_object.location[0]
-        self.current_edit_bone.head.y = self.linked_object.location[1]
-        self.current_edit_bone.head.z = self.linked_object.location[2]
+        self.current_edit_bone.head = self.linked_object.location
         self.current_edit_bone.name = self.linked_object.get_object_name()
 
-        self.control_bone.head.x = self.current_edit_bone.head.x
-        self.control_bone.head.y = self.current_edit_bone.head.y
-        self.control_bone.head.z = self.current_edit_bone.head.z
+        self.control_bone.head = self.current_edit_bone.head
         self.control_bone.name = f"{self.current_edit_bone.name}_{BoxmanRigControl.DEFAULT_CONTROL_SUFFIX}"
         self.control_bone.parent = self.parent_rigger.current_edit_bone # forced
         self.control_bone.use_connect = False
@@ -1853,13 +1777,9 @@ class FingerRootRigger(FingerSectionRigger):
         mean = self.get_mesh_mean_point()
         # if: it's end of a chain
         if len(self.linked_object.children) == 0:
-            self.current_edit_bone.tail.x = mean[0]
-            self.current_edit_bone.tail.y = mean[1]
-            self.current_edit_bone.tail.z = mean[2]
+            self.current_edit_bone.tail = mean
 
-            self.control_bone.tail.x = self.current_edit_bone.tail.x
-            self.control_bone.tail.y = self.current_edit_bone.tail.y
-            self.control_bone.tail.z = self.current_edit_bone.tail.z
+            self.control_bone.tail = self.current_edit_bone.tail
 
             self.queue()
             return  # its end of a link
@@ -1880,21 +1800,13 @@ class FingerRootRigger(FingerSectionRigger):
             if child_bone is not None:  # there might be boneless riggers
                 child_bone.parent = self.current_edit_bone
                 child_bone.use_connect = True  # this is only valid for the root bone
-                self.current_edit_bone.tail.x = child_object.location[0]
-                self.current_edit_bone.tail.y = child_object.location[1]
-                self.current_edit_bone.tail.z = child_object.location[2]
+                self.current_edit_bone.tail = child_object.location
 
-                self.control_bone.tail.x = self.current_edit_bone.tail.x
-                self.control_bone.tail.y = self.current_edit_bone.tail.y
-                self.control_bone.tail.z = self.current_edit_bone.tail.z
+                self.control_bone.tail = self.current_edit_bone.tail
             else:
-                self.current_edit_bone.tail.x = mean[0]
-                self.current_edit_bone.tail.y = mean[1]
-                self.current_edit_bone.tail.z = mean[2]
+                self.current_edit_bone.tail = mean
 
-                self.control_bone.tail.x = self.current_edit_bone.tail.x
-                self.control_bone.tail.y = self.current_edit_bone.tail.y
-                self.control_bone.tail.z = self.current_edit_bone.tail.z
+                self.control_bone.tail = self.current_edit_bone.tail
 
             self.queue()
             return
@@ -1902,15 +1814,13 @@ class FingerRootRigger(FingerSectionRigger):
         # if: has multiple children
         # It creates the tail at the mean point, creates the children rigs and
         # it parents the results without connecting the bones
-        self.current_edit_bone.tail.x = mean[0]
-        self.current_edit_bone.tail.y = mean[1]
-        self.current_edit_bone.tail.z = mean[2]
+        self.current_edit_bone.tail = mean
 
         same_type_children = []
+        factory: RiggerFactoryBase = self.rigger_factory
+        current_edit_bone = self.current_edit_bone
         for linked_child in self.linked_object.children:
             child_object: BoxmanDTO = linked_child
-
-            factory: RiggerFactoryBase = self.rigger_factory
             child_rigger = factory.create_rigger(child_object, self)
             if isinstance(child_rigger, FingerRiggerBase):
                 child_rigger.control_bone = self.control_bone
@@ -1919,19 +1829,17 @@ class FingerRootRigger(FingerSectionRigger):
             child_rigger.rig(context)
             child_bone = child_rigger.current_edit_bone
             if child_bone is not None:  # there might be boneless riggers
-                child_bone.parent = self.current_edit_bone
+                child_bone.parent = current_edit_bone
                 child_bone.use_connect = False
 
         # If it has only ONE child of type finger, it uses the connect
         if len(same_type_children) == 1:
             child_rigger = same_type_children[0]
             child_rigger.current_edit_bone.use_connect = True
-            self.current_edit_bone.tail.x = child_rigger.linked_object.location[0]
-            self.current_edit_bone.tail.y = child_rigger.linked_object.location[1]
-            self.current_edit_bone.tail.z = child_rigger.linked_object.location[2]
+            self.current_edit_bone.tail = child_rigger.linked_object.location
 
         self.queue()
-        print(f"Generated root finger rig for {self.linked_object.properties.name}!")
+        logger.debug("Generated root finger rig for %s!", self.linked_object.properties.name)
 
     def queue(self) -> None:
         """
@@ -1940,8 +1848,8 @@ class FingerRootRigger(FingerSectionRigger):
         self.queue_parent_object_to_rig()
         self.queue_attach_shape_to_control()
         self.queue_create_rotation_constraint()
-        self.queue_add_bone_to_group(BoxmanExtremityTypes.HAND.value, self.control_bone.name)
-        self.queue_add_bone_to_group(BoxmanExtremityTypes.HAND.value, self.current_edit_bone.name)
+        self.queue_add_bone_to_group(_EXTREMITY_HAND, self.control_bone.name)
+        self.queue_add_bone_to_group(_EXTREMITY_HAND, self.current_edit_bone.name)
 
         self.queue_add_bone_to_layers([RiggerBase.GLOBAL_LAYER_INDEX,
                                        RiggerBase.ARM_LAYER_INDEX,
@@ -1954,8 +1862,7 @@ class FingerRootRigger(FingerSectionRigger):
                                        RiggerBase.MINORS_LAYER_INDEX,
                                        RiggerBase.CONTROL_LAYER_INDEX],
                                       self.control_bone.name)
-        self.queue_link_mesh_to_collection(self.get_mesh_object_collection_name())
-        self.queue_unlink_mesh_from_collection()
+        self.queue_move_mesh_to_collection(self.get_mesh_object_collection_name())
 
     def queue_attach_shape_to_control(self) -> None:
         """
@@ -1964,7 +1871,7 @@ class FingerRootRigger(FingerSectionRigger):
         control_bone_name = self.control_bone.name  # this turns the reference into a constant
         armature_name = self.armature_object_name
         self.stored_control_creation_fixture.append(
-            lambda context: self.attach_shape_to_control(context, control_bone_name, armature_name)
+            (self.attach_shape_to_control, (control_bone_name, armature_name))
         )
 
     @staticmethod
@@ -1972,10 +1879,11 @@ class FingerRootRigger(FingerSectionRigger):
         """
         Creates a roll control of half a typical size
         """
-        print(f"Attaching default ring control to {control_bone_name}...")
+        logger.debug("Attaching default ring control to %s...", control_bone_name)
         name = RootRigger.get_default_control_name(armature_name)
-        bpy.data.objects[armature_name].pose.bones[control_bone_name].custom_shape = bpy.data.objects[name]
-        bpy.data.objects[armature_name].pose.bones[control_bone_name].custom_shape_scale = 0.5
+        shape_bone = get_pose_bones(armature_name)[control_bone_name]
+        shape_bone.custom_shape = bpy.data.objects[name]
+        shape_bone.custom_shape_scale = 0.5
 
 # endregion
 
@@ -1989,6 +1897,7 @@ class ThighRigger(DefaultRigger):
     whatever its in between. Its also used to type check the parent of the radius shin
     so it can set the Iks controls
     """
+    __slots__ = ("mandatory", "non_mandatory")
 
     def __init__(self, linked_object: BoxmanDTO, parent_rigger=None):
         super().__init__(linked_object, parent_rigger)
@@ -2017,17 +1926,12 @@ class ThighRigger(DefaultRigger):
         Similar to the default rig, only difference is that it expects at least one child of radius type.
         The idea is that it guaranties that the radius has at least two bones for the IK.
         """
-        print(f"Generating femur rig for {self.linked_object.properties.name}...")
+        logger.debug("Generating femur rig for %s...", self.linked_object.properties.name)
 
         self.verify_chain()
         # We create the bone as in the default scenario
-        bpy.ops.armature.bone_primitive_add()
-        bpy.ops.armature.select_linked()
-        newly_created = bpy.context.selected_bones
-        self.current_edit_bone = newly_created[0]
-        self.current_edit_bone.head.x = self.linked_object.location[0]
-        self.current_edit_bone.head.y = self.linked_object.location[1]
-        self.current_edit_bone.head.z = self.linked_object.location[2]
+        self.current_edit_bone = self.add_edit_bone()
+        self.current_edit_bone.head = self.linked_object.location
         self.current_edit_bone.name = self.linked_object.get_object_name()
 
         child_object: BoxmanDTO = self.mandatory[0]
@@ -2038,9 +1942,7 @@ class ThighRigger(DefaultRigger):
         child_bone = child_rigger.current_edit_bone
         child_bone.parent = self.current_edit_bone
         child_bone.use_connect = True  # this is only valid for the root bone
-        self.current_edit_bone.tail.x = child_object.location[0]
-        self.current_edit_bone.tail.y = child_object.location[1]
-        self.current_edit_bone.tail.z = child_object.location[2]
+        self.current_edit_bone.tail = child_object.location
 
         # then we handle the non mandatory children
         for child in self.non_mandatory:
@@ -2053,46 +1955,39 @@ class ThighRigger(DefaultRigger):
                 child_bone.use_connect = False
 
         self.queue_parent_object_to_rig()  # this is the same
-        self.queue_add_bone_to_group(BoxmanExtremityTypes.LEG.value, self.current_edit_bone.name)
+        self.queue_add_bone_to_group(_EXTREMITY_LEG, self.current_edit_bone.name)
         self.queue_add_bone_to_layers([RiggerBase.GLOBAL_LAYER_INDEX,
                                        RiggerBase.MAYORS_LAYER_INDEX,
                                        RiggerBase.LEG_LAYER_INDEX],
                                       self.current_edit_bone.name)
-        self.queue_link_mesh_to_collection(self.get_mesh_object_collection_name())
-        self.queue_unlink_mesh_from_collection()
-        print(f"Generated femur rig for {self.linked_object.properties.name}!")
+        self.queue_move_mesh_to_collection(self.get_mesh_object_collection_name())
+        logger.debug("Generated femur rig for %s!", self.linked_object.properties.name)
 
 
 class KneeRigger(PoleTargetRigger):
     """
     The knee rigger is a dead end with a hidden bone that places a pole target.
     """
+    __slots__ = ()
 
     def __init__(self, linked_object: BoxmanDTO, parent_rigger=None):
         super().__init__(linked_object, parent_rigger)
         if len(self.linked_object.children) > 0:
-            print("The knee rigger is a dead end! potential data loss detected!!!!")
+            logger.warning("The knee rigger is a dead end! potential data loss detected!!!!")
 
     def rig(self, context) -> None:
         """
         Creates a hidden bone and creates a pole target control
         """
-        print(f"Generating knee rig for {self.linked_object.properties.name}...")
+        logger.debug("Generating knee rig for %s...", self.linked_object.properties.name)
         # this works as the default rigger of a disconnected parent
-        bpy.ops.armature.bone_primitive_add()
-        bpy.ops.armature.select_linked()
-        newly_created = bpy.context.selected_bones
-        self.current_edit_bone = newly_created[0]
-
-        self.current_edit_bone.head.x = self.linked_object.location[0]
-        self.current_edit_bone.head.y = self.linked_object.location[1]
-        self.current_edit_bone.head.z = self.linked_object.location[2]
+        self.current_edit_bone = self.add_edit_bone()
+
+        self.current_edit_bone.head = self.linked_object.location
         self.current_edit_bone.name = self.linked_object.get_object_name()
 
         mean = self.get_mesh_mean_point()
-        self.current_edit_bone.tail.x = mean[0]
-        self.current_edit_bone.tail.y = mean[1]
-        self.current_edit_bone.tail.z = mean[2]
+        self.current_edit_bone.tail = mean
 
         self.create_control_bone()
         self.control_bone.parent = self.absolute_root_rigger.current_edit_bone
@@ -2100,8 +1995,8 @@ class KneeRigger(PoleTargetRigger):
 
         self.queue_hide_current_bone()
         self.queue_attach_default_shape()
-        self.queue_add_bone_to_group(BoxmanExtremityTypes.LEG.value, self.current_edit_bone.name)
-        self.queue_add_bone_to_group(BoxmanExtremityTypes.LEG.value, self.control_bone.name)
+        self.queue_add_bone_to_group(_EXTREMITY_LEG, self.current_edit_bone.name)
+        self.queue_add_bone_to_group(_EXTREMITY_LEG, self.control_bone.name)
         self.queue_add_bone_to_layers([RiggerBase.GLOBAL_LAYER_INDEX,
                                        RiggerBase.LEG_LAYER_INDEX],
                                       self.current_edit_bone.name)
@@ -2110,15 +2005,15 @@ class KneeRigger(PoleTargetRigger):
                                        RiggerBase.CONTROL_LAYER_INDEX,
                                        RiggerBase.LEG_LAYER_INDEX],
                                       self.control_bone.name)
-        self.queue_link_mesh_to_collection(self.get_mesh_object_collection_name())
-        self.queue_unlink_mesh_from_collection()
-        print(f"Generated knee rig for {self.linked_object.properties.name}...")
+        self.queue_move_mesh_to_collection(self.get_mesh_object_collection_name())
+        logger.debug("Generated knee rig for %s...", self.linked_object.properties.name)
 
 
 class FeetRigger(IkControlRigger):
     """
     Target of IK for the leg. It detaches the foot results.
     """
+    __slots__ = ()
 
     def __init__(self, linked_object: BoxmanDTO, parent_rigger=None):
         super().__init__(linked_object, parent_rigger)
@@ -2141,8 +2036,8 @@ class FeetRigger(IkControlRigger):
         self.queue_create_ik_constraint(angle=0.0)
         self.queue_create_copy_location_constraint()
         self.queue_add_rotation_constraint()
-        self.queue_add_bone_to_group(BoxmanExtremityTypes.FEET.value, self.current_edit_bone.name)
-        self.queue_add_bone_to_group(BoxmanExtremityTypes.LEG.value, self.control_bone.name)
+        self.queue_add_bone_to_group(_EXTREMITY_FEET, self.current_edit_bone.name)
+        self.queue_add_bone_to_group(_EXTREMITY_LEG, self.control_bone.name)
         self.queue_add_bone_to_layers([RiggerBase.GLOBAL_LAYER_INDEX,
                                        RiggerBase.LEG_LAYER_INDEX,
                                        RiggerBase.FEET_LAYER_INDEX],
@@ -2152,8 +2047,7 @@ class FeetRigger(IkControlRigger):
                                        RiggerBase.LEG_LAYER_INDEX,
                                        RiggerBase.CONTROL_LAYER_INDEX],
                                       self.control_bone.name)
-        self.queue_link_mesh_to_collection(self.get_mesh_object_collection_name())
-        self.queue_unlink_mesh_from_collection()
+        self.queue_move_mesh_to_collection(self.get_mesh_object_collection_name())
 
     def queue_create_copy_location_constraint(self) -> None:
         """
@@ -2164,8 +2058,7 @@ class FeetRigger(IkControlRigger):
         parent_bone_name = self.parent_rigger.current_edit_bone.name  # this turns the reference into a constant
 
         self.stored_control_creation_fixture.append(
-            lambda context: self.create_copy_location_constraint(context, parent_bone_name,
-                                                                 current_edit_bone_name, armature_name)
+            (self.create_copy_location_constraint, (parent_bone_name, current_edit_bone_name, armature_name))
         )
 
     @staticmethod
@@ -2173,8 +2066,8 @@ class FeetRigger(IkControlRigger):
         """
         Creates a copy location constraint to the parent bone
         """
-        armature = bpy.data.objects[armature_name]
-        target_bone = bpy.data.objects[armature_name].pose.bones[current_edit_bone_name]
+        armature = get_armature_object(armature_name)
+        target_bone = get_pose_bones(armature_name)[current_edit_bone_name]
         constraint = target_bone.constraints.new("COPY_LOCATION")
         constraint.head_tail = 1.0
         constraint.target = armature
@@ -2189,8 +2082,7 @@ class FeetRigger(IkControlRigger):
         ik_control_bone_name = self.control_bone.name  # this turns the reference into a constant
 
         self.stored_control_creation_fixture.append(
-            lambda context: self.add_rotation_constraint(context, ik_control_bone_name,
-                                                         current_edit_bone_name, armature_name)
+            (self.add_rotation_constraint, (ik_control_bone_name, current_edit_bone_name, armature_name))
         )
 
     @staticmethod
@@ -2198,9 +2090,9 @@ class FeetRigger(IkControlRigger):
         """
         Creates a copy location constraint to the parent bone
         """
-        print(f"Adding rotation constraints to {current_edit_bone_name}...")
-        armature = bpy.data.objects[armature_name]
-        current_bone = bpy.data.objects[armature_name].pose.bones[current_edit_bone_name]
+        logger.debug("Adding rotation constraints to %s...", current_edit_bone_name)
+        armature = get_armature_object(armature_name)
+        current_bone = get_pose_bones(armature_name)[current_edit_bone_name]
         constraint = current_bone.constraints.new("COPY_ROTATION")
         constraint.target = armature
         constraint.subtarget = ik_control_bone_name
@@ -2214,6 +2106,7 @@ class ShinRigger(DefaultRigger):
     The radius creates a default rig expecting one hand root child, to use for IK constraints.
     If it has an elbow child, it uses it as pole target.
     """
+    __slots__ = ("mandatory", "non_mandatory")
 
     def __init__(self, linked_object: BoxmanDTO, parent_rigger=None):
         super().__init__(linked_object, parent_rigger)
@@ -2242,16 +2135,11 @@ class ShinRigger(DefaultRigger):
         Acts like de default rigger, expecting a hand root to link and use as IK control.
         The pole target is optional, and the bone is not invisible so that the pole target can be adjusted if needed.
         """
-        print(f"Generating shin rig for {self.linked_object.properties.name}...")
+        logger.debug("Generating shin rig for %s...", self.linked_object.properties.name)
         self.verify_chain()
         # We create the bone as in the default scenario
-        bpy.ops.armature.bone_primitive_add()
-        bpy.ops.armature.select_linked()
-        newly_created = bpy.context.selected_bones
-        self.current_edit_bone = newly_created[0]
-        self.current_edit_bone.head.x = self.linked_object.location[0]
-        self.current_edit_bone.head.y = self.linked_object.location[1]
-        self.current_edit_bone.head.z = self.linked_object.location[2]
+        self.current_edit_bone = self.add_edit_bone()
+        self.current_edit_bone.head = self.linked_object.location
         self.current_edit_bone.name = self.linked_object.get_object_name()
 
         # we handle the non mandatory first to have the name of the pole target, if any
@@ -2282,23 +2170,22 @@ class ShinRigger(DefaultRigger):
         child_bone.parent = self.absolute_root_rigger.current_edit_bone
         child_bone.use_connect = False  # this is only valid for the root bone
 
-        self.current_edit_bone.tail.x = child_object.location[0]
-        self.current_edit_bone.tail.y = child_object.location[1]
-        self.current_edit_bone.tail.z = child_object.location[2]
+        self.current_edit_bone.tail = child_object.location
         self.queue_parent_object_to_rig()
-        self.queue_add_bone_to_group(BoxmanExtremityTypes.LEG.value, self.current_edit_bone.name)
+        self.queue_add_bone_to_group(_EXTREMITY_LEG, self.current_edit_bone.name)
         self.queue_add_bone_to_layers([RiggerBase.GLOBAL_LAYER_INDEX,
                                        RiggerBase.LEG_LAYER_INDEX],
                                       self.current_edit_bone.name)
-        self.queue_link_mesh_to_collection(self.get_mesh_object_collection_name())
-        self.queue_unlink_mesh_from_collection()
-        print(f"Generated shin rig for {self.linked_object.properties.name}!")
+        self.queue_move_mesh_to_collection(self.get_mesh_object_collection_name())
+        logger.debug("Generated shin rig for %s!", self.linked_object.properties.name)
 
 
 class ToeRiggerBase(FingerRiggerBase):
     """
     Base class of the finger riggers
     """
+    __slots__ = ()
+
     def __init__(self, linked_object: BoxmanDTO, parent_rigger=None):
         super().__init__(linked_object, parent_rigger)
         self.control_bone = None
@@ -2315,6 +2202,7 @@ class ToeSectionRigger(FingerSectionRigger):
     The finger rigger acts as a default rigger that doesnt hide the bone.
     It can accept and pass a rotation control to children of the same type.
     """
+    __slots__ = ()
 
     def __init__(self, linked_object: BoxmanDTO, parent_rigger=None):
         super().__init__(linked_object, parent_rigger)
@@ -2332,14 +2220,13 @@ class ToeSectionRigger(FingerSectionRigger):
         """
         self.queue_parent_object_to_rig()
         self.queue_create_rotation_constraint()
-        self.queue_add_bone_to_group(BoxmanExtremityTypes.FEET.value, self.current_edit_bone.name)
+        self.queue_add_bone_to_group(_EXTREMITY_FEET, self.current_edit_bone.name)
         self.queue_add_bone_to_layers([RiggerBase.GLOBAL_LAYER_INDEX,
                                        RiggerBase.LEG_LAYER_INDEX,
                                        RiggerBase.FEET_LAYER_INDEX,
                                        RiggerBase.MINORS_LAYER_INDEX],
                                       self.current_edit_bone.name)
-        self.queue_link_mesh_to_collection(self.get_mesh_object_collection_name())
-        self.queue_unlink_mesh_from_collection()
+        self.queue_move_mesh_to_collection(self.get_mesh_object_collection_name())
 
 
 class ToeRootRigger(FingerRootRigger):
@@ -2347,6 +2234,7 @@ class ToeRootRigger(FingerRootRigger):
     This rigger creates a proxy control that controls the rotations of all the other controls
     of type finger that encounters in his children
     """
+    __slots__ = ()
 
     def __init__(self, linked_object: BoxmanDTO, parent_rigger=None):
         super().__init__(linked_object, parent_rigger)
@@ -2364,8 +2252,8 @@ class ToeRootRigger(FingerRootRigger):
         self.queue_parent_object_to_rig()
         self.queue_attach_shape_to_control()
         self.queue_create_rotation_constraint()
-        self.queue_add_bone_to_group(BoxmanExtremityTypes.FEET.value, self.control_bone.name)
-        self.queue_add_bone_to_group(BoxmanExtremityTypes.FEET.value, self.current_edit_bone.name)
+        self.queue_add_bone_to_group(_EXTREMITY_FEET, self.control_bone.name)
+        self.queue_add_bone_to_group(_EXTREMITY_FEET, self.current_edit_bone.name)
         self.queue_add_bone_to_layers([RiggerBase.GLOBAL_LAYER_INDEX,
                                        RiggerBase.LEG_LAYER_INDEX,
                                        RiggerBase.FEET_LAYER_INDEX,
@@ -2377,8 +2265,7 @@ class ToeRootRigger(FingerRootRigger):
                                        RiggerBase.MINORS_LAYER_INDEX,
                                        RiggerBase.CONTROL_LAYER_INDEX],
                                       self.control_bone.name)
-        self.queue_link_mesh_to_collection(self.get_mesh_object_collection_name())
-        self.queue_unlink_mesh_from_collection()
+        self.queue_move_mesh_to_collection(self.get_mesh_object_collection_name())
 
 # endregion
 
@@ -2389,6 +2276,8 @@ class SpineRiggerBase(DefaultRigger):
     """
     Base rigger for the spine elements
     """
+    __slots__ = ()
+
     def __init__(self, linked_object: BoxmanDTO, parent_rigger=None):
         super().__init__(linked_object, parent_rigger)
         self.control_bone = None
@@ -2411,9 +2300,8 @@ class SpineRiggerBase(DefaultRigger):
             influence_factor_const = influence_factor
 
             self.stored_control_creation_fixture.append(
-                lambda context: self.create_rotation_constraint(context, current_bone_name,
-                                                                current_bone_control_name, armature_name,
-                                                                influence_factor_const)
+                (self.create_rotation_constraint, (current_bone_name, current_bone_control_name, armature_name,
+                                                   influence_factor_const))
             )
 
     @staticmethod
@@ -2422,9 +2310,9 @@ class SpineRiggerBase(DefaultRigger):
         """
         Creates a constraint of same rotation over the control and hides the
         """
-        print(f"Attaching chain rotation control to {current_bone_name}...")
-        armature = bpy.data.objects[armature_name]
-        current_bone = bpy.data.objects[armature_name].pose.bones[current_bone_name]
+        logger.debug("Attaching chain rotation control to %s...", current_bone_name)
+        armature = get_armature_object(armature_name)
+        current_bone = get_pose_bones(armature_name)[current_bone_name]
         constraint = current_bone.constraints.new("COPY_ROTATION")
         constraint.target = armature
         constraint.subtarget = current_bone_control_name
@@ -2438,6 +2326,7 @@ class SpineSectionRigger(SpineRiggerBase):
     """
     It creates a control chain with half additive rotations on a control if inherited.
     """
+    __slots__ = ()
 
     def __init__(self, linked_object: BoxmanDTO, parent_rigger=None):
         super().__init__(linked_object, parent_rigger)
@@ -2447,25 +2336,18 @@ class SpineSectionRigger(SpineRiggerBase):
         Handles the creation of children bones the same way a default rigger do,
         except that the bones arent hidden
         """
-        print(f"Generating spine rig for {self.linked_object.properties.name}.")
+        logger.debug("Generating spine rig for %s.", self.linked_object.properties.name)
 
-        bpy.ops.armature.bone_primitive_add()
-        bpy.ops.armature.select_linked()
-        newly_created = bpy.context.selected_bones
-        self.current_edit_bone = newly_created[0]
+        self.current_edit_bone = self.add_edit_bone()
 
-        self.current_edit_bone.head.x = self.linked_object.location[0]
-        self.current_edit_bone.head.y = self.linked_object.location[1]
-        self.current_edit_bone.head.z = self.linked_object.location[2]
+        self.current_edit_bone.head = self.linked_object.location
         self.current_edit_bone.name = self.linked_object.get_object_name()
 
         # there ere 3 possibilities
         mean = self.get_mesh_mean_point()
         # if: it's end of a chain
         if len(self.linked_object.children) == 0:
-            self.current_edit_bone.tail.x = mean[0]
-            self.current_edit_bone.tail.y = mean[1]
-            self.current_edit_bone.tail.z = mean[2]
+            self.current_edit_bone.tail = mean
 
             self.queue()
             return  # its end of a link
@@ -2486,13 +2368,9 @@ class SpineSectionRigger(SpineRiggerBase):
             if child_bone is not None:  # there might be boneless riggers
                 child_bone.parent = self.current_edit_bone
                 child_bone.use_connect = True  # this is only valid for the root bone
-                self.current_edit_bone.tail.x = child_object.location[0]
-                self.current_edit_bone.tail.y = child_object.location[1]
-                self.current_edit_bone.tail.z = child_object.location[2]
+                self.current_edit_bone.tail = child_object.location
             else:
-                self.current_edit_bone.tail.x = mean[0]
-                self.current_edit_bone.tail.y = mean[1]
-                self.current_edit_bone.tail.z = mean[2]
+                self.current_edit_bone.tail = mean
 
             self.queue()
             return
@@ -2500,15 +2378,13 @@ class SpineSectionRigger(SpineRiggerBase):
         # if: has multiple children
         # It creates the tail at the mean point, creates the children rigs and
         # it parents the results without connecting the bones
-        self.current_edit_bone.tail.x = mean[0]
-        self.current_edit_bone.tail.y = mean[1]
-        self.current_edit_bone.tail.z = mean[2]
+        self.current_edit_bone.tail = mean
 
         same_type_children = []
+        factory: RiggerFactoryBase = self.rigger_factory
+        current_edit_bone = self.current_edit_bone
         for linked_child in self.linked_object.children:
             child_object: BoxmanDTO = linked_child
-
-            factory: RiggerFactoryBase = self.rigger_factory
             child_rigger = factory.create_rigger(child_object, self)
             if isinstance(child_rigger, SpineRiggerBase):
                 child_rigger.control_bone = self.control_bone
@@ -2517,19 +2393,17 @@ class SpineSectionRigger(SpineRiggerBase):
             child_rigger.rig(context)
             child_bone = child_rigger.current_edit_bone
             if child_bone is not None:  # there might be boneless riggers
-                child_bone.parent = self.current_edit_bone
+                child_bone.parent = current_edit_bone
                 child_bone.use_connect = False
 
         # If it has only ONE child of type finger, it uses the connect
         if len(same_type_children) == 1:
             child_rigger = same_type_children[0]
             child_rigger.current_edit_bone.use_connect = True
-            self.current_edit_bone.tail.x = child_rigger.linked_object.location[0]
-            self.current_edit_bone.tail.y = child_rigger.linked_object.location[1]
-            self.current_edit_bone.tail.z = child_rigger.linked_object.location[2]
+            self.current_edit_bone.tail = child_rigger.linked_object.location
 
         self.queue()
-        print(f"Generated finger rig for {self.linked_object.properties.name}!")
+        logger.debug("Generated finger rig for %s!", self.linked_object.properties.name)
 
     def queue(self) -> None:
         """
@@ -2538,13 +2412,12 @@ class SpineSectionRigger(SpineRiggerBase):
         self.queue_parent_object_to_rig()
         self.queue_attach_default_shape()
         self.queue_create_rotation_constraint(0.5)
-        self.queue_add_bone_to_group(BoxmanExtremityTypes.SPINE.value, self.current_edit_bone.name)
+        self.queue_add_bone_to_group(_EXTREMITY_SPINE, self.current_edit_bone.name)
         self.queue_add_bone_to_layers([RiggerBase.GLOBAL_LAYER_INDEX,
                                        RiggerBase.MAYORS_LAYER_INDEX,
                                        RiggerBase.SPINE_LAYER_INDEX],
                                       self.current_edit_bone.name)
-        self.queue_link_mesh_to_collection(self.get_mesh_object_collection_name())
-        self.queue_unlink_mesh_from_collection()
+        self.queue_move_mesh_to_collection(self.get_mesh_object_collection_name())
 
 
 class SpineRootRigger(SpineSectionRigger):
@@ -2552,6 +2425,7 @@ class SpineRootRigger(SpineSectionRigger):
     The spine root creates an invisible bone and a control box related with the typical size.
     It the bone is connected to the control that manipulates the rotations of the resulting elements
     """
+    __slots__ = ()
 
     def __init__(self, linked_object: BoxmanDTO, parent_rigger=None):
         super().__init__(linked_object, parent_rigger)
@@ -2561,30 +2435,20 @@ class SpineRootRigger(SpineSectionRigger):
         Creates a rig similar to the default, but attaching a control bone that will apply a copy rotations and
         transpose located at the root
         """
-        print(f"Generating root spine rig for {self.linked_object.properties.name}.")
-        bpy.ops.armature.bone_primitive_add()
-        bpy.ops.armature.select_linked()
-        newly_created = bpy.context.selected_bones
-        self.current_edit_bone = newly_created[0]
+        logger.debug("Generating root spine rig for %s.", self.linked_object.properties.name)
+        self.current_edit_bone = self.add_edit_bone()
 
-        bpy.ops.armature.bone_primitive_add()
-        bpy.ops.armature.select_linked()
-        newly_created = bpy.context.selected_bones
-        self.control_bone = newly_created[0]
+        self.control_bone = self.add_edit_bone()
 
-        self.current_edit_bone.head.x = self.linked_object.location[0]
-        self.current_edit_bone.head.y = self.linked_object.location[1]
-        self.current_edit_bone.head.z = self.linked_object.location[2]
+        self.current_edit_bone.head = self.linked_object.location
         self.current_edit_bone.name = self.linked_object.get_object_name()
 
         typical = self.get_typical_size()
-        self.control_bone.head.x = self.current_edit_bone.head.x
-        self.control_bone.head.y = self.current_edit_bone.head.y
-        self.control_bone.head.z = self.current_edit_bone.head.z
+        self.control_bone.head = self.current_edit_bone.head
         # positioned with
-        self.control_bone.tail.x = self.control_bone.head.x
-        self.control_bone.tail.y = self.control_bone.head.y + 1.0 # use absolute units?
-        self.control_bone.tail.z = self.control_bone.head.z
+        self.control_bone.tail = (self.control_bone.head.x,
+                                  self.control_bone.head.y + 1.0,  # use absolute units?
+                                  self.control_bone.head.z)
         # parented to the absolute root
         self.control_bone.name = f"{self.current_edit_bone.name}_{BoxmanRigControl.DEFAULT_CONTROL_SUFFIX}"
         self.control_bone.parent = self.absolute_root_rigger.current_edit_bone # forced
@@ -2594,9 +2458,7 @@ class SpineRootRigger(SpineSectionRigger):
         mean = self.get_mesh_mean_point()
         # if: it's end of a chain
         if len(self.linked_object.children) == 0:
-            self.current_edit_bone.tail.x = mean[0]
-            self.current_edit_bone.tail.y = mean[1]
-            self.current_edit_bone.tail.z = mean[2]
+            self.current_edit_bone.tail = mean
 
             self.queue()
             return  # its end of a link
@@ -2617,13 +2479,9 @@ class SpineRootRigger(SpineSectionRigger):
             if child_bone is not None:  # there might be boneless riggers
                 child_bone.parent = self.current_edit_bone
                 child_bone.use_connect = True  # this is only valid for the root bone
-                self.current_edit_bone.tail.x = child_object.location[0]
-                self.current_edit_bone.tail.y = child_object.location[1]
-                self.current_edit_bone.tail.z = child_object.location[2]
+                self.current_edit_bone.tail = child_object.location
             else:
-                self.current_edit_bone.tail.x = mean[0]
-                self.current_edit_bone.tail.y = mean[1]
-                self.current_edit_bone.tail.z = mean[2]
+                self.current_edit_bone.tail = mean
 
             self.queue()
             return
@@ -2631,15 +2489,13 @@ class SpineRootRigger(SpineSectionRigger):
         # if: has multiple children
         # It creates the tail at the mean point, creates the children rigs and
         # it parents the results without connecting the bones
-        self.current_edit_bone.tail.x = mean[0]
-        self.current_edit_bone.tail.y = mean[1]
-        self.current_edit_bone.tail.z = mean[2]
+        self.current_edit_bone.tail = mean
 
         same_type_children = []
+        factory: RiggerFactoryBase = self.rigger_factory
+        current_edit_bone = self.current_edit_bone
         for linked_child in self.linked_object.children:
             child_object: BoxmanDTO = linked_child
-
-            factory: RiggerFactoryBase = self.rigger_factory
             child_rigger = factory.create_rigger(child_object, self)
             if isinstance(child_rigger, SpineRiggerBase):
                 child_rigger.control_bone = self.control_bone
@@ -2648,19 +2504,17 @@ class SpineRootRigger(SpineSectionRigger):
             child_rigger.rig(context)
             child_bone = child_rigger.current_edit_bone
             if child_bone is not None:  # there might be boneless riggers
-                child_bone.parent = self.current_edit_bone
+                child_bone.parent = current_edit_bone
                 child_bone.use_connect = False
 
         # If it has only ONE child of type finger, it uses the connect
         if len(same_type_children) == 1:
             child_rigger = same_type_children[0]
             child_rigger.current_edit_bone.use_connect = True
-            self.current_edit_bone.tail.x = child_rigger.linked_object.location[0]
-            self.current_edit_bone.tail.y = child_rigger.linked_object.location[1]
-            self.current_edit_bone.tail.z = child_rigger.linked_object.location[2]
+            self.current_edit_bone.tail = child_rigger.linked_object.location
 
         self.queue()
-        print(f"Generated root spine rig for {self.linked_object.properties.name}!")
+        logger.debug("Generated root spine rig for %s!", self.linked_object.properties.name)
 
     def queue(self) -> None:
         """
@@ -2673,8 +2527,8 @@ class SpineRootRigger(SpineSectionRigger):
         self.queue_hide_current_bone()
         self.queue_create_rotation_constraint()
         self.queue_create_location_constraint()
-        self.queue_add_bone_to_group(BoxmanExtremityTypes.SPINE.value, self.current_edit_bone.name)
-        self.queue_add_bone_to_group(BoxmanExtremityTypes.SPINE.value, self.control_bone.name)
+        self.queue_add_bone_to_group(_EXTREMITY_SPINE, self.current_edit_bone.name)
+        self.queue_add_bone_to_group(_EXTREMITY_SPINE, self.control_bone.name)
         self.queue_add_bone_to_layers([RiggerBase.GLOBAL_LAYER_INDEX,
                                        RiggerBase.SPINE_LAYER_INDEX],
                                       self.current_edit_bone.name)
@@ -2683,8 +2537,7 @@ class SpineRootRigger(SpineSectionRigger):
                                        RiggerBase.CONTROL_LAYER_INDEX,
                                        RiggerBase.SPINE_LAYER_INDEX],
                                       self.control_bone.name)
-        self.queue_link_mesh_to_collection(self.get_mesh_object_collection_name())
-        self.queue_unlink_mesh_from_collection()
+        self.queue_move_mesh_to_collection(self.get_mesh_object_collection_name())
 
     @staticmethod
     def get_control_shape_name(armature_name, linked_name) -> str:
@@ -2705,15 +2558,10 @@ class SpineRootRigger(SpineSectionRigger):
         linked_vertex_array = self.linked_object.vertex_list
         armature_name = self.armature_object_name
         self.stored_mesh_creation_fixture.append(
-            lambda context: self.create_proportion_control_shape(context,
-                                                                 linked_name,
-                                                                 linked_location,
-                                                                 linked_vertex_array,
-                                                                 armature_name)
+            (self.create_proportion_control_shape, (linked_name, linked_location, linked_vertex_array, armature_name))
         )
         control_name = self.get_control_shape_name(armature_name, linked_name)
-        self.queue_link_mesh_to_collection(self.get_control_mesh_collection_name(), control_name)
-        self.queue_unlink_mesh_from_collection(mesh_name=control_name)
+        self.queue_move_mesh_to_collection(self.get_control_mesh_collection_name(), control_name)
 
     @staticmethod
     def create_proportion_control_shape(context,
@@ -2725,7 +2573,7 @@ class SpineRootRigger(SpineSectionRigger):
         Adds a control for each type of required render.
         """
         # adds the proportional cube
-        print(f"Adding {BoxmanRigControl.SPINE_CONTROL_SUFFIX} control shape...")
+        logger.debug("Adding %s control shape...", BoxmanRigControl.SPINE_CONTROL_SUFFIX)
         control_name = SpineRootRigger.get_control_shape_name(armature_name, linked_name)
         ring_data = BoxmanRigControlFactory.get_unit_cube(control_name)
         ring_data.scale_to_boxman(linked_vertex_array)
@@ -2741,7 +2589,7 @@ class SpineRootRigger(SpineSectionRigger):
         armature_name = self.armature_object_name
         linked_name = self.linked_object.get_object_name()
         self.stored_mesh_creation_fixture.append(
-            lambda context: self.hide_template_mesh(context, armature_name, linked_name)
+            (self.hide_template_mesh, (armature_name, linked_name))
         )
 
     @staticmethod
@@ -2750,10 +2598,11 @@ class SpineRootRigger(SpineSectionRigger):
         Hides all created control meshes
         """
         # TODO: Add the other control shapes and make it into a factory class, this is terrible!
-        print(f"Hiding {BoxmanRigControl.SPINE_CONTROL_SUFFIX} control shape...")
+        logger.debug("Hiding %s control shape...", BoxmanRigControl.SPINE_CONTROL_SUFFIX)
         spine_name = SpineRootRigger.get_control_shape_name(armature_name, linked_name)
-        bpy.data.objects[spine_name].hide_viewport = True
-        bpy.data.objects[spine_name].hide_render = True
+        shape_object = bpy.data.objects[spine_name]
+        shape_object.hide_viewport = True
+        shape_object.hide_render = True
 
     def queue_attach_shape_to_control(self) -> None:
         """
@@ -2763,7 +2612,7 @@ class SpineRootRigger(SpineSectionRigger):
         armature_name = self.armature_object_name
         linked_name = self.linked_object.get_object_name()
         self.stored_control_creation_fixture.append(
-            lambda context: self.attach_shape_to_control(context, control_bone_name, armature_name, linked_name)
+            (self.attach_shape_to_control, (control_bone_name, armature_name, linked_name))
         )
 
     @staticmethod
@@ -2771,10 +2620,11 @@ class SpineRootRigger(SpineSectionRigger):
         """
         Creates a roll control of half a typical size
         """
-        print(f"Attaching default ring control to {control_bone_name}...")
+        logger.debug("Attaching default ring control to %s...", control_bone_name)
         spine_name = SpineRootRigger.get_control_shape_name(armature_name, linked_name)
-        bpy.data.objects[armature_name].pose.bones[control_bone_name].custom_shape = bpy.data.objects[spine_name]
-        bpy.data.objects[armature_name].pose.bones[control_bone_name].custom_shape_scale = 1.0
+        shape_bone = get_pose_bones(armature_name)[control_bone_name]
+        shape_bone.custom_shape = bpy.data.objects[spine_name]
+        shape_bone.custom_shape_scale = 1.0
 
     def queue_create_location_constraint(self) -> None:
         """
@@ -2785,8 +2635,7 @@ class SpineRootRigger(SpineSectionRigger):
         armature_name = self.armature_object_name
 
         self.stored_control_creation_fixture.append(
-            lambda context: self.create_location_constraint(context, current_bone_name,
-                                                            current_bone_control_name, armature_name)
+            (self.create_location_constraint, (current_bone_name, current_bone_control_name, armature_name))
             )
 
     @staticmethod
@@ -2795,9 +2644,9 @@ class SpineRootRigger(SpineSectionRigger):
         """
         Creates a constraint that make the original bone follow the control
         """
-        print(f"Attaching chain rotation control to {current_bone_name}...")
-        armature = bpy.data.objects[armature_name]
-        current_bone = bpy.data.objects[armature_name].pose.bones[current_bone_name]
+        logger.debug("Attaching chain rotation control to %s...", current_bone_name)
+        armature = get_armature_object(armature_name)
+        current_bone = get_pose_bones(armature_name)[current_bone_name]
         constraint = current_bone.constraints.new("COPY_LOCATION")
         constraint.target = armature
         constraint.subtarget = current_bone_control_name
@@ -2812,6 +2661,8 @@ class NeckRiggerBase(DefaultRigger):
     """
     Base rigger for the spine elements
     """
+    __slots__ = ()
+
     def __init__(self, linked_object: BoxmanDTO, parent_rigger=None):
         super().__init__(linked_object, parent_rigger)
         self.control_bone = None
@@ -2833,9 +2684,8 @@ class NeckRiggerBase(DefaultRigger):
             influence_factor_const = influence_factor
 
             self.stored_control_creation_fixture.append(
-                lambda context: self.create_rotation_constraint(context, current_bone_name,
-                                                                current_bone_control_name, armature_name,
-                                                                influence_factor_const)
+                (self.create_rotation_constraint, (current_bone_name, current_bone_control_name, armature_name,
+                                                   influence_factor_const))
             )
 
     @staticmethod
@@ -2844,9 +2694,9 @@ class NeckRiggerBase(DefaultRigger):
         """
         Creates a constraint of same rotation over the control and hides the
         """
-        print(f"Attaching chain rotation control to {current_bone_name}...")
-        armature = bpy.data.objects[armature_name]
-        current_bone = bpy.data.objects[armature_name].pose.bones[current_bone_name]
+        logger.debug("Attaching chain rotation control to %s...", current_bone_name)
+        armature = get_armature_object(armature_name)
+        current_bone = get_pose_bones(armature_name)[current_bone_name]
         constraint = current_bone.constraints.new("COPY_ROTATION")
         constraint.target = armature
         constraint.subtarget = current_bone_control_name
@@ -2860,6 +2710,7 @@ class NeckSectionRigger(NeckRiggerBase):
     """
     It creates a control chain with half additive rotations on a control if inherited.
     """
+    __slots__ = ()
 
     def __init__(self, linked_object: BoxmanDTO, parent_rigger=None):
         super().__init__(linked_object, parent_rigger)
@@ -2869,25 +2720,18 @@ class NeckSectionRigger(NeckRiggerBase):
         Handles the creation of children bones the same way a default rigger do,
         except that the bones arent hidden
         """
-        print(f"Generating neck rig for {self.linked_object.properties.name}.")
+        logger.debug("Generating neck rig for %s.", self.linked_object.properties.name)
 
-        bpy.ops.armature.bone_primitive_add()
-        bpy.ops.armature.select_linked()
-        newly_created = bpy.context.selected_bones
-        self.current_edit_bone = newly_created[0]
+        self.current_edit_bone = self.add_edit_bone()
 
-        self.current_edit_bone.head.x = self.linked_object.location[0]
-        self.current_edit_bone.head.y = self.linked_object.location[1]
-        self.current_edit_bone.head.z = self.linked_object.location[2]
+        self.current_edit_bone.head = self.linked_object.location
         self.current_edit_bone.name = self.linked_object.get_object_name()
 
         # there ere 3 possibilities
         mean = self.get_mesh_mean_point()
         # if: it's end of a chain
         if len(self.linked_object.children) == 0:
-            self.current_edit_bone.tail.x = mean[0]
-            self.current_edit_bone.tail.y = mean[1]
-            self.current_edit_bone.tail.z = mean[2]
+            self.current_edit_bone.tail = mean
 
             self.queue()
             return  # its end of a link
@@ -2908,13 +2752,9 @@ class NeckSectionRigger(NeckRiggerBase):
             if child_bone is not None:  # there might be boneless riggers
                 child_bone.parent = self.current_edit_bone
                 child_bone.use_connect = True  # this is only valid for the root bone
-                self.current_edit_bone.tail.x = child_object.location[0]
-                self.current_edit_bone.tail.y = child_object.location[1]
-                self.current_edit_bone.tail.z = child_object.location[2]
+                self.current_edit_bone.tail = child_object.location
             else:
-                self.current_edit_bone.tail.x = mean[0]
-                self.current_edit_bone.tail.y = mean[1]
-                self.current_edit_bone.tail.z = mean[2]
+                self.current_edit_bone.tail = mean
 
             self.queue()
             return
@@ -2922,15 +2762,13 @@ class NeckSectionRigger(NeckRiggerBase):
         # if: has multiple children
         # It creates the tail at the mean point, creates the children rigs and
         # it parents the results without connecting the bones
-        self.current_edit_bone.tail.x = mean[0]
-        self.current_edit_bone.tail.y = mean[1]
-        self.current_edit_bone.tail.z = mean[2]
+        self.current_edit_bone.tail = mean
 
         same_type_children = []
+        factory: RiggerFactoryBase = self.rigger_factory
+        current_edit_bone = self.current_edit_bone
         for linked_child in self.linked_object.children:
             child_object: BoxmanDTO = linked_child
-
-            factory: RiggerFactoryBase = self.rigger_factory
             child_rigger = factory.create_rigger(child_object, self)
             if isinstance(child_rigger, NeckRiggerBase):
                 child_rigger.control_bone = self.control_bone
@@ -2939,19 +2777,17 @@ class NeckSectionRigger(NeckRiggerBase):
             child_rigger.rig(context)
             child_bone = child_rigger.current_edit_bone
             if child_bone is not None:  # there might be boneless riggers
-                child_bone.parent = self.current_edit_bone
+                child_bone.parent = current_edit_bone
                 child_bone.use_connect = False
 
         # If it has only ONE child of type finger, it uses the connect
         if len(same_type_children) == 1:
             child_rigger = same_type_children[0]
             child_rigger.current_edit_bone.use_connect = True
-            self.current_edit_bone.tail.x = child_rigger.linked_object.location[0]
-            self.current_edit_bone.tail.y = child_rigger.linked_object.location[1]
-            self.current_edit_bone.tail.z = child_rigger.linked_object.location[2]
+            self.current_edit_bone.tail = child_rigger.linked_object.location
 
         self.queue()
-        print(f"Generated neck rig for {self.linked_object.properties.name}!")
+        logger.debug("Generated neck rig for %s!", self.linked_object.properties.name)
 
     def queue(self) -> None:
         """
@@ -2960,12 +2796,11 @@ class NeckSectionRigger(NeckRiggerBase):
         self.queue_parent_object_to_rig()
         self.queue_attach_default_shape()
         self.queue_create_rotation_constraint()
-        self.queue_add_bone_to_group(BoxmanExtremityTypes.HEAD.value, self.current_edit_bone.name)
+        self.queue_add_bone_to_group(_EXTREMITY_HEAD, self.current_edit_bone.name)
         self.queue_add_bone_to_layers([RiggerBase.GLOBAL_LAYER_INDEX,
                                        RiggerBase.HEAD_LAYER_INDEX],
                                       self.current_edit_bone.name)
-        self.queue_link_mesh_to_collection(self.get_mesh_object_collection_name())
-        self.queue_unlink_mesh_from_collection()
+        self.queue_move_mesh_to_collection(self.get_mesh_object_collection_name())
 
 
 class NeckRootRigger(NeckSectionRigger):
@@ -2973,6 +2808,8 @@ class NeckRootRigger(NeckSectionRigger):
     The spine root creates an invisible bone and a control box related with the typical size.
     It the bone is connected to the control that manipulates the rotations of the resulting elements
     """
+    __slots__ = ()
+
     def __init__(self, linked_object: BoxmanDTO, parent_rigger=None):
         super().__init__(linked_object, parent_rigger)
 
@@ -2981,31 +2818,21 @@ class NeckRootRigger(NeckSectionRigger):
         Creates a rig similar to the default, but attaching a control bone that will apply a copy rotations and
         transpose located at the root
         """
-        print(f"Generating root neck rig for {self.linked_object.properties.name}.")
+        logger.debug("Generating root neck rig for %s.", self.linked_object.properties.name)
 
-        bpy.ops.armature.bone_primitive_add()
-        bpy.ops.armature.select_linked()
-        newly_created = bpy.context.selected_bones
-        self.current_edit_bone = newly_created[0]
+        self.current_edit_bone = self.add_edit_bone()
 
-        bpy.ops.armature.bone_primitive_add()
-        bpy.ops.armature.select_linked()
-        newly_created = bpy.context.selected_bones
-        self.control_bone = newly_created[0]
+        self.control_bone = self.add_edit_bone()
 
-        self.current_edit_bone.head.x = self.linked_object.location[0]
-        self.current_edit_bone.head.y = self.linked_object.location[1]
-        self.current_edit_bone.head.z = self.linked_object.location[2]
+        self.current_edit_bone.head = self.linked_object.location
         self.current_edit_bone.name = self.linked_object.get_object_name()
 
         typical = self.get_typical_size()
-        self.control_bone.head.x = self.current_edit_bone.head.x
-        self.control_bone.head.y = self.current_edit_bone.head.y
-        self.control_bone.head.z = self.current_edit_bone.head.z
+        self.control_bone.head = self.current_edit_bone.head
         # positioned with
-        self.control_bone.tail.x = self.control_bone.head.x
-        self.control_bone.tail.y = self.control_bone.head.y + 1.0 # use absolute units?
-        self.control_bone.tail.z = self.control_bone.head.z
+        self.control_bone.tail = (self.control_bone.head.x,
+                                  self.control_bone.head.y + 1.0,  # use absolute units?
+                                  self.control_bone.head.z)
         # parented to the absolute root
         self.control_bone.name = f"{self.current_edit_bone.name}_{BoxmanRigControl.DEFAULT_CONTROL_SUFFIX}"
         self.control_bone.parent = self.parent_rigger.current_edit_bone
@@ -3015,9 +2842,7 @@ class NeckRootRigger(NeckSectionRigger):
         mean = self.get_mesh_mean_point()
         # if: it's end of a chain
         if len(self.linked_object.children) == 0:
-            self.current_edit_bone.tail.x = mean[0]
-            self.current_edit_bone.tail.y = mean[1]
-            self.current_edit_bone.tail.z = mean[2]
+            self.current_edit_bone.tail = mean
 
             self.queue()
             return  # its end of a link
@@ -3038,13 +2863,9 @@ class NeckRootRigger(NeckSectionRigger):
             if child_bone is not None:  # there might be boneless riggers
                 child_bone.parent = self.current_edit_bone
                 child_bone.use_connect = True  # this is only valid for the root bone
-                self.current_edit_bone.tail.x = child_object.location[0]
-                self.current_edit_bone.tail.y = child_object.location[1]
-                self.current_edit_bone.tail.z = child_object.location[2]
+                self.current_edit_bone.tail = child_object.location
             else:
-                self.current_edit_bone.tail.x = mean[0]
-                self.current_edit_bone.tail.y = mean[1]
-                self.current_edit_bone.tail.z = mean[2]
+                self.current_edit_bone.tail = mean
 
             self.queue()
             return
@@ -3052,15 +2873,13 @@ class NeckRootRigger(NeckSectionRigger):
         # if: has multiple children
         # It creates the tail at the mean point, creates the children rigs and
         # it parents the results without connecting the bones
-        self.current_edit_bone.tail.x = mean[0]
-        self.current_edit_bone.tail.y = mean[1]
-        self.current_edit_bone.tail.z = mean[2]
+        self.current_edit_bone.tail = mean
 
         same_type_children = []
+        factory: RiggerFactoryBase = self.rigger_factory
+        current_edit_bone = self.current_edit_bone
         for linked_child in self.linked_object.children:
             child_object: BoxmanDTO = linked_child
-
-            factory: RiggerFactoryBase = self.rigger_factory
             child_rigger = factory.create_rigger(child_object, self)
             if isinstance(child_rigger, NeckRiggerBase):
                 child_rigger.control_bone = self.control_bone
@@ -3069,19 +2888,17 @@ class NeckRootRigger(NeckSectionRigger):
             child_rigger.rig(context)
             child_bone = child_rigger.current_edit_bone
             if child_bone is not None:  # there might be boneless riggers
-                child_bone.parent = self.current_edit_bone
+                child_bone.parent = current_edit_bone
                 child_bone.use_connect = False
 
         # If it has only ONE child of type finger, it uses the connect
         if len(same_type_children) == 1:
             child_rigger = same_type_children[0]
             child_rigger.current_edit_bone.use_connect = True
-            self.current_edit_bone.tail.x = child_rigger.linked_object.location[0]
-            self.current_edit_bone.tail.y = child_rigger.linked_object.location[1]
-            self.current_edit_bone.tail.z = child_rigger.linked_object.location[2]
+            self.current_edit_bone.tail = child_rigger.linked_object.location
 
         self.queue()
-        print(f"Generated root neck rig for {self.linked_object.properties.name}!")
+        logger.debug("Generated root neck rig for %s!", self.linked_object.properties.name)
 
     def queue(self) -> None:
         """
@@ -3094,8 +2911,8 @@ class NeckRootRigger(NeckSectionRigger):
         self.queue_hide_current_bone()
         self.queue_create_rotation_constraint()
         self.queue_create_location_constraint()
-        self.queue_add_bone_to_group(BoxmanExtremityTypes.HEAD.value, self.current_edit_bone.name)
-        self.queue_add_bone_to_group(BoxmanExtremityTypes.HEAD.value, self.control_bone.name)
+        self.queue_add_bone_to_group(_EXTREMITY_HEAD, self.current_edit_bone.name)
+        self.queue_add_bone_to_group(_EXTREMITY_HEAD, self.control_bone.name)
         self.queue_add_bone_to_layers([RiggerBase.GLOBAL_LAYER_INDEX,
                                        RiggerBase.HEAD_LAYER_INDEX],
                                       self.current_edit_bone.name)
@@ -3104,8 +2921,7 @@ class NeckRootRigger(NeckSectionRigger):
                                        RiggerBase.MAYORS_LAYER_INDEX,
                                        RiggerBase.CONTROL_LAYER_INDEX],
                                       self.control_bone.name)
-        self.queue_link_mesh_to_collection(self.get_mesh_object_collection_name())
-        self.queue_unlink_mesh_from_collection()
+        self.queue_move_mesh_to_collection(self.get_mesh_object_collection_name())
 
     @staticmethod
     def get_control_shape_name(armature_name, linked_name) -> str:
@@ -3125,15 +2941,10 @@ class NeckRootRigger(NeckSectionRigger):
         linked_vertex_array = self.linked_object.vertex_list
         armature_name = self.armature_object_name
         self.stored_mesh_creation_fixture.append(
-            lambda context: self.create_proportion_control_shape(context,
-                                                                 linked_name,
-                                                                 linked_location,
-                                                                 linked_vertex_array,
-                                                                 armature_name)
+            (self.create_proportion_control_shape, (linked_name, linked_location, linked_vertex_array, armature_name))
         )
         control_name = self.get_control_shape_name(armature_name, linked_name)
-        self.queue_link_mesh_to_collection(self.get_control_mesh_collection_name(), control_name)
-        self.queue_unlink_mesh_from_collection(mesh_name=control_name)
+        self.queue_move_mesh_to_collection(self.get_control_mesh_collection_name(), control_name)
 
     @staticmethod
     def create_proportion_control_shape(context,
@@ -3145,7 +2956,7 @@ class NeckRootRigger(NeckSectionRigger):
         Adds a control for each type of required render.
         """
         # adds the proportional cube
-        print(f"Adding {BoxmanRigControl.NECK_CONTROL_SUFFIX} control shape...")
+        logger.debug("Adding %s control shape...", BoxmanRigControl.NECK_CONTROL_SUFFIX)
         name = NeckRootRigger.get_control_shape_name(armature_name, linked_name)
         ring_data = BoxmanRigControlFactory.get_unit_cube(name)
         ring_data.scale_to_boxman(linked_vertex_array)
@@ -3161,7 +2972,7 @@ class NeckRootRigger(NeckSectionRigger):
         armature_name = self.armature_object_name
         linked_name = self.linked_object.properties.name
         self.stored_mesh_creation_fixture.append(
-            lambda context: self.hide_template_mesh(context, armature_name, linked_name)
+            (self.hide_template_mesh, (armature_name, linked_name))
         )
 
     @staticmethod
@@ -3170,10 +2981,11 @@ class NeckRootRigger(NeckSectionRigger):
         Hides all created control meshes
         """
         # TODO: Add the other control shapes and make it into a factory class, this is terrible!
-        print(f"Hiding {BoxmanRigControl.SPINE_CONTROL_SUFFIX} control shape...")
+        logger.debug("Hiding %s control shape...", BoxmanRigControl.SPINE_CONTROL_SUFFIX)
         spine_name = NeckRootRigger.get_control_shape_name(armature_name, linked_name)
-        bpy.data.objects[spine_name].hide_viewport = True
-        bpy.data.objects[spine_name].hide_render = True
+        shape_object = bpy.data.objects[spine_name]
+        shape_object.hide_viewport = True
+        shape_object.hide_render = True
 
     def queue_attach_shape_to_control(self) -> None:
         """
@@ -3183,7 +2995,7 @@ class NeckRootRigger(NeckSectionRigger):
         armature_name = self.armature_object_name
         linked_name = self.linked_object.properties.name
         self.stored_control_creation_fixture.append(
-            lambda context: self.attach_shape_to_control(context, control_bone_name, armature_name, linked_name)
+            (self.attach_shape_to_control, (control_bone_name, armature_name, linked_name))
         )
 
     @staticmethod
@@ -3191,10 +3003,11 @@ class NeckRootRigger(NeckSectionRigger):
         """
         Creates a roll control of half a typical size
         """
-        print(f"Attaching default ring control to {control_bone_name}...")
+        logger.debug("Attaching default ring control to %s...", control_bone_name)
         name = NeckRootRigger.get_control_shape_name(armature_name, linked_name)
-        bpy.data.objects[armature_name].pose.bones[control_bone_name].custom_shape = bpy.data.objects[name]
-        bpy.data.objects[armature_name].pose.bones[control_bone_name].custom_shape_scale = 1.0
+        shape_bone = get_pose_bones(armature_name)[control_bone_name]
+        shape_bone.custom_shape = bpy.data.objects[name]
+        shape_bone.custom_shape_scale = 1.0
 
     def queue_create_location_constraint(self) -> None:
         """
@@ -3205,8 +3018,7 @@ class NeckRootRigger(NeckSectionRigger):
         armature_name = self.armature_object_name
 
         self.stored_control_creation_fixture.append(
-            lambda context: self.create_location_constraint(context, current_bone_name,
-                                                            current_bone_control_name, armature_name)
+            (self.create_location_constraint, (current_bone_name, current_bone_control_name, armature_name))
             )
 
     @staticmethod
@@ -3215,9 +3027,9 @@ class NeckRootRigger(NeckSectionRigger):
         """
         Creates a constraint the makes the control bone follow the original bone
         """
-        print(f"Attaching chain rotation control to {current_bone_name}...")
-        armature = bpy.data.objects[armature_name]
-        current_bone = bpy.data.objects[armature_name].pose.bones[current_bone_name]
+        logger.debug("Attaching chain rotation control to %s...", current_bone_name)
+        armature = get_armature_object(armature_name)
+        current_bone = get_pose_bones(armature_name)[current_bone_name]
         constraint = current_bone.constraints.new("COPY_LOCATION")
         constraint.target = armature
         constraint.subtarget = current_bone_control_name
@@ -3228,6 +3040,7 @@ class HeadRigger(NeckRootRigger):
     This uses some of the methods of the spine to create a hidden control that uses a bounding box, the original bone is
     centered to the mesh regardless of children
     """
+    __slots__ = ()
 
     def __init__(self, linked_object: BoxmanDTO, parent_rigger=None):
         super().__init__(linked_object, parent_rigger)
@@ -3237,31 +3050,21 @@ class HeadRigger(NeckRootRigger):
         Creates a conventional rig, tail always centered, with an additional control to tell the
         """
 
-        print(f"Generating root spine rig for {self.linked_object.properties.name}.")
+        logger.debug("Generating root spine rig for %s.", self.linked_object.properties.name)
 
-        bpy.ops.armature.bone_primitive_add()
-        bpy.ops.armature.select_linked()
-        newly_created = bpy.context.selected_bones
-        self.current_edit_bone = newly_created[0]
+        self.current_edit_bone = self.add_edit_bone()
 
-        bpy.ops.armature.bone_primitive_add()
-        bpy.ops.armature.select_linked()
-        newly_created = bpy.context.selected_bones
-        self.control_bone = newly_created[0]
+        self.control_bone = self.add_edit_bone()
 
-        self.current_edit_bone.head.x = self.linked_object.location[0]
-        self.current_edit_bone.head.y = self.linked_object.location[1]
-        self.current_edit_bone.head.z = self.linked_object.location[2]
+        self.current_edit_bone.head = self.linked_object.location
         self.current_edit_bone.name = self.linked_object.get_object_name()
 
         typical = self.get_typical_size()
-        self.control_bone.head.x = self.current_edit_bone.head.x
-        self.control_bone.head.y = self.current_edit_bone.head.y
-        self.control_bone.head.z = self.current_edit_bone.head.z
+        self.control_bone.head = self.current_edit_bone.head
         # positioned with
-        self.control_bone.tail.x = self.control_bone.head.x
-        self.control_bone.tail.y = self.control_bone.head.y + 1.0 # use absolute units?
-        self.control_bone.tail.z = self.control_bone.head.z
+        self.control_bone.tail = (self.control_bone.head.x,
+                                  self.control_bone.head.y + 1.0,  # use absolute units?
+                                  self.control_bone.head.z)
         # parented to the absolute root
         self.control_bone.name = f"{self.current_edit_bone.name}_{BoxmanRigControl.DEFAULT_CONTROL_SUFFIX}"
         self.control_bone.parent = self.parent_rigger.current_edit_bone
@@ -3269,23 +3072,21 @@ class HeadRigger(NeckRootRigger):
 
         mean = self.get_mesh_mean_point()
 
-        self.current_edit_bone.tail.x = mean[0]
-        self.current_edit_bone.tail.y = mean[1]
-        self.current_edit_bone.tail.z = mean[2]
+        self.current_edit_bone.tail = mean
 
+        factory: RiggerFactoryBase = self.rigger_factory
+        current_edit_bone = self.current_edit_bone
         for linked_child in self.linked_object.children:
             child_object: BoxmanDTO = linked_child
-
-            factory: RiggerFactoryBase = self.rigger_factory
             child_rigger = factory.create_rigger(child_object, self)
             child_rigger.rig(context)
             child_bone = child_rigger.current_edit_bone
             if child_bone is not None:  # there might be boneless riggers
-                child_bone.parent = self.current_edit_bone
+                child_bone.parent = current_edit_bone
                 child_bone.use_connect = False
 
         self.queue() # same bone layers
-        print(f"Generated root spine rig for {self.linked_object.properties.name}!")
+        logger.debug("Generated root spine rig for %s!", self.linked_object.properties.name)
 
 # endregion
 
@@ -3296,6 +3097,9 @@ class ChainRiggerBase(DefaultRigger):
     """
     Base rigger for tentacles
     """
+    # no slots on the chain riggers, the segment rigger also inherits the IK control slots and python can not
+    # lay out two bases that add slots of their own
+
     def __init__(self, linked_object: BoxmanDTO, parent_rigger=None):
         super().__init__(linked_object, parent_rigger)
         self.chain_length = 0
@@ -3337,17 +3141,12 @@ class ChainSegmentRigger(IkControlRigger, ChainRiggerBase):
         """
         This class riggs similar to the default, but the chain is determined by its only possible children.
         """
-        print(f"Generating chain segment rig for {self.linked_object.properties.name}...")
+        logger.debug("Generating chain segment rig for %s...", self.linked_object.properties.name)
         self.verify_chain()
 
         # We create the bone as in the default scenario
-        bpy.ops.armature.bone_primitive_add()
-        bpy.ops.armature.select_linked()
-        newly_created = bpy.context.selected_bones
-        self.current_edit_bone = newly_created[0]
-        self.current_edit_bone.head.x = self.linked_object.location[0]
-        self.current_edit_bone.head.y = self.linked_object.location[1]
-        self.current_edit_bone.head.z = self.linked_object.location[2]
+        self.current_edit_bone = self.add_edit_bone()
+        self.current_edit_bone.head = self.linked_object.location
         self.current_edit_bone.name = self.linked_object.get_object_name()
 
         # there are many options
@@ -3365,16 +3164,12 @@ class ChainSegmentRigger(IkControlRigger, ChainRiggerBase):
             child_bone.parent = self.current_edit_bone
             child_bone.use_connect = True  # it connects to the children
 
-            self.current_edit_bone.tail.x = child_object.location[0]
-            self.current_edit_bone.tail.y = child_object.location[1]
-            self.current_edit_bone.tail.z = child_object.location[2]
+            self.current_edit_bone.tail = child_object.location
         else:
             # If the chain ends here for the tentacles, I need to create a control at the center, of the mesh
             # and create the IK constraint
             mean = self.get_mesh_mean_point()
-            self.current_edit_bone.tail.x = mean[0]
-            self.current_edit_bone.tail.y = mean[1]
-            self.current_edit_bone.tail.z = mean[2]
+            self.current_edit_bone.tail = mean
             self.create_control_bone(False)
             self.queue_create_ik_constraint(chain_length=self.chain_length)
 
@@ -3389,22 +3184,21 @@ class ChainSegmentRigger(IkControlRigger, ChainRiggerBase):
                 child_bone.use_connect = False
 
         self.queue_parent_object_to_rig()  # this is the same
-        self.queue_add_bone_to_group(BoxmanExtremityTypes.CHAIN.value, self.current_edit_bone.name)
+        self.queue_add_bone_to_group(_EXTREMITY_CHAIN, self.current_edit_bone.name)
         self.queue_add_bone_to_layers([RiggerBase.GLOBAL_LAYER_INDEX,
                                        RiggerBase.MINORS_LAYER_INDEX,
                                        RiggerBase.CHAIN_LAYER_INDEX],
                                       self.current_edit_bone.name)
         if self.control_bone is not None:
-            self.queue_add_bone_to_group(BoxmanExtremityTypes.CHAIN.value, self.control_bone.name)
+            self.queue_add_bone_to_group(_EXTREMITY_CHAIN, self.control_bone.name)
             self.queue_add_bone_to_layers([RiggerBase.GLOBAL_LAYER_INDEX,
                                            RiggerBase.MAYORS_LAYER_INDEX,
                                            RiggerBase.CONTROL_LAYER_INDEX,
                                            RiggerBase.CHAIN_LAYER_INDEX],
                                           self.control_bone.name)
 
-        self.queue_link_mesh_to_collection(self.get_mesh_object_collection_name())
-        self.queue_unlink_mesh_from_collection()
-        print(f"Generated chain segment rig for {self.linked_object.properties.name}!")
+        self.queue_move_mesh_to_collection(self.get_mesh_object_collection_name())
+        logger.debug("Generated chain segment rig for %s!", self.linked_object.properties.name)
 
 
 class ChainRootRigger(ChainRiggerBase):
@@ -3438,17 +3232,12 @@ class ChainRootRigger(ChainRiggerBase):
         """
         This class riggs similar to the default, but the chain is determined by its only possible children.
         """
-        print(f"Generating root chain rig for {self.linked_object.properties.name}...")
+        logger.debug("Generating root chain rig for %s...", self.linked_object.properties.name)
         self.verify_chain()
 
         # We create the bone as in the default scenario
-        bpy.ops.armature.bone_primitive_add()
-        bpy.ops.armature.select_linked()
-        newly_created = bpy.context.selected_bones
-        self.current_edit_bone = newly_created[0]
-        self.current_edit_bone.head.x = self.linked_object.location[0]
-        self.current_edit_bone.head.y = self.linked_object.location[1]
-        self.current_edit_bone.head.z = self.linked_object.location[2]
+        self.current_edit_bone = self.add_edit_bone()
+        self.current_edit_bone.head = self.linked_object.location
         self.current_edit_bone.name = self.linked_object.get_object_name()
 
         # If the child is only one, the target of the tail is the position of the next member of the chain
@@ -3463,9 +3252,7 @@ class ChainRootRigger(ChainRiggerBase):
         child_bone.parent = self.current_edit_bone
         child_bone.use_connect = True  # it connects to the children
 
-        self.current_edit_bone.tail.x = child_object.location[0]
-        self.current_edit_bone.tail.y = child_object.location[1]
-        self.current_edit_bone.tail.z = child_object.location[2]
+        self.current_edit_bone.tail = child_object.location
 
         # then we handle the non mandatory children
         for child in self.non_mandatory:
@@ -3478,14 +3265,13 @@ class ChainRootRigger(ChainRiggerBase):
                 child_bone.use_connect = False
 
         self.queue_parent_object_to_rig()  # this is the same
-        self.queue_add_bone_to_group(BoxmanExtremityTypes.CHAIN.value, self.current_edit_bone.name)
+        self.queue_add_bone_to_group(_EXTREMITY_CHAIN, self.current_edit_bone.name)
         self.queue_add_bone_to_layers([RiggerBase.GLOBAL_LAYER_INDEX,
                                        RiggerBase.MAYORS_LAYER_INDEX,
                                        RiggerBase.CHAIN_LAYER_INDEX],
                                       self.current_edit_bone.name)
-        self.queue_link_mesh_to_collection(self.get_mesh_object_collection_name())
-        self.queue_unlink_mesh_from_collection()
-        print(f"Generated root chain rig for {self.linked_object.properties.name}!")
+        self.queue_move_mesh_to_collection(self.get_mesh_object_collection_name())
+        logger.debug("Generated root chain rig for %s!", self.linked_object.properties.name)
 
 # endregion
 
@@ -3647,7 +3433,7 @@ class RigTypeFactory(RiggerFactoryBase):
 
         # If not in the list, its a default
         element: RiggerBase
-        if selected_object.properties.joint_type not in self.type_dictionary.keys():
+        if selected_object.properties.joint_type not in self.type_dictionary:
             raise NotImplementedError()
 
         if parent_rigger is not None:
@@ -3664,6 +3450,46 @@ class RigTypeFactory(RiggerFactoryBase):
         return element
 
 
+# armature objects and pose bones resolved by name while a fixture is executed, the whole pass runs
+# in a single mode, so the references stay valid until the pass ends
+_fixture_armatures = {}
+_fixture_pose_bones = {}
+
+
+def get_armature_object(armature_name: str):
+    """
+    Gets an armature object by name, it is looked up in the blend data once per fixture pass
+    """
+    armature = _fixture_armatures.get(armature_name)
+    if armature is None:
+        armature = _fixture_armatures[armature_name] = bpy.data.objects[armature_name]
+    return armature
+
+
+def get_pose_bones(armature_name: str):
+    """
+    Gets the pose bones of an armature by name, resolved once per fixture pass
+    """
+    pose_bones = _fixture_pose_bones.get(armature_name)
+    if pose_bones is None:
+        pose_bones = _fixture_pose_bones[armature_name] = get_armature_object(armature_name).pose.bones
+    return pose_bones
+
+
+def execute_fixture(context, fixture: list) -> None:
+    """
+    Executes in order the queued (static method, arguments) calls of a rigger fixture and drains it.
+    The fixtures are only appended and walked once, so plain lists are kept instead of deques.
+    """
+    try:
+        for call, arguments in fixture:
+            call(context, *arguments)
+    finally:
+        _fixture_armatures.clear()
+        _fixture_pose_bones.clear()
+    fixture.clear()
+
+
 def auto_rig(context, selected_object: BoxmanDTO) -> None:
     """
     Calls the whole rig presses, executing the fixtures after changing modes several times.
@@ -3671,61 +3497,55 @@ def auto_rig(context, selected_object: BoxmanDTO) -> None:
     rig_factory = RigTypeFactory()
 
     # first create the bones and set the fixture
-    print("Autorig started...")
-    print("Creating bones...")
+    logger.debug("Autorig started...")
+    logger.debug("Creating bones...")
     root_rigger = rig_factory.create_rigger(selected_object)  # dummy argument
     root_rigger.rig(context)
 
     # changing to object mode creates the pose bones
-    print("Changing to OBJECT mode...")
+    logger.debug("Changing to OBJECT mode...")
     bpy.ops.object.mode_set(mode='OBJECT')
     bpy.context.object.name = root_rigger.armature_object_name
     bpy.context.object.show_in_front = True
 
     # Then I make the parenting chain of the meshes to the pose bones
-    print("Bones created!")
-    print("Executing fixtures...")
-    print("Parenting bones...")
-    for item in root_rigger.stored_parenting_fixture:
-        item(context)
-    print("Bones parented!")
+    logger.debug("Bones created!")
+    logger.debug("Executing fixtures...")
+    logger.debug("Parenting bones...")
+    execute_fixture(context, root_rigger.stored_parenting_fixture)
+    logger.debug("Bones parented!")
 
     # Then I create the controls that will replace the meshes in pose mode
-    print("Creating controls...")
-    print("Switching to object mode...")
+    logger.debug("Creating controls...")
+    logger.debug("Switching to object mode...")
     bpy.ops.object.mode_set(mode='OBJECT')
     bpy.ops.object.select_all(action='DESELECT')
-    for item in root_rigger.stored_mesh_creation_fixture:
-        item(context)
-    print("Control meshes created!")
+    execute_fixture(context, root_rigger.stored_mesh_creation_fixture)
+    logger.debug("Control meshes created!")
 
     # then i set active the current armature
     bpy.ops.object.select_all(action='DESELECT')
-    print("Changing to POSE mode...")
+    logger.debug("Changing to POSE mode...")
     armature_object = bpy.data.objects[root_rigger.armature_object_name]
     armature_object.data.display_type = "STICK"
     armature_object.select_set(True)
     bpy.context.view_layer.objects.active = armature_object
     bpy.ops.object.mode_set(mode='POSE')
     bpy.ops.pose.select_all(action='DESELECT')
-    print("Creating controls and constraints...")
-    for item in root_rigger.stored_control_creation_fixture:
-        item(context)
+    logger.debug("Creating controls and constraints...")
+    execute_fixture(context, root_rigger.stored_control_creation_fixture)
 
-    print("Constraints created!")
+    logger.debug("Constraints created!")
     bpy.ops.object.mode_set(mode='OBJECT')
-    print("Grouping objects...")
-    for item in root_rigger.stored_collection_assignments:
-        item(context)
+    logger.debug("Grouping objects...")
+    execute_fixture(context, root_rigger.stored_collection_assignments)
 
-    print(f"Linking Armature to main collection...")
-    armature_object = bpy.data.objects[root_rigger.armature_object_name]
+    logger.debug("Linking Armature to main collection...")
     collection = bpy.data.collections[root_rigger.get_main_collection_name()]
     collection.objects.link(armature_object)
-    scene_collection = bpy.context.scene.collection
-    scene_collection.objects.unlink(armature_object)
+    context.scene.collection.objects.unlink(armature_object)
 
-    print("Objects grouped!")
+    logger.debug("Objects grouped!")
 
 
 